@@ -45,6 +45,8 @@ __all__ = [
     "PolarLocations",
     "Locations",
     "GridLocations",
+    "PrimitiveCache",
+    "primitive_cache",
     "BuildLine",
     "BuildPart",
     "BuildSketch",
@@ -94,6 +96,7 @@ __all__ = [
     "Rot",
     "Pos",
     "RotationLike",
+    "LocationMask",
     "ShapeList",
     "SVG",
     "Axis",
@@ -101,6 +104,7 @@ __all__ = [
     "Curve",
     "Vector",
     "VectorLike",
+    "VectorArray",
     "Vertex",
     "Edge",
     "Wire",
@@ -112,6 +116,9 @@ __all__ = [
     "Plane",
     "Compound",
     "Location",
+    "LocationArray",
+    "TessellationCache",
+    "tessellation_cache",
     "Joint",
     "RigidJoint",
     "RevoluteJoint",
@@ -119,10 +126,16 @@ __all__ = [
     "LinearJoint",
     "CylindricalJoint",
     "BallJoint",
-    # Importer functions
+    # Importers
+    "ImportCache",
+    "StepAssembly",
+    "StlMesh",
     "import_brep",
+    "import_cache",
     "import_step",
+    "import_step_assembly",
     "import_stl",
+    "import_stl_mesh",
     "import_svg",
     "import_svg_as_buildline_code",
     # Other functions
@@ -41,17 +41,29 @@ license:
 from __future__ import annotations
 
 import contextvars
+import copy
 import inspect
 import logging
 import sys
+import threading
 from abc import ABC, abstractmethod
-from itertools import product
+from collections import OrderedDict
 from math import sqrt
 from typing import Callable, Iterable, Union
 from typing_extensions import Self
 
+import numpy as np
+
 from build123d.build_enums import Align, Mode, Select
-from build123d.geometry import Axis, Location, Plane, Vector, VectorLike
+from build123d.geometry import (
+    Axis,
+    Location,
+    LocationArray,
+    Plane,
+    Vector,
+    VectorArray,
+    VectorLike,
+)
 from build123d.topology import (
     Compound,
     Curve,
@@ -91,6 +103,9 @@ IN = 25.4 * MM
 FT = 12 * IN
 THOU = IN / 1000
 
+#:TypeVar("LocationMask"): Selection of the locations of a location pattern
+LocationMask = Union[np.ndarray, Callable[[VectorArray], np.ndarray], Shape, None]
+
 
 operations_apply_to = {
     "add": ["BuildPart", "BuildSketch", "BuildLine"],
@@ -599,16 +614,20 @@ class LocationList:
     @property
     def locations(self) -> list[Location]:
         """Current local locations globalized with current workplanes"""
+        return list(self.location_array)
+
+    @property
+    def location_array(self) -> LocationArray:
+        """Current local locations globalized with current workplanes as a
+        LocationArray, without creating a Location for each one"""
         context = WorkplaneList._get_context()
         workplanes = context.workplanes if context else [Plane.XY]
-        global_locations = [
-            plane.to_location() * local_location
-            for plane in workplanes
-            for local_location in self.local_locations
-        ]
+        global_locations = LocationArray(
+            [plane.to_location() for plane in workplanes]
+        ) * LocationArray(self.local_locations)
         return global_locations
 
-    def __init__(self, locations: list[Location]):
+    def __init__(self, locations: Union[list[Location], LocationArray]):
         self._reset_tok = None
         self.local_locations = locations
         self.location_index = 0
@@ -637,7 +656,7 @@ class LocationList:
     def __iter__(self):
         """Initialize to beginning"""
         self.location_index = 0
-        self.iter_loc = self.locations
+        self.iter_loc = self.location_array
         return self
 
     def __next__(self):
@@ -659,6 +678,82 @@ class LocationList:
         """Return the instance of the current LocationList"""
         return cls._current.get(None)
 
+    @staticmethod
+    def _select(points: np.ndarray, mask: LocationMask) -> np.ndarray:
+        """_select
+
+        Evaluate a location mask against the candidate points of a location pattern
+        before any Location is created.
+
+        Args:
+            points (np.ndarray): (N, 3) candidate positions
+            mask (LocationMask): boolean array, predicate or Shape. None selects all.
+
+        Raises:
+            ValueError: mask doesn't have one entry per candidate
+
+        Returns:
+            np.ndarray: boolean selection of the points
+        """
+        if mask is None or isinstance(mask, Shape):
+            # Shape masks are applied to the global locations by _inside
+            return np.ones(len(points), dtype=bool)
+        if callable(mask):
+            mask = mask(VectorArray(points))
+        selected = np.asarray(mask, dtype=bool)
+        if selected.shape != (len(points),):
+            raise ValueError(
+                f"mask must have one entry per location ({len(points)}), "
+                f"got shape {selected.shape}"
+            )
+        return selected
+
+    @staticmethod
+    def _inside(locations: LocationArray, mask: LocationMask) -> LocationArray:
+        """_inside
+
+        Apply a Shape location mask. The locations are tested at their global
+        positions, i.e. on each active workplane, and kept if they are inside of
+        the shape on any of them. Planar faces, e.g. sketches, classify all of the
+        points at once; other shapes test each candidate within the bounding box
+        with OCCT which is much slower for large patterns.
+
+        Args:
+            locations (LocationArray): local locations, already moved to any
+                enclosing locations
+            mask (LocationMask): the mask, ignored unless it is a Shape
+
+        Returns:
+            LocationArray: the locations inside of the mask
+        """
+        if not isinstance(mask, Shape):
+            return locations
+        context = WorkplaneList._get_context()
+        workplanes = context.workplanes if context else [Plane.XY]
+        faces = mask.faces()
+        planar = not mask.solids() and all(f.geom_type() == "PLANE" for f in faces)
+        selected = np.zeros(len(locations), dtype=bool)
+        for plane in workplanes:
+            points = (LocationArray([plane.to_location()]) * locations).positions.array
+            # Only the candidates within the bounding box of a face or the mask are
+            # classified
+            for part in faces if planar else [mask]:
+                bbox = part.bounding_box()
+                candidates = np.flatnonzero(
+                    ~selected
+                    & np.all(
+                        (points >= bbox.min.to_tuple())
+                        & (points <= bbox.max.to_tuple()),
+                        axis=1,
+                    )
+                )
+                if planar:
+                    selected[candidates] = part._is_inside_array(points[candidates])
+                else:
+                    for i in candidates:
+                        selected[i] = mask.is_inside(Vector(*points[i]))
+        return locations[selected]
+
 
 class HexLocations(LocationList):
     """Location Context: Hex Array
@@ -673,6 +768,13 @@ class HexLocations(LocationList):
         yCount: number of points ( > 0 )
         align (Union[Align, tuple[Align, Align]], optional): align min, center, or max of object.
             Defaults to (Align.CENTER, Align.CENTER).
+        mask (LocationMask, optional): selects the locations to keep. Either a
+            boolean array with one entry per location or a function that takes a
+            VectorArray of the local positions of the pattern and returns such an
+            array, both evaluated before any location is created, or a Face/Solid
+            to keep the locations inside of, tested at their global positions
+            (with the workplane and any enclosing locations applied). Defaults to
+            None (keep all).
 
     Raises:
         ValueError: Spacing and count must be > 0
@@ -684,6 +786,7 @@ class HexLocations(LocationList):
         x_count: int,
         y_count: int,
         align: Union[Align, tuple[Align, Align]] = (Align.CENTER, Align.CENTER),
+        mask: LocationMask = None,
     ):
         diagonal = 4 * apothem / sqrt(3)
         x_spacing = 3 * diagonal / 4
@@ -697,26 +800,21 @@ class HexLocations(LocationList):
         self.y_count = y_count
         self.align = tuplify(align, 2)
 
-        # Generate the raw coordinates relative to bottom left point
-        points = ShapeList[Vector]()
-        for x_val in range(0, x_count, 2):
-            for y_val in range(y_count):
-                points.append(
-                    Vector(x_spacing * x_val, y_spacing * y_val + y_spacing / 2)
-                )
-        for x_val in range(1, x_count, 2):
-            for y_val in range(y_count):
-                points.append(Vector(x_spacing * x_val, y_spacing * y_val + y_spacing))
+        # Generate the raw coordinates relative to bottom left point, even columns first
+        columns = np.concatenate([np.arange(0, x_count, 2), np.arange(1, x_count, 2)])
+        x_vals, y_vals = np.meshgrid(columns, np.arange(y_count), indexing="ij")
+        x_vals, y_vals = x_vals.ravel(), y_vals.ravel()
+        points = np.column_stack(
+            [
+                x_spacing * x_vals,
+                y_spacing * y_vals + y_spacing / 2 * (1 + x_vals % 2),
+                np.zeros(len(x_vals)),
+            ]
+        )
 
         # Determine the minimum point and size of the array
-        sorted_points = [points.sort_by(Axis.X), points.sort_by(Axis.Y)]
-        # pylint doesn't recognize that a ShapeList of Vector is valid
-        # pylint: disable=no-member
-        size = [
-            sorted_points[0][-1].X - sorted_points[0][0].X,
-            sorted_points[1][-1].Y - sorted_points[1][0].Y,
-        ]
-        min_corner = Vector(sorted_points[0][0].X, sorted_points[1][0].Y)
+        size = np.ptp(points[:, :2], axis=0)
+        min_corner = points.min(axis=0)
 
         # Calculate the amount to offset the array to align it
         align_offset = []
@@ -729,14 +827,14 @@ class HexLocations(LocationList):
                 align_offset.append(-size[i])
 
         # Align the points
-        points = ShapeList(
-            [point + Vector(*align_offset) - min_corner for point in points]
-        )
+        points = points + np.array(align_offset + [0.0]) - min_corner
 
-        # Convert to locations and store the reference plane
-        local_locations = [Location(point) for point in points]
+        # Convert the selected points to locations
+        local_locations = LocationArray(points[LocationList._select(points, mask)])
 
-        self.local_locations = Locations._move_to_existing(local_locations)
+        self.local_locations = LocationList._inside(
+            Locations._move_to_existing(local_locations), mask
+        )
 
         super().__init__(self.local_locations)
 
@@ -752,6 +850,13 @@ class PolarLocations(LocationList):
         start_angle (float, optional): angle to first point from +ve X axis. Defaults to 0.0.
         angular_range (float, optional): magnitude of array from start angle. Defaults to 360.0.
         rotate (bool, optional): Align locations with arc tangents. Defaults to True.
+        mask (LocationMask, optional): selects the locations to keep. Either a
+            boolean array with one entry per location or a function that takes a
+            VectorArray of the local positions of the pattern and returns such an
+            array, both evaluated before any location is created, or a Face/Solid
+            to keep the locations inside of, tested at their global positions
+            (with the workplane and any enclosing locations applied). Defaults to
+            None (keep all).
 
     Raises:
         ValueError: Count must be greater than or equal to 1
@@ -764,6 +869,7 @@ class PolarLocations(LocationList):
         start_angle: float = 0.0,
         angular_range: float = 360.0,
         rotate: bool = True,
+        mask: LocationMask = None,
     ):
         if count < 1:
             raise ValueError(f"At least 1 elements required, requested {count}")
@@ -771,17 +877,23 @@ class PolarLocations(LocationList):
         angle_step = angular_range / count
 
         # Note: rotate==False==0 so the location orientation doesn't change
-        local_locations = []
-        for i in range(count):
-            local_locations.append(
-                Location(
-                    Vector(radius, 0).rotate(Axis.Z, start_angle + angle_step * i),
-                    Vector(0, 0, 1),
-                    rotate * (angle_step * i + start_angle),
-                )
-            )
-
-        self.local_locations = Locations._move_to_existing(local_locations)
+        angles = np.radians(start_angle + angle_step * np.arange(count))
+        points = np.column_stack(
+            [radius * np.cos(angles), radius * np.sin(angles), np.zeros(count)]
+        )
+        selected = LocationList._select(points, mask)
+        angles, points = angles[selected], points[selected]
+        matrices = np.tile(np.eye(4), (len(points), 1, 1))
+        matrices[:, :3, 3] = points
+        if rotate:
+            matrices[:, 0, 0] = matrices[:, 1, 1] = np.cos(angles)
+            matrices[:, 1, 0] = np.sin(angles)
+            matrices[:, 0, 1] = -np.sin(angles)
+        local_locations = LocationArray(matrices)
+
+        self.local_locations = LocationList._inside(
+            Locations._move_to_existing(local_locations), mask
+        )
 
         super().__init__(self.local_locations)
 
@@ -792,14 +904,22 @@ class Locations(LocationList):
     Creates a context of locations for Part or Sketch
 
     Args:
-        pts (Union[VectorLike, Vertex, Location]): sequence of points to push
+        pts (Union[VectorLike, Vertex, Location, VectorArray, LocationArray]): sequence
+            of points to push
     """
 
-    def __init__(self, *pts: Union[VectorLike, Vertex, Location, Face, Plane, Axis]):
+    def __init__(
+        self,
+        *pts: Union[
+            VectorLike, Vertex, Location, Face, Plane, Axis, VectorArray, LocationArray
+        ],
+    ):
         local_locations = []
         for point in pts:
             if isinstance(point, Location):
                 local_locations.append(point)
+            elif isinstance(point, (VectorArray, LocationArray)):
+                local_locations.extend(LocationArray(point))
             elif isinstance(point, Vector):
                 local_locations.append(Location(point))
             elif isinstance(point, Vertex):
@@ -819,32 +939,25 @@ class Locations(LocationList):
         super().__init__(self.local_locations)
 
     @staticmethod
-    def _move_to_existing(local_locations: list[Location]) -> list[Location]:
+    def _move_to_existing(
+        local_locations: Union[list[Location], LocationArray],
+    ) -> LocationArray:
         """_move_to_existing
 
         Move as a group the local locations to any existing locations  Note that existing
         polar locations may be rotated so this rotates the group not the individuals.
 
         Args:
-            local_locations (list[Location]): location group to move to existing locations
+            local_locations (Union[list[Location], LocationArray]): location group to move
+                to existing locations
 
         Returns:
-            list[Location]: group of locations moved to existing locations as a group
+            LocationArray: group of locations moved to existing locations as a group
         """
-        location_group = []
+        location_group = LocationArray(local_locations)
         if LocationList._get_context():
-            local_vertex_compound = Compound.make_compound(
-                [Face.make_rect(1, 1).locate(l) for l in local_locations]
-            )
-            for group_center in LocationList._get_context().local_locations:
-                location_group.extend(
-                    [
-                        v.location
-                        for v in local_vertex_compound.moved(group_center).faces()
-                    ]
-                )
-        else:
-            location_group = local_locations
+            group_centers = LocationList._get_context().local_locations
+            location_group = LocationArray(group_centers) * location_group
         return location_group
 
 
@@ -860,6 +973,13 @@ class GridLocations(LocationList):
         y_count (int): number of vertical points
         align (Union[Align, tuple[Align, Align]], optional): align min, center, or max of object.
             Defaults to (Align.CENTER, Align.CENTER).
+        mask (LocationMask, optional): selects the locations to keep. Either a
+            boolean array with one entry per location or a function that takes a
+            VectorArray of the local positions of the pattern and returns such an
+            array, both evaluated before any location is created, or a Face/Solid
+            to keep the locations inside of, tested at their global positions
+            (with the workplane and any enclosing locations applied). Defaults to
+            None (keep all).
 
     Raises:
         ValueError: Either x or y count must be greater than or equal to one.
@@ -872,6 +992,7 @@ class GridLocations(LocationList):
         x_count: int,
         y_count: int,
         align: Union[Align, tuple[Align, Align]] = (Align.CENTER, Align.CENTER),
+        mask: LocationMask = None,
     ):
         if x_count < 1 or y_count < 1:
             raise ValueError(
@@ -893,19 +1014,22 @@ class GridLocations(LocationList):
             elif align[i] == Align.MAX:
                 align_offset.append(-size[i])
 
-        # Create the list of local locations
-        local_locations = []
-        for i, j in product(range(x_count), range(y_count)):
-            local_locations.append(
-                Location(
-                    Vector(
-                        i * x_spacing + align_offset[0],
-                        j * y_spacing + align_offset[1],
-                    )
-                )
-            )
+        # Create the array of local locations
+        i_vals, j_vals = np.meshgrid(
+            np.arange(x_count), np.arange(y_count), indexing="ij"
+        )
+        points = np.column_stack(
+            [
+                i_vals.ravel() * x_spacing + align_offset[0],
+                j_vals.ravel() * y_spacing + align_offset[1],
+                np.zeros(x_count * y_count),
+            ]
+        )
+        local_locations = LocationArray(points[LocationList._select(points, mask)])
 
-        self.local_locations = Locations._move_to_existing(local_locations)
+        self.local_locations = LocationList._inside(
+            Locations._move_to_existing(local_locations), mask
+        )
         self.planes: list[Plane] = []
         super().__init__(self.local_locations)
 
@@ -1007,6 +1131,101 @@ class WorkplaneList:
         return result
 
 
+    @classmethod
+    def localize_array(cls, points: np.ndarray) -> np.ndarray:
+        """Localize an (N, 3) array of points to the active workplane in bulk
+        (only used by BuildLine where there is only one active workplane)
+
+        Args:
+            points (np.ndarray): array of local points of shape (N, 3)
+
+        Returns:
+            np.ndarray: array of global points of shape (N, 3)
+        """
+        if WorkplaneList._get_context() is None:
+            return points
+        workplane = WorkplaneList._get_context().workplanes[0]
+        axes = np.array(
+            [
+                workplane.x_dir.to_tuple(),
+                workplane.y_dir.to_tuple(),
+                workplane.z_dir.to_tuple(),
+            ]
+        )
+        return points @ axes + np.array(workplane.origin.to_tuple())
+
+
+class PrimitiveCache:
+    """Primitive Cache
+
+    A bounded, least recently used cache of the shapes built by the part and sketch
+    objects (e.g. Box, Hole, Circle). Entries are keyed on the object type followed by
+    the parameters that define its geometry. Each lookup returns a new instance that
+    shares the cached TopoDS_TShape, so creating the same object many times only builds
+    its OCCT geometry once and all of the instances share memory.
+
+    Args:
+        maxsize (int, optional): maximum number of cached shapes, 0 disables the cache.
+            Defaults to 512.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._shapes: OrderedDict[tuple, Shape] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def get(self, key: tuple, factory: Callable[[], Shape]) -> Shape:
+        """get
+
+        Return an instance of the shape stored under key, building it with factory if
+        it isn't cached.
+
+        Args:
+            key (tuple): object type followed by the parameters defining the shape
+            factory (Callable[[], Shape]): function that builds the shape
+
+        Returns:
+            Shape: new instance sharing the TShape of the cached shape
+        """
+        try:
+            hash(key)
+        except TypeError:
+            return factory()
+        if self.maxsize <= 0:
+            return factory()
+
+        with self._lock:
+            shape = self._shapes.get(key)
+            if shape is not None:
+                self._shapes.move_to_end(key)
+                self.hits += 1
+
+        if shape is None:
+            shape = factory()
+            with self._lock:
+                self.misses += 1
+                self._shapes[key] = shape
+                while len(self._shapes) > self.maxsize:
+                    self._shapes.popitem(last=False)
+
+        return copy.copy(shape)
+
+    def clear(self):
+        """Remove all of the cached shapes"""
+        with self._lock:
+            self._shapes.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+#: Cache used by the part and sketch objects
+primitive_cache = PrimitiveCache()
+
 #
 # To avoid import loops, Vector add & sub are monkey-patched
 
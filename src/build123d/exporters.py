@@ -3,14 +3,42 @@
 
 from build123d import *
 from build123d import Shape
+from build123d.geometry import LocationArray
+from build123d.topology import (
+    HASH_CODE_MAX,
+    _hidden_line_removal,
+    _open_binary,
+    _open_text,
+    geom_LUT_EDGE,
+)
+from OCP.BRepAdaptor import BRepAdaptor_Curve  # type: ignore
 from OCP.GeomConvert import GeomConvert_BSplineCurveToBezierCurve  # type: ignore
 from OCP.GeomConvert import GeomConvert  # type: ignore
 from OCP.Geom import Geom_BSplineCurve, Geom_BezierCurve  # type: ignore
 from OCP.gp import gp_XYZ, gp_Pnt, gp_Vec, gp_Dir, gp_Ax2  # type: ignore
-from OCP.BRepLib import BRepLib  # type: ignore
-from OCP.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape  # type: ignore
 from OCP.HLRAlgo import HLRAlgo_Projector  # type: ignore
-from typing import Callable, List, Union, Tuple, Dict, Optional
+from OCP.IFSelect import IFSelect_ReturnStatus  # type: ignore
+from OCP.TopAbs import TopAbs_ShapeEnum  # type: ignore
+from OCP.TopExp import TopExp  # type: ignore
+from OCP.TopLoc import TopLoc_Location  # type: ignore
+from OCP.TopoDS import TopoDS_Shape  # type: ignore
+from OCP.TopTools import TopTools_IndexedMapOfShape  # type: ignore
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from collections import OrderedDict
+from io import StringIO
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    List,
+    Union,
+    TextIO,
+    Tuple,
+    Dict,
+    Optional,
+)
 from typing_extensions import Self
 import svgpathtools as PT
 import xml.etree.ElementTree as ET
@@ -19,14 +47,134 @@ import ezdxf
 from ezdxf import zoom
 from ezdxf.math import Vec2
 from ezdxf.colors import aci2rgb
+from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.tools.standards import linetypes as ezdxf_linetypes
+import copy
 import math
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
 
 # ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
 
 
+def _project(
+    shape: Shape,
+    look_at: VectorLike = None,
+    look_from: VectorLike = (1, -1, 1),
+    look_up: VectorLike = (0, 0, 1),
+    focus: Union[float, None] = None,
+    fast: bool = False,
+    tolerance: Optional[float] = None,
+) -> Tuple[Compound, Compound]:
+    """Project shape with hidden line removal, returning the visible and hidden
+    lines. This is a module level function so it can run in a worker process."""
+    projection_origin = Vector(look_at) if look_at else shape.center()
+    projection_dir = Vector(look_from).normalized()
+    projection_x = Vector(look_up).normalized().cross(projection_dir)
+    coordinate_system = gp_Ax2(
+        projection_origin.to_pnt(), projection_dir.to_dir(), projection_x.to_dir()
+    )
+
+    if focus is not None:
+        projector = HLRAlgo_Projector(coordinate_system, focus)
+    else:
+        projector = HLRAlgo_Projector(coordinate_system)
+
+    visible, hidden = _hidden_line_removal([shape], projector, fast, tolerance)
+    return (
+        Compound.make_compound(map(Shape, visible)),
+        Compound.make_compound(map(Shape, hidden)),
+    )
+
+
+class DrawingCache(object):
+    """A least recently used cache of projected lines keyed on the shape and the
+    view parameters, so a view can be re-rendered (e.g. with other styling)
+    without running hidden line removal again.
+
+    Each entry keeps its shape alive so it can be compared with IsEqual. The cache
+    is bounded by the number of entries and by the total number of projected edges
+    it holds; drawing_cache.clear() releases everything at once.
+
+    Args:
+        max_entries (int, optional): maximum number of cached views, 0 disables the
+            cache. Defaults to 32.
+        max_edges (int, optional): maximum number of visible and hidden edges of all
+            of the cached views. Defaults to 100_000.
+    """
+
+    def __init__(self, max_entries: int = 32, max_edges: int = 100_000):
+        self.max_entries = max_entries
+        self.max_edges = max_edges
+        self.edge_count = 0
+        # (shape hash, orientation, view) -> (shape, (visible, hidden), edge count)
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(shape: Shape, view: tuple) -> tuple:
+        return (
+            shape.wrapped.HashCode(HASH_CODE_MAX),
+            int(shape.wrapped.Orientation()),
+            view,
+        )
+
+    @staticmethod
+    def _edge_count(lines: Tuple[Compound, Compound]) -> int:
+        edges = TopTools_IndexedMapOfShape()
+        for shape_lines in lines:
+            TopExp.MapShapes_s(shape_lines.wrapped, TopAbs_ShapeEnum.TopAbs_EDGE, edges)
+        return edges.Extent()
+
+    def get(self, shape: Shape, view: tuple) -> Optional[Tuple[Compound, Compound]]:
+        key = self._key(shape, view)
+        entry = self._entries.get(key)
+        if entry is None or not entry[0].IsEqual(shape.wrapped):
+            return None
+        self._entries.move_to_end(key)
+        # Shallow copies so moving the lines of one Drawing can't change another
+        return tuple(copy.copy(lines) for lines in entry[1])
+
+    def put(self, shape: Shape, view: tuple, lines: Tuple[Compound, Compound]):
+        if self.max_entries <= 0:
+            return
+        edge_count = DrawingCache._edge_count(lines)
+        if edge_count > self.max_edges:
+            return
+        # Copies, so the caller can move its lines without changing the entry
+        lines = tuple(copy.copy(shape_lines) for shape_lines in lines)
+        key = self._key(shape, view)
+        if key in self._entries:
+            self.edge_count -= self._entries.pop(key)[2]
+        self._entries[key] = (shape.wrapped, lines, edge_count)
+        self.edge_count += edge_count
+        while len(self._entries) > self.max_entries or self.edge_count > self.max_edges:
+            self.edge_count -= self._entries.popitem(last=False)[1][2]
+
+    def clear(self):
+        self._entries.clear()
+        self.edge_count = 0
+
+
+drawing_cache = DrawingCache()
+
+
 class Drawing(object):
+
+    # look_from and look_up of the standard drawing views
+    STANDARD_VIEWS = {
+        "front": {"look_from": (0, -1, 0), "look_up": (0, 0, 1)},
+        "top": {"look_from": (0, 0, 1), "look_up": (0, 1, 0)},
+        "right": {"look_from": (1, 0, 0), "look_up": (0, 0, 1)},
+        "iso": {"look_from": (1, -1, 1), "look_up": (0, 0, 1)},
+    }
+
     def __init__(
         self,
         shape: Shape,
@@ -36,78 +184,85 @@ class Drawing(object):
         look_up: VectorLike = (0, 0, 1),
         with_hidden: bool = True,
         focus: Union[float, None] = None,
+        fast: bool = False,
+        tolerance: Optional[float] = None,
     ):
+        view = Drawing._view(look_at, look_from, look_up, focus, fast, tolerance)
+        lines = drawing_cache.get(shape, view)
+        if lines is None:
+            lines = _project(shape, *view)
+            drawing_cache.put(shape, view, lines)
 
-        hlr = HLRBRep_Algo()
-        hlr.Add(shape.wrapped)
-
-        projection_origin = Vector(look_at) if look_at else shape.center()
-        projection_dir = Vector(look_from).normalized()
-        projection_x = Vector(look_up).normalized().cross(projection_dir)
-        coordinate_system = gp_Ax2(
-            projection_origin.to_pnt(), projection_dir.to_dir(), projection_x.to_dir()
-        )
-
-        if focus is not None:
-            projector = HLRAlgo_Projector(coordinate_system, focus)
-        else:
-            projector = HLRAlgo_Projector(coordinate_system)
-
-        hlr.Projector(projector)
-        hlr.Update()
-        hlr.Hide()
-
-        hlr_shapes = HLRBRep_HLRToShape(hlr)
-
-        visible = []
-
-        visible_sharp_edges = hlr_shapes.VCompound()
-        if not visible_sharp_edges.IsNull():
-            visible.append(visible_sharp_edges)
-
-        visible_smooth_edges = hlr_shapes.Rg1LineVCompound()
-        if not visible_smooth_edges.IsNull():
-            visible.append(visible_smooth_edges)
-
-        visible_contour_edges = hlr_shapes.OutLineVCompound()
-        if not visible_contour_edges.IsNull():
-            visible.append(visible_contour_edges)
+        # Hidden lines are always computed, so they are cached even if not shown.
+        self.visible_lines, self.hidden_lines = lines
+        if not with_hidden:
+            self.hidden_lines = Compound.make_compound([])
 
-        hidden = []
-        if with_hidden:
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-            hidden_sharp_edges = hlr_shapes.HCompound()
-            if not hidden_sharp_edges.IsNull():
-                hidden.append(hidden_sharp_edges)
+    @staticmethod
+    def _view(
+        look_at: VectorLike = None,
+        look_from: VectorLike = (1, -1, 1),
+        look_up: VectorLike = (0, 0, 1),
+        focus: Union[float, None] = None,
+        fast: bool = False,
+        tolerance: Optional[float] = None,
+    ) -> tuple:
+        """The hashable view parameters, in the argument order of _project."""
+        return (
+            Vector(look_at).to_tuple() if look_at else None,
+            Vector(look_from).to_tuple(),
+            Vector(look_up).to_tuple(),
+            focus,
+            fast,
+            tolerance,
+        )
 
-            hidden_contour_edges = hlr_shapes.OutLineHCompound()
-            if not hidden_contour_edges.IsNull():
-                hidden.append(hidden_contour_edges)
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-        # magic number from CQ
-        # TODO: figure out the proper source of this value.
-        tolerance = 1e-6
+    @classmethod
+    def views(
+        cls,
+        shape: Shape,
+        views: Dict[str, dict] = None,
+        workers: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, "Drawing"]:
+        """Project a shape into several views, by default the STANDARD_VIEWS.
+        Each view is a dictionary of Drawing arguments which override kwargs.
+        Views which aren't cached yet are projected concurrently in `workers`
+        processes. The projected lines are kept in the size bounded drawing_cache
+        which keeps the shape alive; call drawing_cache.clear() to release them."""
+        views = Drawing.STANDARD_VIEWS if views is None else views
+        arguments = {name: kwargs | view for name, view in views.items()}
+        pending = []
+        for view_args in arguments.values():
+            view = Drawing._view(
+                **{k: v for k, v in view_args.items() if k != "with_hidden"}
+            )
+            if view not in pending and drawing_cache.get(shape, view) is None:
+                pending.append(view)
 
-        # Fix the underlying geometry - otherwise we will get segfaults
-        for el in visible:
-            BRepLib.BuildCurves3d_s(el, tolerance)
-        for el in hidden:
-            BRepLib.BuildCurves3d_s(el, tolerance)
+        if workers and len(pending) > 1:
+            with ProcessPoolExecutor(min(workers, len(pending))) as pool:
+                results = pool.map(_project, [shape] * len(pending), *zip(*pending))
+                for view, lines in zip(pending, results):
+                    drawing_cache.put(shape, view, lines)
 
-        # Convert and store the results.
-        self.visible_lines = Compound.make_compound(map(Shape, visible))
-        self.hidden_lines = Compound.make_compound(map(Shape, hidden))
+        # Anything left is projected (and cached) by the Drawing itself
+        return {name: cls(shape, **view_args) for name, view_args in arguments.items()}
 
 
 # ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
 
-# class AutoNameEnum(Enum):
-#     def _generate_next_value_(name, start, count, last_values):
-#         return name
+class AutoNameEnum(Enum):
+    def _generate_next_value_(name, start, count, last_values):
+        return name
 
 
-class LineType(Enum):
+class LineType(AutoNameEnum):
     CONTINUOUS = auto()
     CENTERX2 = auto()
     CENTER2 = auto()
@@ -180,6 +335,69 @@ def unit_conversion_scale(from_unit: Unit, to_unit: Unit) -> float:
     return result
 
 
+# The spline conversions below work on edges in their local coordinates and
+# return plain arrays, so they can be cached per TShape and run in worker
+# processes.
+
+
+def _bezier_poles(edge: Edge) -> List[np.ndarray]:
+    """Decompose an edge into cubic (or lower degree) Bézier segments, returning
+    the poles of each segment as an (n, 3) array."""
+
+    # This reduces the B-Spline to degree 3, generally adding
+    # poles and knots to approximate the original.
+    # This also will convert basically any edge into a B-Spline.
+    edge = edge.to_splines()
+
+    # This pulls the underlying Geom_BSplineCurve out of the Edge.
+    # The adaptor also supplies a parameter range for the curve.
+    adaptor = edge._geom_adaptor()
+
+    # Convert the B-Spline to Bezier curves.
+    # From the OCCT 7.6.0 documentation:
+    # > Note: ParametricTolerance is not used.
+    converter = GeomConvert_BSplineCurveToBezierCurve(
+        adaptor.Curve().Curve(),
+        adaptor.FirstParameter(),
+        adaptor.LastParameter(),
+        Export2D.PARAMETRIC_TOLERANCE,
+    )
+    return [
+        np.array([pole.Coord() for pole in converter.Arc(i).Poles()])
+        for i in range(1, converter.NbArcs() + 1)
+    ]
+
+
+def _bspline_data(
+    edge: Edge,
+) -> Tuple[int, List[float], np.ndarray, Optional[List[float]]]:
+    """Approximate an edge with a degree 3 B-Spline, returning its degree,
+    knot sequence, (n, 3) poles and weights (None if not rational)."""
+    edge = edge.to_splines()
+    adaptor = edge._geom_adaptor()
+
+    # Extract the relevant segment of the curve.
+    spline = GeomConvert.SplitBSplineCurve_s(
+        adaptor.Curve().Curve(),
+        adaptor.FirstParameter(),
+        adaptor.LastParameter(),
+        Export2D.PARAMETRIC_TOLERANCE,
+    )
+
+    poles = np.array([pole.Coord() for pole in spline.Poles()])
+    weights = (
+        [spline.Weight(i) for i in range(1, spline.NbPoles() + 1)]
+        if spline.IsRational()
+        else None
+    )
+
+    if spline.IsPeriodic():
+        pad = spline.NbKnots() - spline.LastUKnotIndex()
+        poles = np.concatenate([poles, poles[:pad]])
+
+    return spline.Degree(), list(spline.KnotSequence()), poles, weights
+
+
 # ---------------------------------------------------------------------------
 #
 # ---------------------------------------------------------------------------
@@ -270,6 +488,104 @@ class Export2D(object):
         Unit.METER: 0.00254,
     }
 
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def __init__(self, workers: Optional[int] = None):
+        # Number of worker processes used to convert splines, None converts
+        # them in this process.
+        self.workers = workers
+        # Spline conversions in local coordinates, keyed by TShape hash.
+        self._spline_cache: Dict[int, List[List[Any]]] = {}
+        # Worker processes, started by the first batch of splines and kept
+        # until close() so each add_shape doesn't start a new pool.
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release the worker processes and, when streaming, the temporary
+        files holding the converted shapes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    @staticmethod
+    def _classify_edges(
+        edges: Iterable[Edge],
+    ) -> List[Tuple[Edge, BRepAdaptor_Curve, str]]:
+        """Build a single curve adaptor per edge, which both classifies the
+        edge and is reused by the converters."""
+        result = []
+        for edge in edges:
+            geom = BRepAdaptor_Curve(edge.wrapped)
+            result.append((edge, geom, geom_LUT_EDGE[geom.GetType()]))
+        return result
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def _convert_splines(
+        self, edges: List[Edge], convert: Callable[[Edge], Any]
+    ) -> List[Any]:
+        """Apply convert to each edge in its local coordinates.
+
+        Results are cached by TShape, so edges shared between faces, repeated
+        shapes and instances at other locations are only converted once. The
+        remaining conversions are spread over `workers` processes."""
+        entries = []
+        pending = []
+        for edge in edges:
+            local_shape = edge.wrapped.Located(TopLoc_Location())
+            bucket = self._spline_cache.setdefault(
+                local_shape.HashCode(HASH_CODE_MAX), []
+            )
+            entry = next((e for e in bucket if e[0].IsSame(local_shape)), None)
+            if entry is None:
+                entry = [local_shape, None]
+                bucket.append(entry)
+                pending.append(entry)
+            entries.append(entry)
+
+        local_edges = [Edge(entry[0]) for entry in pending]
+        if self.workers and len(local_edges) > 1:
+            chunk_size = max(1, len(local_edges) // (4 * self.workers))
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers)
+            results = self._pool.map(convert, local_edges, chunksize=chunk_size)
+        else:
+            results = map(convert, local_edges)
+        for entry, result in zip(pending, results):
+            entry[1] = result
+
+        return [entry[1] for entry in entries]
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    @staticmethod
+    def _located(points: np.ndarray, edge: Edge) -> np.ndarray:
+        """Move (n, 3) points from the local coordinates of edge to global."""
+        if edge.wrapped.Location().IsIdentity():
+            return points
+        matrix = LocationArray._to_matrix(edge.location)
+        return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    @staticmethod
+    def _end_points(geom: BRepAdaptor_Curve) -> np.ndarray:
+        """The (2, 3) start and end points of the curve."""
+        return np.array(
+            [
+                geom.Value(geom.FirstParameter()).Coord(),
+                geom.Value(geom.LastParameter()).Coord(),
+            ]
+        )
+
 
 # ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -301,7 +617,10 @@ class ExportDXF(Export2D):
         color: Optional[ColorIndex] = None,
         line_weight: Optional[float] = None,
         line_type: Optional[LineType] = None,
+        workers: Optional[int] = None,
+        streaming: bool = False,
     ):
+        super().__init__(workers)
         if unit not in self.UNITS_LOOKUP:
             raise ValueError(f"unit `{unit.name}` not supported.")
         if unit in ExportDXF.METRIC_UNITS:
@@ -315,6 +634,17 @@ class ExportDXF(Export2D):
         )
         self._modelspace = self._document.modelspace()
 
+        # When streaming, the entities of each added shape are written to a
+        # temporary file and removed from the document.
+        self._bounds: BoundBox = None
+        self._spool = (
+            tempfile.TemporaryFile(
+                "w+", encoding=self._document.output_encoding, errors="dxfreplace"
+            )
+            if streaming
+            else None
+        )
+
         default_layer = self._document.layers.get("0")
         if color is not None:
             default_layer.color = color.value
@@ -385,8 +715,11 @@ class ExportDXF(Export2D):
         attributes = {}
         if layer:
             attributes["layer"] = layer
-        for edge in shape.edges():
-            self._convert_edge(edge, attributes)
+        self._convert_edges(shape.edges(), attributes)
+        if self._spool is not None:
+            bb = shape.bounding_box()
+            self._bounds = self._bounds.add(bb) if self._bounds else bb
+            self._spool_entities()
         if self._non_planar_point_count > 0:
             print(f"WARNING, exporting non-planar shape to 2D format.")
             print("  This is probably not what you want.")
@@ -397,15 +730,62 @@ class ExportDXF(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def write(self, file_name: str):
+    def write(self, file_name: Union[str, os.PathLike, BinaryIO, TextIO]):
 
-        # Reset the main CAD viewport of the model space to the
-        # extents of its entities.
-        # TODO: Expose viewport control to the user.
-        # Do the same for ExportSVG.
-        zoom.extents(self._modelspace)
+        if self._spool is None:
+            # Reset the main CAD viewport of the model space to the
+            # extents of its entities.
+            # TODO: Expose viewport control to the user.
+            # Do the same for ExportSVG.
+            zoom.extents(self._modelspace)
 
-        self._document.saveas(file_name)
+            if isinstance(file_name, (str, os.PathLike)):
+                self._document.saveas(file_name)
+            else:
+                with _open_text(
+                    file_name, self._document.output_encoding, "dxfreplace"
+                ) as file:
+                    self._document.write(file)
+            return
+
+        # The entities have already been spooled, so use the accumulated
+        # bounds for the viewport and splice them into the (otherwise empty)
+        # ENTITIES section of the document.
+        if self._bounds is not None:
+            zoom.window(
+                self._modelspace,
+                (self._bounds.min.X, self._bounds.min.Y),
+                (self._bounds.max.X, self._bounds.max.Y),
+            )
+        stream = StringIO()
+        self._document.write(stream)
+        marker = "  0\nSECTION\n  2\nENTITIES\n"
+        head, tail = stream.getvalue().split(marker, 1)
+        with _open_text(
+            file_name, self._document.output_encoding, "dxfreplace"
+        ) as file:
+            file.write(head + marker)
+            self._spool.seek(0)
+            shutil.copyfileobj(self._spool, file)
+            file.write(tail)
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def close(self):
+        super().close()
+        if self._spool is not None:
+            self._spool.close()
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def _spool_entities(self):
+        """Write the modelspace entities to the spool and delete them from the
+        document. Handles are never reused, so the spooled entities stay valid."""
+        self._spool.seek(0, 2)
+        tagwriter = TagWriter(self._spool, dxfversion=self._document.dxfversion)
+        for entity in self._modelspace:
+            entity.export_dxf(tagwriter)
+        self._modelspace.delete_all_entities()
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -424,19 +804,21 @@ class ExportDXF(Export2D):
             self._non_planar_point_count += 1
         return Vec2(x, y)
 
+    def _convert_points(self, points: np.ndarray) -> List[Vec2]:
+        """Create Vec2s from an (n, 3) array of points.
+        This method also checks for points z != 0."""
+        self._non_planar_point_count += int(np.count_nonzero(abs(points[:, 2]) > 1e-6))
+        return [Vec2(x, y) for x, y in points[:, :2].tolist()]
+
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_line(self, edge: Edge, attribs: dict):
-        self._modelspace.add_line(
-            self._convert_point(edge.start_point()),
-            self._convert_point(edge.end_point()),
-            attribs,
-        )
+    def _convert_line(self, edge: Edge, geom: BRepAdaptor_Curve, attribs: dict):
+        start, end = self._convert_points(self._end_points(geom))
+        self._modelspace.add_line(start, end, attribs)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_circle(self, edge: Edge, attribs: dict):
-        geom = edge._geom_adaptor()
+    def _convert_circle(self, edge: Edge, geom: BRepAdaptor_Curve, attribs: dict):
         circle = geom.Circle()
         center = self._convert_point(circle.Location())
         radius = circle.Radius()
@@ -462,8 +844,7 @@ class ExportDXF(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_ellipse(self, edge: Edge, attribs: dict):
-        geom = edge._geom_adaptor()
+    def _convert_ellipse(self, edge: Edge, geom: BRepAdaptor_Curve, attribs: dict):
         ellipse = geom.Ellipse()
         minor_radius = ellipse.MinorRadius()
         major_radius = ellipse.MajorRadius()
@@ -487,46 +868,11 @@ class ExportDXF(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_bspline(self, edge: Edge, attribs):
-
-        # This reduces the B-Spline to degree 3, generally adding
-        # poles and knots to approximate the original.
-        # This also will convert basically any edge into a B-Spline.
-        edge = edge.to_splines()
-
-        # This pulls the underlying Geom_BSplineCurve out of the Edge.
-        # The adaptor also supplies a parameter range for the curve.
-        adaptor = edge._geom_adaptor()
-        curve = adaptor.Curve().Curve()
-        u1 = adaptor.FirstParameter()
-        u2 = adaptor.LastParameter()
-
-        # Extract the relevant segment of the curve.
-        spline = GeomConvert.SplitBSplineCurve_s(
-            curve,
-            u1,
-            u2,
-            Export2D.PARAMETRIC_TOLERANCE,
-        )
-
-        # need to apply the transform on the geometry level
-        t = edge.location.wrapped.Transformation()
-        spline.Transform(t)
-
-        order = spline.Degree() + 1
-        knots = list(spline.KnotSequence())
-        poles = [self._convert_point(p) for p in spline.Poles()]
-        weights = (
-            [spline.Weight(i) for i in range(1, spline.NbPoles() + 1)]
-            if spline.IsRational()
-            else None
-        )
+    def _convert_bspline(self, edge: Edge, spline_data: tuple, attribs: dict):
+        degree, knots, poles, weights = spline_data
+        poles = self._convert_points(self._located(poles, edge))
 
-        if spline.IsPeriodic():
-            pad = spline.NbKnots() - spline.LastUKnotIndex()
-            poles += poles[:pad]
-
-        dxf_spline = ezdxf.math.BSpline(poles, order, knots, weights)
+        dxf_spline = ezdxf.math.BSpline(poles, degree + 1, knots, weights)
 
         self._modelspace.add_spline(dxfattribs=attribs).apply_construction_tool(
             dxf_spline
@@ -534,25 +880,28 @@ class ExportDXF(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_other(self, edge: Edge, attribs: dict):
-        self._convert_bspline(edge, attribs)
-
-    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-
     _CONVERTER_LOOKUP = {
         GeomType.LINE.name: _convert_line,
         GeomType.CIRCLE.name: _convert_circle,
         GeomType.ELLIPSE.name: _convert_ellipse,
-        GeomType.BSPLINE.name: _convert_bspline,
     }
 
-    def _convert_edge(self, edge: Edge, attribs: dict):
-        geom_type = edge.geom_type()
-        if False and geom_type not in self._CONVERTER_LOOKUP:
-            article = "an" if geom_type[0] in "AEIOU" else "a"
-            print(f"Hey neat, {article} {geom_type}!")
-        convert = self._CONVERTER_LOOKUP.get(geom_type, ExportDXF._convert_other)
-        convert(self, edge, attribs)
+    def _convert_edges(self, edges: Iterable[Edge], attribs: dict):
+        # Classify all of the edges up front so that everything that isn't
+        # analytic can be converted to a B-Spline in one batch.
+        classified = self._classify_edges(edges)
+        splines = iter(
+            self._convert_splines(
+                [e for e, _, t in classified if t not in self._CONVERTER_LOOKUP],
+                _bspline_data,
+            )
+        )
+        for edge, geom, geom_type in classified:
+            convert = self._CONVERTER_LOOKUP.get(geom_type)
+            if convert is None:
+                self._convert_bspline(edge, next(splines), attribs)
+            else:
+                convert(self, edge, geom, attribs)
 
 
 # ---------------------------------------------------------------------------
@@ -586,6 +935,8 @@ class ExportSVG(Export2D):
             self.line_weight = line_weight
             self.line_type = line_type
             self.elements: List[ET.Element] = []
+            # Serialized elements when streaming.
+            self.spool = None
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -599,7 +950,10 @@ class ExportSVG(Export2D):
         color: ColorIndex = Export2D.DEFAULT_COLOR_INDEX,
         line_weight: float = Export2D.DEFAULT_LINE_WEIGHT,  # in millimeters
         line_type: LineType = Export2D.DEFAULT_LINE_TYPE,
+        workers: Optional[int] = None,
+        streaming: bool = False,
     ):
+        super().__init__(workers)
         if unit not in ExportSVG._UNIT_STRING:
             raise ValueError(
                 "Invalid unit.  Supported units are %s."
@@ -610,6 +964,7 @@ class ExportSVG(Export2D):
         self.margin = margin
         self.fit_to_stroke = fit_to_stroke
         self.precision = precision
+        self.streaming = streaming
         self._non_planar_point_count = 0
         self._layers: Dict[str, ExportSVG.Layer] = {}
         self._bounds: BoundBox = None
@@ -637,6 +992,8 @@ class ExportSVG(Export2D):
             line_weight=line_weight,
             line_type=line_type,
         )
+        if self.streaming:
+            layer.spool = tempfile.TemporaryFile()
         self._layers[name] = layer
         return self
 
@@ -649,8 +1006,14 @@ class ExportSVG(Export2D):
         layer = self._layers[layer]
         bb = shape.bounding_box()
         self._bounds = self._bounds.add(bb) if self._bounds else bb
-        elements = [self._convert_edge(edge) for edge in shape.edges()]
-        layer.elements.extend(elements)
+        elements = self._convert_edges(shape.edges())
+        if layer.spool is None:
+            layer.elements.extend(elements)
+        else:
+            # Indented to match the non-streaming output.
+            layer.spool.writelines(
+                b"      " + ET.tostring(element) + b"\n" for element in elements
+            )
         if self._non_planar_point_count > 0:
             print(f"WARNING, exporting non-planar shape to 2D format.")
             print("  This is probably not what you want.")
@@ -672,16 +1035,19 @@ class ExportSVG(Export2D):
             raise TypeError(
                 f"Expected `gp_Pnt` or `Vector`.  Got `{type(pt).__name__}`."
             )
-        x, y, z = tuple(round(v, self.precision) for v in xyz)
-        if z != 0:
-            self._non_planar_point_count += 1
-        return complex(x, y)
+        return self.path_points(np.array([xyz]))[0]
+
+    def path_points(self, points: np.ndarray) -> List[complex]:
+        """Create complex points from an (n, 3) array of points.
+        This method also checks for points z != 0."""
+        points = np.round(points, self.precision)
+        self._non_planar_point_count += int(np.count_nonzero(points[:, 2]))
+        return (points[:, 0] + 1j * points[:, 1]).tolist()
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_line(self, edge: Edge) -> ET.Element:
-        p0 = self.path_point(edge @ 0)
-        p1 = self.path_point(edge @ 1)
+    def _convert_line(self, edge: Edge, geom: BRepAdaptor_Curve) -> ET.Element:
+        p0, p1 = self.path_points(self._end_points(geom))
         result = ET.Element(
             "line",
             {
@@ -695,8 +1061,7 @@ class ExportSVG(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_circle(self, edge: Edge) -> ET.Element:
-        geom = edge._geom_adaptor()
+    def _convert_circle(self, edge: Edge, geom: BRepAdaptor_Curve) -> ET.Element:
         circle = geom.Circle()
         radius = circle.Radius()
         center = circle.Location()
@@ -721,8 +1086,7 @@ class ExportSVG(Export2D):
             du = u2 - u1
             large_arc = (du < -math.pi) or (du > math.pi)
 
-            start = self.path_point(edge @ 0)
-            end = self.path_point(edge @ 1)
+            start, end = self.path_points(self._end_points(geom))
             radius = complex(radius, radius)
             rotation = math.degrees(phi)
             arc = PT.Arc(start, radius, rotation, large_arc, sweep, end)
@@ -732,8 +1096,7 @@ class ExportSVG(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_ellipse(self, edge: Edge) -> ET.Element:
-        geom = edge._geom_adaptor()
+    def _convert_ellipse(self, edge: Edge, geom: BRepAdaptor_Curve) -> ET.Element:
         ellipse = geom.Ellipse()
         minor_radius = ellipse.MinorRadius()
         major_radius = ellipse.MajorRadius()
@@ -750,12 +1113,14 @@ class ExportSVG(Export2D):
         du = u2 - u1
         large_arc = (du < -math.pi) or (du > math.pi)
 
-        start = self.path_point(edge @ 0)
-        end = self.path_point(edge @ 1)
+        start, end = self.path_points(self._end_points(geom))
         radius = complex(major_radius, minor_radius)
         rotation = math.degrees(x_axis.AngleWithRef(gp_Dir(1, 0, 0), z_axis))
         if edge.is_closed():
-            midway = self.path_point(edge @ 0.5)
+            # By symmetry the parametric midpoint of a full ellipse is also
+            # half way along its length.
+            u_mid = (geom.FirstParameter() + geom.LastParameter()) / 2
+            midway = self.path_point(geom.Value(u_mid))
             arcs = [
                 PT.Arc(start, radius, rotation, False, sweep, midway),
                 PT.Arc(midway, radius, rotation, False, sweep, end),
@@ -768,36 +1133,13 @@ class ExportSVG(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_bspline(self, edge: Edge) -> ET.Element:
-
-        # This reduces the B-Spline to degree 3, generally adding
-        # poles and knots to approximate the original.
-        # This also will convert basically any edge into a B-Spline.
-        edge = edge.to_splines()
-
-        # This pulls the underlying Geom_BSplineCurve out of the Edge.
-        # The adaptor also supplies a parameter range for the curve.
-        adaptor = edge._geom_adaptor()
-        spline = adaptor.Curve().Curve()
-        u1 = adaptor.FirstParameter()
-        u2 = adaptor.LastParameter()
-
-        # Apply the shape location to the geometry.
-        t = edge.location.wrapped.Transformation()
-        spline.Transform(t)
-        # describe_bspline(spline)
-
-        # Convert the B-Spline to Bezier curves.
-        # From the OCCT 7.6.0 documentation:
-        # > Note: ParametricTolerance is not used.
-        converter = GeomConvert_BSplineCurveToBezierCurve(
-            spline, u1, u2, Export2D.PARAMETRIC_TOLERANCE
-        )
+    def _convert_bspline(self, edge: Edge, beziers: List[np.ndarray]) -> ET.Element:
+        # Convert the poles of all of the Bézier segments at once.
+        points = self.path_points(self._located(np.concatenate(beziers), edge))
 
         def make_segment(
-            bezier: Geom_BezierCurve,
+            p: List[complex],
         ) -> Union[PT.Line, PT.QuadraticBezier, PT.CubicBezier]:
-            p = [self.path_point(p) for p in bezier.Poles()]
             if len(p) == 2:
                 result = PT.Line(start=p[0], end=p[1])
             elif len(p) == 3:
@@ -807,39 +1149,43 @@ class ExportSVG(Export2D):
                     start=p[0], control1=p[1], control2=p[2], end=p[3]
                 )
             else:
-                raise ValueError(f"Surprising Bézier of degree {bezier.Degree()}!")
+                raise ValueError(f"Surprising Bézier of degree {len(p) - 1}!")
             return result
 
-        segments = [
-            make_segment(converter.Arc(i)) for i in range(1, converter.NbArcs() + 1)
-        ]
+        segments = []
+        offset = 0
+        for bezier in beziers:
+            segments.append(make_segment(points[offset : offset + len(bezier)]))
+            offset += len(bezier)
         path = PT.Path(*segments)
         result = ET.Element("path", {"d": path.d()})
         return result
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _convert_other(self, edge: Edge) -> ET.Element:
-        # _convert_bspline can actually handle basically anything
-        # because it calls Edge.to_splines() first thing.
-        return self._convert_bspline(edge)
-
-    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-
     _CONVERTER_LOOKUP = {
         GeomType.LINE.name: _convert_line,
         GeomType.CIRCLE.name: _convert_circle,
         GeomType.ELLIPSE.name: _convert_ellipse,
-        GeomType.BSPLINE.name: _convert_bspline,
     }
 
-    def _convert_edge(self, edge: Edge) -> ET.Element:
-        geom_type = edge.geom_type()
-        if False and geom_type not in self._CONVERTER_LOOKUP:
-            article = "an" if geom_type[0] in "AEIOU" else "a"
-            print(f"Hey neat, {article} {geom_type}!")
-        convert = self._CONVERTER_LOOKUP.get(geom_type, ExportSVG._convert_other)
-        result = convert(self, edge)
+    def _convert_edges(self, edges: Iterable[Edge]) -> List[ET.Element]:
+        # Classify all of the edges up front so that everything that isn't
+        # analytic can be converted to Bézier segments in one batch.
+        classified = self._classify_edges(edges)
+        beziers = iter(
+            self._convert_splines(
+                [e for e, _, t in classified if t not in self._CONVERTER_LOOKUP],
+                _bezier_poles,
+            )
+        )
+        result = []
+        for edge, geom, geom_type in classified:
+            convert = self._CONVERTER_LOOKUP.get(geom_type)
+            if convert is None:
+                result.append(self._convert_bspline(edge, next(beziers)))
+            else:
+                result.append(convert(self, edge, geom))
         return result
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -878,7 +1224,7 @@ class ExportSVG(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def write(self, path: str):
+    def write(self, path: Union[str, os.PathLike, BinaryIO, TextIO]):
 
         bb = self._bounds
         margin = self.margin
@@ -911,6 +1257,11 @@ class ExportSVG(Export2D):
                 "stroke-linecap": "round",
             },
         )
+
+        if self.streaming:
+            self._write_streaming(path, svg, container_group)
+            return
+
         svg.append(container_group)
 
         for _, layer in self._layers.items():
@@ -919,4 +1270,260 @@ class ExportSVG(Export2D):
 
         xml = ET.ElementTree(svg)
         ET.indent(xml, "  ")
-        xml.write(path, encoding="utf-8", xml_declaration=True, default_namespace=False)
+        with _open_binary(path) as file:
+            xml.write(
+                file, encoding="utf-8", xml_declaration=True, default_namespace=False
+            )
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def close(self):
+        super().close()
+        for layer in self._layers.values():
+            if layer.spool is not None:
+                layer.spool.close()
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def _write_streaming(
+        self,
+        path: Union[str, os.PathLike, BinaryIO, TextIO],
+        svg: ET.Element,
+        container: ET.Element,
+    ):
+        """Write the header computed from the accumulated bounds, followed by
+        each layer group with its spooled elements copied in."""
+
+        def start_tag(element: ET.Element) -> bytes:
+            # An empty element serializes as '<tag ... />'
+            return ET.tostring(element, encoding="unicode")[:-3].encode() + b">"
+
+        with _open_binary(path) as file:
+            file.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+            file.write(start_tag(svg) + b"\n  " + start_tag(container) + b"\n")
+            for layer in self._layers.values():
+                file.write(b"    " + start_tag(self._group_for_layer(layer)) + b"\n")
+                layer.spool.seek(0)
+                shutil.copyfileobj(layer.spool, file)
+                layer.spool.seek(0, 2)
+                file.write(b"    </g>\n")
+            file.write(b"  </g>\n</svg>")
+
+
+# ---------------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+# The Shape export method used for each file suffix
+EXPORT_METHODS = {
+    ".brep": "export_brep",
+    ".dxf": "export_dxf",
+    ".glb": "export_glb",
+    ".step": "export_step",
+    ".stl": "export_stl",
+    ".stp": "export_step",
+    ".svg": "export_svg",
+    ".3mf": "export_3mf",
+}
+
+
+def _timed_export(target: Any, method: str, file_name: Any, kwargs: dict) -> tuple:
+    """Run one export, returning (succeeded, result or error, seconds). Errors are
+    returned rather than raised so the time spent is reported either way, exports
+    which return False or an OCCT status other than RetDone are errors too. This is
+    a module level function so it can run in a worker process."""
+    start = time.perf_counter()
+    try:
+        result = getattr(target, method)(file_name, **kwargs)
+        if result is False or (
+            isinstance(result, IFSelect_ReturnStatus)
+            and result != IFSelect_ReturnStatus.IFSelect_RetDone
+        ):
+            raise OSError(f"Could not write {file_name!r}, {method} returned {result}")
+    except Exception as error:  # pylint: disable=broad-except
+        return False, error, time.perf_counter() - start
+    return True, result, time.perf_counter() - start
+
+
+class ExportJob(object):
+    """The file, method, time taken and outcome of one ExportQueue job"""
+
+    def __init__(self, file_name: Any, method: str):
+        self.file_name = file_name
+        self.method = method
+        self.future: Future = Future()
+        self.seconds: Optional[float] = None
+
+    def __repr__(self) -> str:
+        if not self.future.done():
+            state = "pending"
+        elif self.error is not None and self.seconds is None:
+            state = f"failed: {self.error!r}"
+        elif self.error is not None:
+            state = f"failed after {self.seconds:.3f}s: {self.error!r}"
+        else:
+            state = f"done in {self.seconds:.3f}s"
+        return f"ExportJob({self.file_name!r}, {self.method}, {state})"
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """The exception raised by the job, None if pending or successful"""
+        if not self.future.done() or self.future.cancelled():
+            return None
+        return self.future.exception()
+
+    def _finished(self, outcome: Future):
+        if self.future.cancelled():
+            return
+        if outcome.cancelled():
+            self.future.cancel()
+        elif outcome.exception() is not None:
+            # The job never ran, e.g. the shape couldn't be sent to the worker
+            self.future.set_exception(outcome.exception())
+        else:
+            succeeded, result, self.seconds = outcome.result()
+            if succeeded:
+                self.future.set_result(result)
+            else:
+                self.future.set_exception(result)
+
+
+class ExportQueue(object):
+    """Write shapes and 2D exports in the background.
+
+    Each job exports a snapshot of the shape - a copy sharing the TShape, so no
+    geometry is copied - so later changes to the location of the original don't
+    change what is written, and the modelling of the next part can overlap with
+    writing the files of the previous one. ``submit`` returns a future of the
+    export's return value, the time taken and any error of every job are kept in
+    ``jobs``.
+
+    OCCT holds the GIL while meshing and writing, so shapes written to files are
+    exported in a pool of worker processes by default. Jobs which can't be sent to
+    another process - ExportDXF/ExportSVG writers and file objects - run in a
+    thread pool.
+
+    Example:
+
+        with ExportQueue() as queue:
+            queue.submit(part, "part.step")
+            queue.submit(part, "part.stl", tolerance=1e-2)
+            svg = ExportSVG()
+            svg.add_shape(Drawing(part).visible_lines)
+            queue.submit(svg, "part.svg")
+            # ... model the next part
+        for job in queue.jobs:
+            print(job)
+
+    Args:
+        workers (int, optional): the maximum number of concurrent exports of each
+            pool. Defaults to None (the number of processors).
+        processes (bool, optional): export shapes to files in worker processes
+            rather than threads. Defaults to True.
+    """
+
+    def __init__(self, workers: Optional[int] = None, processes: bool = True):
+        self.workers = workers
+        self.processes = processes
+        self.jobs: List[ExportJob] = []
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._shutdown = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.shutdown(wait=True)
+
+    def _pool(self, in_process: bool):
+        if in_process:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self.workers)
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(self.workers)
+        return self._thread_pool
+
+    def submit(
+        self,
+        target: Union[Shape, Export2D],
+        file_name: Union[str, os.PathLike, BinaryIO, TextIO],
+        method: str = None,
+        **kwargs,
+    ) -> Future:
+        """Queue an export of target to file_name.
+
+        Args:
+            target (Union[Shape, Export2D]): the shape or the ExportDXF/ExportSVG to
+                write. Writers aren't copied, so don't add to them until the job is
+                done.
+            file_name (Union[str, os.PathLike, BinaryIO, TextIO]): the file or file
+                object to write to
+            method (str, optional): the export method of target, e.g. "export_stl".
+                Defaults to None - from the file suffix for shapes (EXPORT_METHODS)
+                or "write" for 2D exporters.
+            **kwargs: arguments of the export method
+
+        Raises:
+            RuntimeError: the queue has been shut down
+            ValueError: the export method can't be determined from the file name
+
+        Returns:
+            Future: the return value of the export method, or its exception - an
+            OSError if the method returned False or an unsuccessful OCCT status
+        """
+        if self._shutdown:
+            raise RuntimeError("Can't submit exports to a queue that's shut down")
+        if isinstance(target, Shape):
+            if method is None:
+                suffix = (
+                    os.path.splitext(os.fspath(file_name))[1].lower()
+                    if isinstance(file_name, (str, os.PathLike))
+                    else None
+                )
+                if suffix not in EXPORT_METHODS:
+                    raise ValueError(
+                        f"Unable to determine the export method of {file_name!r}, "
+                        f"use one of {sorted(EXPORT_METHODS)} or provide method"
+                    )
+                method = EXPORT_METHODS[suffix]
+            target = copy.copy(target)
+        elif method is None:
+            method = "write"
+
+        in_process = (
+            self.processes
+            and isinstance(target, Shape)
+            and isinstance(file_name, (str, os.PathLike))
+        )
+        job = ExportJob(file_name, method)
+        self.jobs.append(job)
+        outcome = self._pool(in_process).submit(
+            _timed_export, target, method, file_name, kwargs
+        )
+        outcome.add_done_callback(job._finished)
+        job.future.add_done_callback(
+            lambda future: future.cancelled() and outcome.cancel()
+        )
+        return job.future
+
+    def wait(self, timeout: float = None) -> List[ExportJob]:
+        """Wait for the queued jobs to finish, returning all of the jobs"""
+        wait_futures([job.future for job in self.jobs], timeout)
+        return self.jobs
+
+    def errors(self) -> List[ExportJob]:
+        """The finished jobs which failed"""
+        return [job for job in self.jobs if job.error is not None]
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs, optionally waiting for the queued ones to finish"""
+        self._shutdown = True
+        for pool in (self._process_pool, self._thread_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait)
+        self._process_pool = self._thread_pool = None
@@ -34,9 +34,10 @@ from __future__ import annotations
 #   too-many-arguments, too-many-locals, too-many-public-methods,
 #   too-many-statements, too-many-instance-attributes, too-many-branches
 import logging
-from math import degrees, pi, radians
+from math import degrees, pi, radians, sqrt
 from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union, overload
 
+import numpy as np
 from OCP.Bnd import Bnd_Box, Bnd_OBB
 
 # used for getting underlying geometry -- is this equivalent to brep adaptor?
@@ -98,7 +99,9 @@ class Vector:
 
     """
 
-    _wrapped: gp_Vec
+    # The coordinates are stored as Python floats so that arithmetic doesn't have to
+    # cross into OCCT; the gp_Vec is only created when it's needed.
+    __slots__ = ("_x", "_y", "_z", "_wrapped")
 
     @overload
     def __init__(self, x: float, y: float, z: float):  # pragma: no cover
@@ -125,138 +128,145 @@ class Vector:
         ...
 
     def __init__(self, *args):
-        self.vector_index = 0
         if len(args) == 3:
-            f_v = gp_Vec(*args)
+            x_val, y_val, z_val = args
         elif len(args) == 2:
-            f_v = gp_Vec(*args, 0)
+            (x_val, y_val), z_val = args, 0.0
         elif len(args) == 1:
-            if isinstance(args[0], Vector):
-                f_v = gp_Vec(args[0].wrapped.XYZ())
-            elif isinstance(args[0], (tuple, list)):
-                arg = args[0]
-                if len(arg) == 3:
-                    f_v = gp_Vec(*arg)
-                elif len(arg) == 2:
-                    f_v = gp_Vec(*arg, 0)
-            elif isinstance(args[0], (gp_Vec, gp_Pnt, gp_Dir)):
-                f_v = gp_Vec(args[0].XYZ())
-            elif isinstance(args[0], gp_XYZ):
-                f_v = gp_Vec(args[0])
+            arg = args[0]
+            if isinstance(arg, Vector):
+                x_val, y_val, z_val = arg._x, arg._y, arg._z
+            elif isinstance(arg, (tuple, list)) and len(arg) == 3:
+                x_val, y_val, z_val = arg
+            elif isinstance(arg, (tuple, list)) and len(arg) == 2:
+                (x_val, y_val), z_val = arg, 0.0
+            elif isinstance(arg, (gp_Vec, gp_Pnt, gp_Dir, gp_XYZ)):
+                x_val, y_val, z_val = arg.X(), arg.Y(), arg.Z()
             else:
                 raise TypeError("Expected three floats, OCC gp_, or 3-tuple")
         elif len(args) == 0:
-            f_v = gp_Vec(0, 0, 0)
+            x_val, y_val, z_val = 0.0, 0.0, 0.0
         else:
             raise TypeError("Expected three floats, OCC gp_, or 3-tuple")
 
-        self._wrapped = f_v
+        self._x = float(x_val)
+        self._y = float(y_val)
+        self._z = float(z_val)
+        self._wrapped = None
 
-    def __iter__(self):
-        """Initialize to beginning"""
-        self.vector_index = 0
-        return self
+    @classmethod
+    def _from_floats(cls, x_val: float, y_val: float, z_val: float) -> Vector:
+        """Create a Vector from already validated floats bypassing __init__"""
+        vec = object.__new__(cls)
+        vec._x = x_val
+        vec._y = y_val
+        vec._z = z_val
+        vec._wrapped = None
+        return vec
 
-    def __next__(self):
-        """return the next value"""
-        if self.vector_index == 0:
-            self.vector_index += 1
-            value = self.X
-        elif self.vector_index == 1:
-            self.vector_index += 1
-            value = self.Y
-        elif self.vector_index == 2:
-            self.vector_index += 1
-            value = self.Z
-        else:
-            raise StopIteration
-        return value
+    def __iter__(self):
+        """Iterate over the x, y and z values"""
+        return iter((self._x, self._y, self._z))
 
     @property
     def X(self) -> float:
         """Get x value"""
-        return self.wrapped.X()
+        return self._x
 
     @X.setter
     def X(self, value: float) -> None:
         """Set x value"""
-        self.wrapped.SetX(value)
+        self._x = float(value)
+        self._wrapped = None
 
     @property
     def Y(self) -> float:
         """Get y value"""
-        return self.wrapped.Y()
+        return self._y
 
     @Y.setter
     def Y(self, value: float) -> None:
         """Set y value"""
-        self.wrapped.SetY(value)
+        self._y = float(value)
+        self._wrapped = None
 
     @property
     def Z(self) -> float:
         """Get z value"""
-        return self.wrapped.Z()
+        return self._z
 
     @Z.setter
     def Z(self, value: float) -> None:
         """Set z value"""
-        self.wrapped.SetZ(value)
+        self._z = float(value)
+        self._wrapped = None
 
     @property
     def wrapped(self) -> gp_Vec:
         """OCCT object"""
+        if self._wrapped is None:
+            self._wrapped = gp_Vec(self._x, self._y, self._z)
         return self._wrapped
 
     def to_tuple(self) -> tuple[float, float, float]:
         """Return tuple equivalent"""
-        return (self.X, self.Y, self.Z)
+        return (self._x, self._y, self._z)
 
     @property
     def length(self) -> float:
         """Vector length"""
-        return self.wrapped.Magnitude()
+        return sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
 
     def cross(self, vec: Vector) -> Vector:
         """Mathematical cross function"""
-        return Vector(self.wrapped.Crossed(vec.wrapped))
+        return Vector._from_floats(
+            self._y * vec._z - self._z * vec._y,
+            self._z * vec._x - self._x * vec._z,
+            self._x * vec._y - self._y * vec._x,
+        )
 
     def dot(self, vec: Vector) -> float:
         """Mathematical dot function"""
-        return self.wrapped.Dot(vec.wrapped)
+        return self._x * vec._x + self._y * vec._y + self._z * vec._z
 
     def sub(self, vec: VectorLike) -> Vector:
         """Mathematical subtraction function"""
-        if isinstance(vec, Vector):
-            result = Vector(self.wrapped.Subtracted(vec.wrapped))
-        elif isinstance(vec, tuple):
-            result = Vector(self.wrapped.Subtracted(Vector(vec).wrapped))
-        else:
+        if isinstance(vec, tuple):
+            vec = Vector(vec)
+        elif not isinstance(vec, Vector):
             raise ValueError("Only Vectors or tuples can be subtracted from Vectors")
 
-        return result
+        return Vector._from_floats(self._x - vec._x, self._y - vec._y, self._z - vec._z)
 
     def __sub__(self, vec: Vector) -> Vector:
         """Mathematical subtraction function"""
+        if isinstance(vec, Vector):
+            return Vector._from_floats(
+                self._x - vec._x, self._y - vec._y, self._z - vec._z
+            )
         return self.sub(vec)
 
     def add(self, vec: VectorLike) -> Vector:
         """Mathematical addition function"""
-        if isinstance(vec, Vector):
-            result = Vector(self.wrapped.Added(vec.wrapped))
-        elif isinstance(vec, tuple):
-            result = Vector(self.wrapped.Added(Vector(vec).wrapped))
-        else:
+        if isinstance(vec, tuple):
+            vec = Vector(vec)
+        elif not isinstance(vec, Vector):
             raise ValueError("Only Vectors or tuples can be added to Vectors")
 
-        return result
+        return Vector._from_floats(self._x + vec._x, self._y + vec._y, self._z + vec._z)
 
     def __add__(self, vec: Vector) -> Vector:
         """Mathematical addition function"""
+        if isinstance(vec, Vector):
+            return Vector._from_floats(
+                self._x + vec._x, self._y + vec._y, self._z + vec._z
+            )
         return self.add(vec)
 
     def multiply(self, scale: float) -> Vector:
         """Mathematical multiply function"""
-        return Vector(self.wrapped.Multiplied(scale))
+        scale = float(scale)
+        return Vector._from_floats(self._x * scale, self._y * scale, self._z * scale)
 
     def __mul__(self, scale: float) -> Vector:
         """Mathematical multiply function"""
@@ -272,11 +282,14 @@ class Vector:
 
     def normalized(self) -> Vector:
         """Scale to length of 1"""
-        return Vector(self.wrapped.Normalized())
+        length = self.length
+        if length <= 1e-16:  # gp::Resolution(), let OCCT raise the error
+            return Vector(self.wrapped.Normalized())
+        return Vector._from_floats(self._x / length, self._y / length, self._z / length)
 
     def reverse(self) -> Vector:
         """Return a vector with the same magnitude but pointing in the opposite direction"""
-        return self * -1.0
+        return Vector._from_floats(-self._x, -self._y, -self._z)
 
     def center(self) -> Vector:
         """center
@@ -355,7 +368,7 @@ class Vector:
 
     def __neg__(self) -> Vector:
         """Flip direction of vector"""
-        return self * -1
+        return Vector._from_floats(-self._x, -self._y, -self._z)
 
     def __abs__(self) -> float:
         """Vector length"""
@@ -363,11 +376,11 @@ class Vector:
 
     def __repr__(self) -> str:
         """Display vector"""
-        return "Vector: " + str((self.X, self.Y, self.Z))
+        return "Vector: " + str((self._x, self._y, self._z))
 
     def __str__(self) -> str:
         """Display vector"""
-        return "Vector: " + str((self.X, self.Y, self.Z))
+        return "Vector: " + str((self._x, self._y, self._z))
 
     def __eq__(self, other: Vector) -> bool:  # type: ignore[override]
         """Vectors equal"""
@@ -375,19 +388,23 @@ class Vector:
 
     def __copy__(self) -> Vector:
         """Return copy of self"""
-        return Vector(self.X, self.Y, self.Z)
+        return Vector._from_floats(self._x, self._y, self._z)
 
     def __deepcopy__(self, _memo) -> Vector:
         """Return deepcopy of self"""
-        return Vector(self.X, self.Y, self.Z)
+        return Vector._from_floats(self._x, self._y, self._z)
+
+    def __reduce__(self):
+        """Pickle the coordinates only"""
+        return (Vector, (self._x, self._y, self._z))
 
     def to_pnt(self) -> gp_Pnt:
         """Convert to OCCT gp_Pnt object"""
-        return gp_Pnt(self.wrapped.XYZ())
+        return gp_Pnt(self._x, self._y, self._z)
 
     def to_dir(self) -> gp_Dir:
         """Convert to OCCT gp_Dir object"""
-        return gp_Dir(self.wrapped.XYZ())
+        return gp_Dir(self._x, self._y, self._z)
 
     def transform(self, affine_transform: Matrix) -> Vector:
         """Apply affine transformation"""
@@ -482,6 +499,10 @@ class Axis:
         """Return deepcopy of self"""
         return Axis(self.position, self.direction)
 
+    def __reduce__(self):
+        """Pickle the position and direction only"""
+        return (Axis, (self.position, self.direction))
+
     def __repr__(self) -> str:
         """Display self"""
         return f"({self.position.to_tuple()},{self.direction.to_tuple()})"
@@ -837,6 +858,10 @@ class Color:
         """Return deepcopy of self"""
         return Color(*self.to_tuple())
 
+    def __reduce__(self):
+        """Pickle the rgba values only"""
+        return (Color, self.to_tuple())
+
 
 class Location:
     """Location in 3D space. Depending on usage can be absolute or relative.
@@ -1047,6 +1072,10 @@ class Location:
         """Lib/copy.py deep copy"""
         return Location(self.wrapped.Transformation())
 
+    def __reduce__(self):
+        """Pickle the transformation matrix only"""
+        return (LocationArray._to_location, (LocationArray._to_matrix(self),))
+
     def __mul__(self, other: Location) -> Location:
         """Combine locations"""
         if hasattr(other, "wrapped") and not isinstance(
@@ -1057,6 +1086,8 @@ class Location:
             [isinstance(o, Location) for o in other]
         ):
             return [Location(self.wrapped * loc.wrapped) for loc in other]
+        elif isinstance(other, LocationArray):
+            return LocationArray(LocationArray._to_matrix(self) @ other.matrices)
         else:
             return Location(self.wrapped * other.wrapped)
 
@@ -1174,6 +1205,228 @@ class Rot(Location):
 RotationLike = Union[tuple[float, float, float], Rotation]
 
 
+class VectorArray:
+    """VectorArray
+
+    An array of 3D vectors backed by a single (N, 3) numpy array. Arithmetic on the
+    array is vectorized and individual Vector objects are only created when elements
+    are accessed.
+
+    Args:
+        points (Union[np.ndarray, Iterable[VectorLike]], optional): an (N, 3) or (N, 2)
+            array or a sequence of VectorLike. Defaults to None (empty array).
+
+    Raises:
+        ValueError: invalid array shape
+    """
+
+    def __init__(self, points: Union[np.ndarray, Iterable[VectorLike]] = None):
+        if points is None:
+            array = np.empty((0, 3))
+        elif isinstance(points, VectorArray):
+            array = points.array
+        elif isinstance(points, np.ndarray):
+            array = points.astype(np.float64, copy=False)
+        else:
+            array = np.array([Vector(p).to_tuple() for p in points], dtype=np.float64)
+            array = array.reshape(-1, 3)
+        if array.ndim != 2 or array.shape[1] not in (2, 3):
+            raise ValueError(f"Expected an (N, 3) or (N, 2) array, got {array.shape}")
+        if array.shape[1] == 2:
+            array = np.column_stack([array, np.zeros(len(array))])
+        self.array: np.ndarray = array
+
+    @staticmethod
+    def _as_array(other: Union[VectorArray, VectorLike, np.ndarray]) -> np.ndarray:
+        """Convert the other operand of an arithmetic operation to a numpy array"""
+        if isinstance(other, VectorArray):
+            return other.array
+        if isinstance(other, np.ndarray):
+            return other
+        return np.array(Vector(other).to_tuple())
+
+    @property
+    def X(self) -> np.ndarray:
+        """Get x values"""
+        return self.array[:, 0]
+
+    @property
+    def Y(self) -> np.ndarray:
+        """Get y values"""
+        return self.array[:, 1]
+
+    @property
+    def Z(self) -> np.ndarray:
+        """Get z values"""
+        return self.array[:, 2]
+
+    @property
+    def length(self) -> np.ndarray:
+        """Length of each vector"""
+        return np.linalg.norm(self.array, axis=1)
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __iter__(self) -> Iterable[Vector]:
+        """Iterate over the vectors, creating Vector objects on demand"""
+        return (Vector(x, y, z) for x, y, z in self.array.tolist())
+
+    def __getitem__(self, key) -> Union[Vector, VectorArray]:
+        """Index with an int to get a Vector or with a slice, index array or
+        boolean mask to get a VectorArray"""
+        if isinstance(key, (int, np.integer)):
+            return Vector(*self.array[key].tolist())
+        return VectorArray(self.array[key])
+
+    def __add__(self, other: Union[VectorArray, VectorLike, np.ndarray]) -> VectorArray:
+        """Vectorized addition"""
+        return VectorArray(self.array + VectorArray._as_array(other))
+
+    def __sub__(self, other: Union[VectorArray, VectorLike, np.ndarray]) -> VectorArray:
+        """Vectorized subtraction"""
+        return VectorArray(self.array - VectorArray._as_array(other))
+
+    def __mul__(self, scale: Union[float, np.ndarray]) -> VectorArray:
+        """Vectorized multiplication by a scalar or an (N,) array of scalars"""
+        scale = np.asarray(scale, dtype=np.float64)
+        return VectorArray(self.array * (scale[:, None] if scale.ndim == 1 else scale))
+
+    def __rmul__(self, scale: Union[float, np.ndarray]) -> VectorArray:
+        """Vectorized multiplication by a scalar or an (N,) array of scalars"""
+        return self * scale
+
+    def __truediv__(self, denom: Union[float, np.ndarray]) -> VectorArray:
+        """Vectorized division by a scalar or an (N,) array of scalars"""
+        return self * (1.0 / np.asarray(denom, dtype=np.float64))
+
+    def __neg__(self) -> VectorArray:
+        """Flip direction of all vectors"""
+        return VectorArray(-self.array)
+
+    def dot(self, other: Union[VectorArray, VectorLike, np.ndarray]) -> np.ndarray:
+        """Vectorized dot product"""
+        other = np.broadcast_to(VectorArray._as_array(other), self.array.shape)
+        return np.einsum("ij,ij->i", self.array, other)
+
+    def cross(self, other: Union[VectorArray, VectorLike, np.ndarray]) -> VectorArray:
+        """Vectorized cross product"""
+        return VectorArray(np.cross(self.array, VectorArray._as_array(other)))
+
+    def normalized(self) -> VectorArray:
+        """Scale all vectors to length of 1"""
+        return VectorArray(self.array / self.length[:, None])
+
+    def __repr__(self) -> str:
+        return f"VectorArray: {len(self)} vectors"
+
+
+class LocationArray:
+    """LocationArray
+
+    An array of locations backed by a single (N, 4, 4) numpy array of homogeneous
+    transformation matrices. Composition, inversion and filtering are vectorized;
+    the OCCT TopLoc_Location of an element is only created when that element is
+    accessed, e.g. when a shape is placed at it.
+
+    Multiplication follows the conventions of Location:
+
+    * ``Location * LocationArray`` and ``LocationArray * Location`` compose each element
+    * ``LocationArray * LocationArray`` composes every pair, grouped by the left operand
+      (the way nested location contexts combine)
+    * ``LocationArray * Shape`` returns a list of relocated shapes
+
+    Args:
+        locations (Union[np.ndarray, VectorArray, Iterable[Location]], optional): an
+            (N, 4, 4) array of matrices, an (N, 3) array or VectorArray of positions,
+            or a sequence of Location. Defaults to None (empty array).
+
+    Raises:
+        ValueError: invalid array shape
+    """
+
+    def __init__(
+        self, locations: Union[np.ndarray, VectorArray, Iterable[Location]] = None
+    ):
+        if locations is None:
+            matrices = np.empty((0, 4, 4))
+        elif isinstance(locations, LocationArray):
+            matrices = locations.matrices
+        elif isinstance(locations, (np.ndarray, VectorArray)) and (
+            isinstance(locations, VectorArray) or locations.ndim == 2
+        ):
+            positions = VectorArray(locations).array
+            matrices = np.tile(np.eye(4), (len(positions), 1, 1))
+            matrices[:, :3, 3] = positions
+        elif isinstance(locations, np.ndarray):
+            matrices = locations.astype(np.float64, copy=False)
+            if matrices.ndim != 3 or matrices.shape[1:] != (4, 4):
+                raise ValueError(
+                    f"Expected an (N, 4, 4) array of matrices, got {matrices.shape}"
+                )
+        else:
+            matrices = np.array(
+                [LocationArray._to_matrix(loc) for loc in locations], dtype=np.float64
+            ).reshape(-1, 4, 4)
+        self.matrices: np.ndarray = matrices
+
+    @staticmethod
+    def _to_matrix(location: Location) -> np.ndarray:
+        """Extract the 4x4 matrix of a Location"""
+        trsf = location.wrapped.Transformation()
+        return np.array(
+            [[trsf.Value(row, col) for col in range(1, 5)] for row in range(1, 4)]
+            + [[0.0, 0.0, 0.0, 1.0]]
+        )
+
+    @staticmethod
+    def _to_location(matrix: np.ndarray) -> Location:
+        """Create a Location from a 4x4 matrix"""
+        transform = gp_Trsf()
+        transform.SetValues(*matrix[:3].ravel().tolist())
+        return Location(transform)
+
+    @property
+    def positions(self) -> VectorArray:
+        """Position component of all the locations"""
+        return VectorArray(self.matrices[:, :3, 3])
+
+    def __len__(self) -> int:
+        return len(self.matrices)
+
+    def __iter__(self) -> Iterable[Location]:
+        """Iterate over the locations, creating Location objects on demand"""
+        return (LocationArray._to_location(matrix) for matrix in self.matrices)
+
+    def __getitem__(self, key) -> Union[Location, LocationArray]:
+        """Index with an int to get a Location or with a slice, index array or
+        boolean mask to get a LocationArray"""
+        if isinstance(key, (int, np.integer)):
+            return LocationArray._to_location(self.matrices[key])
+        return LocationArray(self.matrices[key])
+
+    def inverse(self) -> LocationArray:
+        """Inverted locations"""
+        return LocationArray(np.linalg.inv(self.matrices))
+
+    def __mul__(self, other: Union[Location, LocationArray, "Shape"]):
+        """Combine locations or relocate a shape to all locations"""
+        if isinstance(other, LocationArray):
+            return LocationArray(
+                (self.matrices[:, None] @ other.matrices[None, :]).reshape(-1, 4, 4)
+            )
+        if isinstance(other, Location):
+            return LocationArray(self.matrices @ LocationArray._to_matrix(other))
+        if hasattr(other, "wrapped") and not isinstance(other, Vector):  # Shape
+            return [loc * other for loc in self]
+        raise TypeError(
+            "LocationArrays can only be multiplied with Locations or Shapes"
+        )
+
+    def __repr__(self) -> str:
+        return f"LocationArray: {len(self)} locations"
+
+
 class Matrix:
     """A 3d , 4x4 transformation matrix.
 
@@ -1598,6 +1851,10 @@ class Plane:
         """Return deepcopy of self"""
         return Plane(gp_Pln(self.wrapped.Position()))
 
+    def __reduce__(self):
+        """Pickle the origin and directions only"""
+        return (Plane, (self.origin, self.x_dir, self.z_dir))
+
     def __eq__(self, other: Plane):
         """Are planes equal"""
         return all(self._eq_iter(other))
@@ -1622,6 +1879,8 @@ class Plane:
             and all([isinstance(o, Location) for o in other])
         ):
             return [self * loc for loc in other]
+        elif isinstance(other, LocationArray):
+            return [self * loc for loc in other]
         elif hasattr(other, "wrapped") and not isinstance(other, Vector):  # Shape
             return self.to_location() * other
 
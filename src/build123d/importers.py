@@ -28,24 +28,204 @@ license:
 # pylint has trouble with the OCP imports
 # pylint: disable=no-name-in-module, import-error
 
+import glob
+import hashlib
 import os
-from math import degrees
+import re
+import tempfile
+from io import BytesIO
+from math import cos, degrees, sin
+from typing import BinaryIO, Callable, Iterable, TextIO, Union
+
+import numpy as np
 from svgpathtools import svg2paths
 from OCP.TopoDS import TopoDS_Face, TopoDS_Shape
 from OCP.BRep import BRep_Builder
+from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
 from OCP.BRepTools import BRepTools
+from OCP.Bnd import Bnd_Box
+from OCP.Geom import Geom_BezierCurve
+from OCP.gp import gp_Pnt
+from OCP.Poly import Poly_Triangle, Poly_Triangulation
+from OCP.BinTools import BinTools
+from OCP.STEPCAFControl import STEPCAFControl_Reader
 from OCP.STEPControl import STEPControl_Reader
+from OCP.StepBasic import StepBasic_ProductDefinition
 import OCP.IFSelect
+from OCP.Standard import Standard_Failure, Standard_OutOfRange
+from OCP.Storage import Storage_StreamReadError
+from OCP.Quantity import Quantity_ColorRGBA
 from OCP.RWStl import RWStl
+from OCP.TColgp import TColgp_Array1OfPnt
+from OCP.TCollection import TCollection_ExtendedString
+from OCP.TDataStd import TDataStd_Name
+from OCP.TDF import TDF_Label, TDF_LabelSequence
+from OCP.TDocStd import TDocStd_Document
+from OCP.XCAFApp import XCAFApp_Application
+from OCP.XCAFDoc import XCAFDoc_ColorType, XCAFDoc_DocumentTool, XCAFDoc_ShapeTool
+
+from build123d.geometry import TOLERANCE, BoundBox, Color, Location, Plane
+from build123d.topology import (
+    BINTOOLS_FORMAT_VERSION,
+    Compound,
+    Edge,
+    Face,
+    Shape,
+    ShapeList,
+    Solid,
+    Wire,
+    _weld_points,
+)
+
+# The exceptions BinTools and BRepTools raise for data they can't read, in OCP
+# these don't derive from Standard_Failure
+BREP_READ_ERRORS = (Standard_Failure, Standard_OutOfRange, Storage_StreamReadError)
+
+
+class ImportCache:
+    """Import Cache
+
+    An on-disk cache of translated imports. Entries are keyed on the SHA-256 hash of
+    the imported file's contents plus the importer and its options, and are stored
+    as binary BRep files which load far faster than translating the file again.
+    When the stored entries exceed max_bytes the least recently used are removed.
+
+    The cache is disabled until a directory is set, either directly or with the
+    BUILD123D_IMPORT_CACHE environment variable.
 
-from build123d.topology import Compound, Edge, Face, Shape, ShapeList
-
+    Args:
+        directory (Union[str, os.PathLike], optional): where to store the entries.
+            Defaults to None (disabled).
+        max_bytes (int, optional): maximum size of the stored entries.
+            Defaults to 1 GiB.
+    """
 
-def import_brep(file_name: str) -> Shape:
+    SUFFIX = ".bbrep"
+
+    def __init__(
+        self, directory: Union[str, os.PathLike] = None, max_bytes: int = 2**30
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_hash(file_name: Union[str, os.PathLike]) -> str:
+        """SHA-256 hash of the contents of a file"""
+        digest = hashlib.sha256()
+        with open(file_name, "rb") as file:
+            for block in iter(lambda: file.read(2**20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def load(
+        self,
+        file_name: Union[str, os.PathLike],
+        importer: str,
+        translate: Callable[[], TopoDS_Shape],
+        options: tuple = (),
+    ) -> TopoDS_Shape:
+        """load
+
+        Load the translation of a file from the cache, translating and storing it
+        if it isn't cached.
+
+        Args:
+            file_name (Union[str, os.PathLike]): file being imported
+            importer (str): name of the importer, e.g. "step"
+            translate (Callable[[], TopoDS_Shape]): translates the file
+            options (tuple, optional): translation options. Defaults to ().
+
+        Returns:
+            TopoDS_Shape: the translated shape
+        """
+        if not self.directory or not os.path.isfile(file_name):
+            return translate()
+
+        # Entries are only valid for the binary format they were written with
+        format_version = int(BINTOOLS_FORMAT_VERSION)
+        options_key = repr((importer, options, format_version)).encode()
+        options_hash = hashlib.sha256(options_key).hexdigest()[:16]
+        entry = os.path.join(
+            self.directory,
+            f"{ImportCache.content_hash(file_name)}-{options_hash}{ImportCache.SUFFIX}",
+        )
+
+        if os.path.isfile(entry):
+            shape = TopoDS_Shape()
+            try:
+                BinTools.Read_s(shape, entry)
+            except BREP_READ_ERRORS:
+                shape = TopoDS_Shape()
+            if not shape.IsNull():
+                os.utime(entry)  # mark as recently used
+                self.hits += 1
+                return shape
+
+        self.misses += 1
+        shape = translate()
+        self._store(entry, shape)
+        return shape
+
+    def _store(self, entry: str, shape: TopoDS_Shape):
+        """Atomically write an entry and evict the least recently used ones"""
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temporary_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(handle)
+        try:
+            if not BinTools.Write_s(
+                shape, temporary_name, True, False, BINTOOLS_FORMAT_VERSION
+            ):
+                raise OSError(f"Could not write {temporary_name}")
+            os.replace(temporary_name, entry)
+        except OSError:
+            os.remove(temporary_name)
+            return
+
+        entries = sorted(
+            (os.stat(path).st_mtime, os.path.getsize(path), path)
+            for path in self._entries()
+        )
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            os.remove(path)
+            size -= entry_size
+
+    def _entries(self, content_hash: str = "") -> list[str]:
+        """Paths of the stored entries, optionally of one file's contents"""
+        pattern = f"{content_hash}*{ImportCache.SUFFIX}"
+        return glob.glob(os.path.join(self.directory, pattern))
+
+    def invalidate(self, file_name: Union[str, os.PathLike]):
+        """Remove the cached translations of the current contents of a file"""
+        if self.directory and os.path.isfile(file_name):
+            for path in self._entries(ImportCache.content_hash(file_name) + "-"):
+                os.remove(path)
+
+    def clear(self):
+        """Remove all of the cached translations"""
+        if self.directory:
+            for path in self._entries():
+                os.remove(path)
+        self.hits = 0
+        self.misses = 0
+
+
+#: Cache used by import_brep, import_step and import_stl
+import_cache = ImportCache(os.environ.get("BUILD123D_IMPORT_CACHE"))
+
+
+def import_brep(file_name: Union[str, os.PathLike, bytes, BinaryIO]) -> Shape:
     """Import shape from a BREP file
 
+    Both the text and the binary (BinTools) formats are read.
+
     Args:
-        file_name (str): brep file
+        file_name (Union[str, os.PathLike, bytes, BinaryIO]): brep file, its contents
+            or a binary file object
 
     Raises:
         ValueError: file not found
@@ -53,24 +233,48 @@ def import_brep(file_name: str) -> Shape:
     Returns:
         Shape: build123d object
     """
-    shape = TopoDS_Shape()
-    builder = BRep_Builder()
-
-    BRepTools.Read_s(shape, file_name, builder)
+    if isinstance(file_name, (str, os.PathLike)):
+        source = os.fspath(file_name)
+        try:
+            with open(source, "rb") as brep_file:
+                header = brep_file.read(64)
+        except OSError as exc:
+            raise ValueError(f"Could not import {file_name}") from exc
+    else:
+        source = BytesIO(
+            file_name if isinstance(file_name, bytes) else file_name.read()
+        )
+        header = source.getvalue()[:64]
+    # Only the binary format header starts with "Open CASCADE Topology"
+    binary = b"Open CASCADE Topology" in header
+
+    def translate() -> TopoDS_Shape:
+        shape = TopoDS_Shape()
+        try:
+            if binary:
+                BinTools.Read_s(shape, source)
+            else:
+                BRepTools.Read_s(shape, source, BRep_Builder())
+        except BREP_READ_ERRORS as exc:
+            raise ValueError(f"Could not import {file_name}") from exc
 
-    if shape.IsNull():
-        raise ValueError(f"Could not import {file_name}")
+        if shape.IsNull():
+            raise ValueError(f"Could not import {file_name}")
+        return shape
 
-    return Shape.cast(shape)
+    if binary or not isinstance(source, str):
+        return Shape.cast(translate())
+    return Shape.cast(import_cache.load(source, "brep", translate))
 
 
-def import_step(file_name: str) -> Compound:
+def import_step(file_name: Union[str, os.PathLike, bytes, BinaryIO]) -> Compound:
     """import_step
 
     Extract shapes from a STEP file and return them as a Compound object.
 
     Args:
-        file_name (str): file path of STEP file to import
+        file_name (Union[str, os.PathLike, bytes, BinaryIO]): file path of STEP file
+            to import, its contents or a binary file object
 
     Raises:
         ValueError: can't open file
@@ -78,33 +282,208 @@ def import_step(file_name: str) -> Compound:
     Returns:
         Compound: contents of STEP file
     """
-    # Now read and return the shape
-    reader = STEPControl_Reader()
-    read_status = reader.ReadFile(file_name)
-    if read_status != OCP.IFSelect.IFSelect_RetDone:
-        raise ValueError(f"STEP File {file_name} could not be loaded")
-    for i in range(reader.NbRootsForTransfer()):
-        reader.TransferRoot(i + 1)
 
-    occ_shapes = []
-    for i in range(reader.NbShapes()):
-        occ_shapes.append(reader.Shape(i + 1))
+    is_path = isinstance(file_name, (str, os.PathLike))
+    name = os.fspath(file_name) if is_path else "stream"
+
+    def translate() -> TopoDS_Shape:
+        # Now read and return the shape
+        reader = STEPControl_Reader()
+        if is_path:
+            read_status = reader.ReadFile(name)
+        else:
+            stream = BytesIO(file_name) if isinstance(file_name, bytes) else file_name
+            read_status = reader.ReadStream(name, stream)
+        if read_status != OCP.IFSelect.IFSelect_RetDone:
+            raise ValueError(f"STEP File {name} could not be loaded")
+        for i in range(reader.NbRootsForTransfer()):
+            reader.TransferRoot(i + 1)
+
+        occ_shapes = []
+        for i in range(reader.NbShapes()):
+            occ_shapes.append(reader.Shape(i + 1))
+
+        # Make sure that we extract all the solids
+        solids = []
+        for shape in occ_shapes:
+            solids.append(Shape.cast(shape))
+
+        return Compound.make_compound(solids).wrapped
+
+    if not is_path:
+        return Compound(translate())
+    return Compound(import_cache.load(name, "step", translate))
+
 
-    # Make sure that we extract all the solids
-    solids = []
-    for shape in occ_shapes:
-        solids.append(Shape.cast(shape))
+class StepAssembly:
+    """STEP Assembly
 
-    return Compound.make_compound(solids)
+    A parsed STEP file whose root products are transferred on demand into build123d
+    assemblies. Each assembly is a Compound whose children carry the names, colors
+    and locations of the STEP product structure; instances of a part share its
+    geometry (TShape). Transferring only the roots that are needed avoids building
+    the geometry of the rest of the file.
 
+    Args:
+        file_name (Union[str, os.PathLike, bytes, BinaryIO]): path of the STEP file,
+            its contents or a binary file object
+
+    Raises:
+        ValueError: can't read the file
+    """
+
+    def __init__(self, file_name: Union[str, os.PathLike, bytes, BinaryIO]):
+        self.reader = STEPCAFControl_Reader()
+        self.reader.SetColorMode(True)
+        self.reader.SetNameMode(True)
+        if isinstance(file_name, (str, os.PathLike)):
+            name = os.fspath(file_name)
+            read_status = self.reader.ReadFile(name)
+        else:
+            name = "stream"
+            stream = BytesIO(file_name) if isinstance(file_name, bytes) else file_name
+            read_status = self.reader.ReadStream(name, stream)
+        if read_status != OCP.IFSelect.IFSelect_RetDone:
+            raise ValueError(f"STEP File {name} could not be loaded")
+
+        self.doc = TDocStd_Document(TCollection_ExtendedString("XmlOcaf"))
+        XCAFApp_Application.GetApplication_s().InitDocument(self.doc)
+        self._shape_tool = XCAFDoc_DocumentTool.ShapeTool_s(self.doc.Main())
+        self._color_tool = XCAFDoc_DocumentTool.ColorTool_s(self.doc.Main())
+        self._assemblies: dict[int, Shape] = {}
+
+    @property
+    def roots(self) -> list[str]:
+        """Names of the root products, available without transferring them"""
+        step_reader = self.reader.ChangeReader()
+        names = []
+        for i in range(1, step_reader.NbRootsForTransfer() + 1):
+            entity = step_reader.RootForTransfer(i)
+            if isinstance(entity, StepBasic_ProductDefinition):
+                names.append(entity.Formation().OfProduct().Name().ToCString())
+            else:
+                names.append("")
+        return names
+
+    def transfer(self, root: Union[int, str] = 0) -> Shape:
+        """transfer
+
+        Transfer one root product of the file, reusing previous transfers.
+
+        Args:
+            root (Union[int, str], optional): index or name of the root.
+                Defaults to 0.
+
+        Raises:
+            ValueError: unknown root or the transfer failed
+
+        Returns:
+            Shape: a Compound with children for an assembly, otherwise the part
+        """
+        index = self.roots.index(root) if isinstance(root, str) else root
+        if not 0 <= index < self.reader.NbRootsForTransfer():
+            raise ValueError(f"STEP root {root} not found")
+
+        if index not in self._assemblies:
+            transferred = self._free_labels()
+            if not self.reader.TransferOneRoot(index + 1, self.doc):
+                raise ValueError(f"STEP root {root} could not be transferred")
+            new_labels = [
+                label
+                for tag, label in self._free_labels().items()
+                if tag not in transferred
+            ]
+            shapes = [self._build(label, label) for label in new_labels]
+            self._assemblies[index] = (
+                shapes[0] if len(shapes) == 1 else Compound(children=shapes)
+            )
+        return self._assemblies[index]
+
+    def _free_labels(self) -> dict[int, TDF_Label]:
+        """The top level labels of the document by tag"""
+        labels = TDF_LabelSequence()
+        self._shape_tool.GetFreeShapes(labels)
+        return {
+            labels.Value(i).Tag(): labels.Value(i)
+            for i in range(1, labels.Length() + 1)
+        }
+
+    def _build(self, label: TDF_Label, part: TDF_Label) -> Shape:
+        """Create the build123d object of an instance label and its part label"""
+        if XCAFDoc_ShapeTool.IsAssembly_s(part):
+            components = TDF_LabelSequence()
+            XCAFDoc_ShapeTool.GetComponents_s(part, components)
+            children = []
+            for i in range(1, components.Length() + 1):
+                component = components.Value(i)
+                referred = TDF_Label()
+                XCAFDoc_ShapeTool.GetReferredShape_s(component, referred)
+                children.append(self._build(component, referred))
+            shape = Compound(children=children)
+            shape.location = Location(XCAFDoc_ShapeTool.GetLocation_s(label))
+        else:
+            # Component shapes are located instances of the part's TShape
+            shape = Shape.cast(XCAFDoc_ShapeTool.GetShape_s(label))
+
+        shape.label = self._name(label) or self._name(part)
+        color = Quantity_ColorRGBA()
+        for color_label in [label, part]:
+            if self._color_tool.GetColor(
+                color_label, XCAFDoc_ColorType.XCAFDoc_ColorSurf, color
+            ) or self._color_tool.GetColor(
+                color_label, XCAFDoc_ColorType.XCAFDoc_ColorGen, color
+            ):
+                rgb = color.GetRGB()
+                shape.color = Color(rgb.Red(), rgb.Green(), rgb.Blue(), color.Alpha())
+                break
+        return shape
+
+    @staticmethod
+    def _name(label: TDF_Label) -> str:
+        name = TDataStd_Name()
+        if label.FindAttribute(TDataStd_Name.GetID_s(), name):
+            return name.Get().ToExtString()
+        return ""
+
+
+def import_step_assembly(
+    file_name: Union[str, os.PathLike, bytes, BinaryIO],
+    roots: Iterable[Union[int, str]] = None,
+) -> Shape:
+    """import_step_assembly
+
+    Import the assembly structure, names, colors and locations of a STEP file. Use
+    StepAssembly directly to list the roots of the file before transferring them.
 
-def import_stl(file_name: str) -> Face:
+    Args:
+        file_name (Union[str, os.PathLike, bytes, BinaryIO]): path of the STEP file,
+            its contents or a binary file object
+        roots (Iterable[Union[int, str]], optional): indices or names of the root
+            products to transfer. Defaults to None (all).
+
+    Raises:
+        ValueError: can't read the file or a root
+
+    Returns:
+        Shape: the transferred root, or a Compound with one child per root
+    """
+    step_assembly = StepAssembly(file_name)
+    if roots is None:
+        roots = range(len(step_assembly.roots))
+    shapes = [step_assembly.transfer(root) for root in roots]
+    return shapes[0] if len(shapes) == 1 else Compound(children=shapes)
+
+
+def import_stl(file_name: Union[str, os.PathLike, bytes, BinaryIO]) -> Face:
     """import_stl
 
-    Extract shape from an STL file and return them as a Face object.
+    Extract shape from an STL file and return them as a Face object. OCCT can only
+    read STL files from disk so contents and file objects are read with
+    import_stl_mesh instead.
 
     Args:
-        file_name (str): file path of STL file to import
+        file_name (Union[str, os.PathLike, bytes, BinaryIO]): file path of STL file
+            to import, its contents or a binary file object
 
     Raises:
         ValueError: Could not import file
@@ -112,22 +491,195 @@ def import_stl(file_name: str) -> Face:
     Returns:
         Face: contents of STL file
     """
-    # Now read and return the shape
-    reader = RWStl.ReadFile_s(file_name)
-    face = TopoDS_Face()
 
-    BRep_Builder().MakeFace(face, reader)
+    if not isinstance(file_name, (str, os.PathLike)):
+        return import_stl_mesh(file_name).to_face()
+    file_name = os.fspath(file_name)
+
+    def translate() -> TopoDS_Shape:
+        # Now read and return the shape
+        reader = RWStl.ReadFile_s(file_name)
+        face = TopoDS_Face()
+
+        BRep_Builder().MakeFace(face, reader)
+        return face
+
+    return Face.cast(import_cache.load(file_name, "stl", translate))
+
+
+# Binary STL: 80 byte header, uint32 triangle count and 50 byte facets
+STL_HEADER_SIZE = 84
+STL_FACET = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+_STL_ASCII_FACET = re.compile(
+    rb"facet\s+normal\s+(\S+)\s+(\S+)\s+(\S+)\s+outer\s+loop"
+    + rb"\s+vertex\s+(\S+)\s+(\S+)\s+(\S+)" * 3
+)
 
-    return Face.cast(face)
 
+class StlMesh:
+    """STL Mesh
 
-def import_svg_as_buildline_code(file_name: str) -> tuple[str, str]:
+    The triangles of an STL file as NumPy arrays. Binary files are memory-mapped so
+    the facets are only read from disk when they are used, ASCII files are parsed in
+    chunks. The welded indexed mesh, the bounding box and a Face are created on
+    demand.
+
+    Args:
+        triangle_vertices (np.ndarray): (M, 3, 3) float32 corners of each triangle
+        normals (np.ndarray): (M, 3) float32 facet normals
+    """
+
+    def __init__(self, triangle_vertices: np.ndarray, normals: np.ndarray):
+        self.triangle_vertices = triangle_vertices
+        self.normals = normals
+        self._face: Face = None
+
+    def __len__(self) -> int:
+        return len(self.triangle_vertices)
+
+    def arrays(
+        self, weld: bool = True, weld_tolerance: float = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Indexed mesh arrays
+
+        The vertices and triangles in the format of Shape.tessellate_arrays. STL
+        repeats the corners of adjacent triangles so by default the coincident ones
+        are merged, which also removes the triangles that collapse.
+
+        Args:
+            weld (bool, optional): merge identical vertices. Defaults to True.
+            weld_tolerance (float, optional): also merge vertices within this
+                distance of each other. Defaults to None.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (N, 3) float64 vertices and (M, 3) int32
+            vertex indices of the triangles
+        """
+        vertices = np.asarray(self.triangle_vertices).reshape(-1, 3)
+        if not weld:
+            triangles = np.arange(len(vertices), dtype=np.int32).reshape(-1, 3)
+            return vertices.astype(np.float64), triangles
+
+        keep, remap = _weld_points(vertices, weld_tolerance)
+        triangles = remap.reshape(-1, 3).astype(np.int32)
+        valid = (
+            (triangles[:, 0] != triangles[:, 1])
+            & (triangles[:, 1] != triangles[:, 2])
+            & (triangles[:, 2] != triangles[:, 0])
+        )
+        return vertices[keep].astype(np.float64), triangles[valid]
+
+    def bounding_box(self) -> BoundBox:
+        """Axis aligned bounding box of the vertices"""
+        bounding_box = Bnd_Box()
+        if len(self):
+            vertices = self.triangle_vertices
+            low = vertices.min(axis=(0, 1)).tolist()
+            high = vertices.max(axis=(0, 1)).tolist()
+            bounding_box.Update(*low, *high)
+        return BoundBox(bounding_box)
+
+    def to_solid(
+        self, tolerance: float = 1e-5, angular_tolerance: float = 1e-5
+    ) -> Solid:
+        """The closed mesh as a Solid with merged planar faces, see Solid.from_mesh"""
+        return Solid.from_mesh(*self.arrays(), tolerance, angular_tolerance)
+
+    def to_face(self) -> Face:
+        """The welded mesh as a Face holding only a triangulation, like import_stl"""
+        if self._face is None:
+            vertices, triangles = self.arrays()
+            triangulation = Poly_Triangulation(len(vertices), len(triangles), False)
+            for i, (x_val, y_val, z_val) in enumerate(vertices.tolist(), start=1):
+                triangulation.SetNode(i, gp_Pnt(x_val, y_val, z_val))
+            for i, (i_1, i_2, i_3) in enumerate((triangles + 1).tolist(), start=1):
+                triangulation.SetTriangle(i, Poly_Triangle(i_1, i_2, i_3))
+            face = TopoDS_Face()
+            BRep_Builder().MakeFace(face, triangulation)
+            self._face = Face(face)
+        return self._face
+
+
+def import_stl_mesh(
+    file_name: Union[str, os.PathLike, bytes, BinaryIO], chunk_size: int = 2**24
+) -> StlMesh:
+    """import_stl_mesh
+
+    Read an STL file into NumPy arrays without creating any OCCT objects. Binary
+    files are memory-mapped, binary contents are used in place and ASCII files are
+    parsed chunk_size bytes at a time.
+
+    Args:
+        file_name (Union[str, os.PathLike, bytes, BinaryIO]): file path of STL file
+            to import, its contents or a binary file object
+        chunk_size (int, optional): bytes of an ASCII file parsed at once.
+            Defaults to 16 MiB.
+
+    Raises:
+        ValueError: Could not import file
+
+    Returns:
+        StlMesh: the triangles of the STL file
+    """
+    is_path = isinstance(file_name, (str, os.PathLike))
+    if is_path:
+        name = os.fspath(file_name)
+        file_size = os.path.getsize(name)
+        with open(name, "rb") as stl_file:
+            header = stl_file.read(STL_HEADER_SIZE)
+    else:
+        name = "stream"
+        contents = file_name if isinstance(file_name, bytes) else file_name.read()
+        file_size = len(contents)
+        header = contents[:STL_HEADER_SIZE]
+    if len(header) == STL_HEADER_SIZE:
+        count = int(np.frombuffer(header, "<u4", 1, 80)[0])
+        # ASCII files start with "solid" but so do some binary ones
+        if file_size == STL_HEADER_SIZE + count * STL_FACET.itemsize:
+            if count == 0:
+                facets = np.zeros(0, dtype=STL_FACET)
+            elif is_path:
+                facets = np.memmap(name, STL_FACET, "r", STL_HEADER_SIZE, (count,))
+            else:
+                facets = np.frombuffer(contents, STL_FACET, count, STL_HEADER_SIZE)
+            return StlMesh(facets["vertices"], facets["normal"])
+
+    if not header.lstrip().startswith(b"solid"):
+        raise ValueError(f"STL File {name} could not be loaded")
+
+    values = []
+    with open(name, "rb") if is_path else BytesIO(contents) as stl_file:
+        remainder = b""
+        while True:
+            chunk = stl_file.read(chunk_size)
+            text = remainder + chunk
+            if chunk:
+                # Keep the last, possibly incomplete, facet for the next chunk
+                end = text.rfind(b"endfacet")
+                end = 0 if end < 0 else end + len(b"endfacet")
+                text, remainder = text[:end], text[end:]
+            if text:
+                facets = _STL_ASCII_FACET.findall(text)
+                if facets:
+                    values.append(np.array(facets).astype(np.float32))
+            if not chunk:
+                break
+    values = np.concatenate(values) if values else np.zeros((0, 12), np.float32)
+    return StlMesh(values[:, 3:].reshape(-1, 3, 3), values[:, :3])
+
+
+def import_svg_as_buildline_code(
+    file_name: Union[str, os.PathLike, bytes, BinaryIO, TextIO],
+) -> tuple[str, str]:
     """translate_to_buildline_code
 
     Translate the contents of the given svg file into executable build123d/BuildLine code.
 
     Args:
-        file_name (str): svg file name
+        file_name (Union[str, os.PathLike, bytes, BinaryIO, TextIO]): svg file name,
+            its contents or a file object
 
     Returns:
         tuple[str, str]: code, builder instance name
@@ -148,8 +700,11 @@ def import_svg_as_buildline_code(file_name: str) -> tuple[str, str]:
             "sweep",
         ],
     }
-    paths, _path_attributes = svg2paths(file_name)
-    builder_name = file_name.split(".")[0]
+    paths, _path_attributes = _svg_paths(file_name)
+    if isinstance(file_name, (str, os.PathLike)):
+        builder_name = os.fspath(file_name).split(".")[0]
+    else:
+        builder_name = "svg"
     buildline_code = [
         "from build123d import *",
         f"with BuildLine() as {builder_name}:",
@@ -189,23 +744,144 @@ def import_svg_as_buildline_code(file_name: str) -> tuple[str, str]:
     return ("\n".join(buildline_code), builder_name)
 
 
-def import_svg(file_name: str) -> ShapeList[Edge]:
+def _svg_paths(file_name: Union[str, os.PathLike, bytes, BinaryIO, TextIO]) -> tuple:
+    """The svgpathtools paths and attributes of an svg file, its contents or a file
+    object"""
+    if isinstance(file_name, (str, os.PathLike)):
+        if not os.path.exists(file_name):
+            raise ValueError(f"{file_name} not found")
+        return svg2paths(os.fspath(file_name))
+    return svg2paths(BytesIO(file_name) if isinstance(file_name, bytes) else file_name)
+
+
+def _svg_segment_to_edge(segment) -> Union[Edge, None]:
+    """Convert a single svgpathtools segment directly into an OCCT based Edge,
+    returning None for degenerate (zero length) segments"""
+    class_name = type(segment).__name__
+    if class_name == "Arc":
+        if (
+            abs(segment.end - segment.start) < TOLERANCE
+            or segment.radius.real * segment.radius.imag == 0
+        ):
+            return None
+        plane = Plane(
+            origin=(segment.center.real, segment.center.imag),
+            x_dir=(cos(segment.phi), sin(segment.phi)),
+            z_dir=(0, 0, 1),
+        )
+        # A clockwise arc (sweep-flag 0) is the counter clockwise arc from its end
+        # to its start, reversed to run from the start of the segment
+        start_angle = segment.theta + min(segment.delta, 0)
+        end_angle = segment.theta + max(segment.delta, 0)
+        arc = Edge.make_ellipse(
+            segment.radius.real, segment.radius.imag, plane, start_angle, end_angle
+        )
+        return Edge(arc.wrapped.Reversed()) if segment.delta < 0 else arc
+
+    points = [segment.start, segment.end]
+    if class_name == "CubicBezier":
+        points[1:1] = [segment.control1, segment.control2]
+    elif class_name == "QuadraticBezier":
+        points[1:1] = [segment.control]
+    elif class_name != "Line":
+        raise ValueError(f"Unsupported svg segment type {class_name}")
+    if all(abs(point - points[0]) < TOLERANCE for point in points):
+        return None
+
+    if class_name == "Line":
+        return Edge(
+            BRepBuilderAPI_MakeEdge(
+                gp_Pnt(points[0].real, points[0].imag, 0),
+                gp_Pnt(points[1].real, points[1].imag, 0),
+            ).Edge()
+        )
+    poles = TColgp_Array1OfPnt(1, len(points))
+    for i, point in enumerate(points):
+        poles.SetValue(i + 1, gp_Pnt(point.real, point.imag, 0))
+    return Edge(BRepBuilderAPI_MakeEdge(Geom_BezierCurve(poles)).Edge())
+
+
+def _svg_faces(wires: Iterable[Wire]) -> ShapeList[Face]:
+    """Group closed wires into faces, using the nesting depth of each wire to decide
+    whether it is an outer boundary (even depth) or a hole (odd depth)"""
+    faces = sorted(
+        (Face.make_from_wires(wire) for wire in wires if wire.is_closed()),
+        key=lambda face: face.area,
+        reverse=True,
+    )
+    boxes = [face.bounding_box() for face in faces]
+    mins = np.array([(box.min.X, box.min.Y) for box in boxes]).reshape(-1, 2)
+    maxs = np.array([(box.max.X, box.max.Y) for box in boxes]).reshape(-1, 2)
+    parents: list[Union[int, None]] = []
+    depths: list[int] = []
+    for i, face in enumerate(faces):
+        point = face.outer_wire().position_at(0)
+        # only faces whose bounding box encloses this one can contain it
+        candidates = np.flatnonzero(
+            np.all(mins[:i] <= mins[i] + TOLERANCE, axis=1)
+            & np.all(maxs[:i] >= maxs[i] - TOLERANCE, axis=1)
+        )
+        containing = [j for j in candidates.tolist() if faces[j].is_inside(point)]
+        # faces are sorted by decreasing area so the last one is the innermost
+        parents.append(containing[-1] if containing else None)
+        depths.append(len(containing))
+
+    holes: dict[int, list[Wire]] = {
+        i: [] for i, depth in enumerate(depths) if depth % 2 == 0
+    }
+    for i, depth in enumerate(depths):
+        if depth % 2 == 1:
+            holes[parents[i]].append(faces[i].outer_wire())
+    return ShapeList(
+        (
+            Face.make_from_wires(faces[i].outer_wire(), inner_wires)
+            if inner_wires
+            else faces[i]
+        )
+        for i, inner_wires in holes.items()
+    )
+
+
+def import_svg(
+    file_name: Union[str, os.PathLike, bytes, BinaryIO, TextIO],
+    as_wires: bool = False,
+    as_faces: bool = False,
+) -> ShapeList[Union[Edge, Wire, Face]]:
     """import_svg
 
-    Get a ShapeList of Edge from the paths in the provided svg file.
+    Get a ShapeList of Edge from the paths in the provided svg file. Each svg segment
+    is converted directly into an OCCT Edge, lines, cubic and quadratic Béziers and
+    elliptical arcs are supported.
+
+    Optionally the Edges of each continuous sub-path can be assembled into a Wire,
+    and closed Wires grouped into Faces where Wires nested inside an odd number
+    of other Wires become holes.
 
     Args:
-        filepath (str): svg file
+        file_name (Union[str, os.PathLike, bytes, BinaryIO, TextIO]): svg file, its
+            contents or a file object
+        as_wires (bool, optional): return one Wire per continuous sub-path.
+            Defaults to False.
+        as_faces (bool, optional): return Faces (with holes) built from the closed
+            sub-paths. Defaults to False.
 
     Raises:
         ValueError: File not found
 
     Returns:
-        ShapeList[Edge]: Edges in svg file
+        ShapeList[Union[Edge, Wire, Face]]: Edges, Wires or Faces in svg file
     """
-    if not os.path.exists(file_name):
-        raise ValueError(f"{file_name} not found")
-    svg_code, builder_name = import_svg_as_buildline_code(file_name)
-    ex_locals = {}
-    exec(svg_code, None, ex_locals)
-    return ex_locals[builder_name].edges()
+    paths, _path_attributes = _svg_paths(file_name)
+
+    if not (as_wires or as_faces):
+        edges = (_svg_segment_to_edge(segment) for path in paths for segment in path)
+        return ShapeList(edge for edge in edges if edge is not None)
+
+    wires = ShapeList()
+    for path in paths:
+        for sub_path in path.continuous_subpaths():
+            edges = [_svg_segment_to_edge(segment) for segment in sub_path]
+            edges = [edge for edge in edges if edge is not None]
+            if edges:
+                wires.append(Wire.make_wire(edges))
+    return _svg_faces(wires) if as_faces else wires
@@ -23,19 +23,91 @@ license:
 
 """
 # pylint: disable=no-name-in-module
-from typing import Dict, Any, List
+from base64 import b64encode
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from json import dumps
 
+import numpy as np
 from IPython.display import Javascript
+from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS_Shape
 
 from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
 
-from build123d.topology import Shape
+from build123d.geometry import Color, LocationArray
+from build123d.topology import (
+    Compound,
+    Shape,
+    TessellationCache,
+    tessellation_cache,
+)
 
 DEFAULT_COLOR = [1, 0.8, 0, 1]
 
+# Level of detail of the binary meshes
+DEFAULT_MAX_TRIANGLES = 200_000
+LOD_STEPS = 4
+MAX_ANGULAR_TOLERANCE = 1.0
+
+# numpy dtype -> JavaScript typed array
+TYPED_ARRAYS = {
+    np.dtype(np.int8): "Int8Array",
+    np.dtype(np.int16): "Int16Array",
+    np.dtype(np.uint16): "Uint16Array",
+    np.dtype(np.uint32): "Uint32Array",
+    np.dtype(np.float32): "Float32Array",
+}
+
 TEMPLATE_RENDER = """
 
+function decode(data, type){{
+    // base64 string to a typed array of the given type, e.g. "Float32Array"
+    const binary = atob(data);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++){{
+        bytes[i] = binary.charCodeAt(i);
+    }};
+    return new window[type](bytes.buffer);
+}};
+
+function to_polydata(mesh){{
+    // dequantize the vertices and normals of a binary mesh into a vtkPolyData
+    const vertices = decode(mesh.vertices, mesh.vertex_type);
+    const points = new Float32Array(vertices.length);
+    for (let i = 0; i < vertices.length; i++){{
+        points[i] = vertices[i] * mesh.scale + mesh.offset[i % 3];
+    }};
+
+    const triangles = decode(mesh.triangles, mesh.index_type);
+    const polys = new Uint32Array(triangles.length / 3 * 4);
+    for (let i = 0; i < triangles.length / 3; i++){{
+        polys[4*i] = 3;
+        polys[4*i+1] = triangles[3*i];
+        polys[4*i+2] = triangles[3*i+1];
+        polys[4*i+3] = triangles[3*i+2];
+    }};
+
+    const polydata = vtk.Common.DataModel.vtkPolyData.newInstance();
+    polydata.getPoints().setData(points, 3);
+    polydata.getPolys().setData(polys);
+
+    if (mesh.normals !== undefined){{
+        const encoded = decode(mesh.normals, mesh.normal_type);
+        const normals = new Float32Array(encoded.length);
+        const scale = mesh.normal_type === "Int8Array" ? 1/127 : 1;
+        for (let i = 0; i < encoded.length; i++){{
+            normals[i] = encoded[i] * scale;
+        }};
+        polydata.getPointData().setNormals(
+            vtk.Common.Core.vtkDataArray.newInstance({{
+                name: "Normals", numberOfComponents: 3, values: normals
+            }})
+        );
+    }};
+    return polydata;
+}};
+
 function render(data, parent_element, ratio){{
 
     // Initial setup
@@ -43,21 +115,25 @@ function render(data, parent_element, ratio){{
     const renderer = vtk.Rendering.Core.vtkRenderer.newInstance({{ background: [1, 1, 1 ] }});
     renderWindow.addRenderer(renderer);
 
+    // decode the meshes shared by the instances of a binary payload
+    var meshes = (data.meshes || []).map(to_polydata);
+    var elements = Array.isArray(data) ? data : data.instances;
+
     // iterate over all children children
-    for (var el of data){{
-        var trans = el.position;
-        var rot = el.orientation;
+    for (var el of elements){{
         var rgba = el.color;
-        var shape = el.shape;
-
-        // load the inline data
-        var reader = vtk.IO.XML.vtkXMLPolyDataReader.newInstance();
-        const textEncoder = new TextEncoder();
-        reader.parseAsArrayBuffer(textEncoder.encode(shape));
 
         // setup actor,mapper and add
         const mapper = vtk.Rendering.Core.vtkMapper.newInstance();
-        mapper.setInputConnection(reader.getOutputPort());
+        if (el.shape !== undefined){{
+            // load the inline data
+            var reader = vtk.IO.XML.vtkXMLPolyDataReader.newInstance();
+            const textEncoder = new TextEncoder();
+            reader.parseAsArrayBuffer(textEncoder.encode(el.shape));
+            mapper.setInputConnection(reader.getOutputPort());
+        }}else{{
+            mapper.setInputData(meshes[el.mesh]);
+        }};
         mapper.setResolveCoincidentTopologyToPolygonOffset();
         mapper.setResolveCoincidentTopologyPolygonOffsetParameters(0.5,100);
 
@@ -68,11 +144,16 @@ function render(data, parent_element, ratio){{
         actor.getProperty().setColor(rgba.slice(0,3));
         actor.getProperty().setOpacity(rgba[3]);
 
-        actor.rotateZ(rot[2]*180/Math.PI);
-        actor.rotateY(rot[1]*180/Math.PI);
-        actor.rotateX(rot[0]*180/Math.PI);
-
-        actor.setPosition(trans);
+        if (el.matrix !== undefined){{
+            actor.setUserMatrix(el.matrix);
+        }}else{{
+            var trans = el.position;
+            var rot = el.orientation;
+            actor.rotateZ(rot[2]*180/Math.PI);
+            actor.rotateY(rot[1]*180/Math.PI);
+            actor.rotateX(rot[0]*180/Math.PI);
+            actor.setPosition(trans);
+        }};
 
         renderer.addActor(actor);
 
@@ -191,21 +272,224 @@ def to_vtkpoly_string(
     return writer.GetOutputString()
 
 
-def display(shape):
-    payload: List[Dict[str, Any]] = []
+def _encode(array: np.ndarray) -> str:
+    """Base64 of the little endian bytes of array"""
+    return b64encode(
+        np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+    ).decode("ascii")
+
 
-    if isinstance(shape, Shape):
-        payload.append(
-            dict(
-                shape=to_vtkpoly_string(shape),
-                color=DEFAULT_COLOR,
-                position=[0, 0, 0],
-                orientation=[0, 0, 0],
+def _leaves(
+    shape: Shape, matrix: np.ndarray, color: Optional[Color]
+) -> Iterator[Tuple[Shape, np.ndarray, Optional[Color]]]:
+    """The leaf shapes of an assembly with their global matrix and color"""
+    color = shape.color if shape.color is not None else color
+    if isinstance(shape, Compound) and shape.children:
+        for child in shape.children:
+            yield from _leaves(
+                child, matrix @ LocationArray._to_matrix(child.location), color
+            )
+    elif shape.wrapped is not None:
+        yield shape, matrix, color
+
+
+def _mesh(
+    local_shape: TopoDS_Shape, tolerance: float, angular_tolerance: float
+) -> Tuple[np.ndarray, ...]:
+    """Tessellate local_shape, reusing a mesh from the tessellation_cache if there
+    is one. A copy is meshed so neither the shape nor the cache is changed."""
+    arrays = tessellation_cache.get(local_shape, tolerance, angular_tolerance, True)
+    if arrays is None:
+        # A copy sharing the geometry but not the triangulation of the shape
+        bare_shape = BRepBuilderAPI_Copy(local_shape, False, False).Shape()
+        arrays = Shape._tessellate_arrays(
+            bare_shape, tolerance, angular_tolerance, True
+        )
+    return arrays
+
+
+def to_mesh_payload(
+    shapes: Union[Shape, Iterable[Shape]],
+    tolerance: float = 1e-3,
+    angular_tolerance: float = 0.1,
+    quantize: bool = True,
+    max_triangles: Optional[int] = DEFAULT_MAX_TRIANGLES,
+) -> Dict[str, Any]:
+    """to_mesh_payload
+
+    Tessellate shapes into a compact JSON serializable payload for display. The
+    vertex, normal and index arrays are sent as base64 packed binary instead of
+    VTK XML. Each distinct shape is meshed once and placed by the instances, one
+    per leaf of the assemblies, which carry a color and a column major 4x4 matrix.
+
+    If the displayed triangles exceed max_triangles the shapes are tessellated
+    again with coarser tolerances, up to LOD_STEPS times. The shapes themselves
+    aren't meshed; meshes at the requested tolerances are added to the
+    tessellation_cache unless they had to be coarsened.
+
+    Args:
+        shapes (Union[Shape, Iterable[Shape]]): shapes or assemblies to display
+        tolerance (float, optional): relative linear deflection of the mesh.
+            Defaults to 1e-3.
+        angular_tolerance (float, optional): angular deflection of the mesh.
+            Defaults to 0.1.
+        quantize (bool, optional): send vertices as 16 bit and normals as 8 bit
+            integers instead of 32 bit floats. Defaults to True.
+        max_triangles (int, optional): triangle budget of the level of detail
+            step, None to disable it. Defaults to DEFAULT_MAX_TRIANGLES.
+
+    Raises:
+        ValueError: unsupported type
+
+    Returns:
+        Dict[str, Any]: meshes, instances and the tolerances used
+    """
+    if isinstance(shapes, Shape):
+        shapes = [shapes]
+    elif isinstance(shapes, Iterable):
+        shapes = list(shapes)
+    else:
+        raise ValueError(f"Type {type(shapes)} is not supported")
+
+    # Leaves sharing a TShape share a mesh whatever their location and color
+    prototypes: Dict[Tuple[int, int], List[Tuple[TopoDS_Shape, int]]] = {}
+    local_shapes: List[TopoDS_Shape] = []
+    instances: List[Dict[str, Any]] = []
+    for shape in shapes:
+        if not isinstance(shape, Shape):
+            raise ValueError(f"Type {type(shape)} is not supported")
+        root = LocationArray._to_matrix(shape.location)
+        for leaf, matrix, color in _leaves(shape, root, None):
+            local_shape = leaf.wrapped.Located(TopLoc_Location())
+            candidates = prototypes.setdefault(
+                TessellationCache._shape_key(local_shape), []
+            )
+            index = next(
+                (i for other, i in candidates if other.IsEqual(local_shape)), None
             )
+            if index is None:
+                index = len(local_shapes)
+                local_shapes.append(local_shape)
+                candidates.append((local_shape, index))
+            if color is None:
+                rgba = DEFAULT_COLOR
+            else:
+                # build123d colors default to an alpha of 0.0, treat that as opaque
+                rgba = list(color.to_tuple())
+                rgba[3] = rgba[3] or 1.0
+            instances.append({"mesh": index, "matrix": matrix, "color": rgba})
+
+    counts = np.bincount(
+        [instance["mesh"] for instance in instances], minlength=len(local_shapes)
+    )
+    requested = (tolerance, angular_tolerance)
+    meshes = [
+        _mesh(local_shape, tolerance, angular_tolerance) for local_shape in local_shapes
+    ]
+    for _ in range(LOD_STEPS):
+        triangles = sum(len(mesh[1]) * count for mesh, count in zip(meshes, counts))
+        if max_triangles is None or triangles <= max_triangles:
+            break
+        # The triangle count is roughly inversely proportional to the deflection
+        ratio = triangles / max_triangles
+        tolerance *= ratio
+        angular_tolerance = min(angular_tolerance * ratio, MAX_ANGULAR_TOLERANCE)
+        meshes = [
+            _mesh(local_shape, tolerance, angular_tolerance)
+            for local_shape in local_shapes
+        ]
+    if (tolerance, angular_tolerance) == requested:
+        # Cache the new meshes, those from the cache are already read only
+        meshes = [
+            (
+                tessellation_cache.put(local_shape, tolerance, angular_tolerance, mesh)
+                if mesh[0].flags.writeable
+                else mesh
+            )
+            for local_shape, mesh in zip(local_shapes, meshes)
+        ]
+
+    payload_meshes = []
+    for vertices, triangles, normals, *_ in meshes:
+        vertices, normals = vertices.astype(np.float32), normals.astype(np.float32)
+        scale, offset = 1.0, [0.0, 0.0, 0.0]
+        if quantize and len(vertices):
+            low, high = vertices.min(axis=0), vertices.max(axis=0)
+            scale = max(float((high - low).max()) / 65534, 1e-12)
+            center = (low + high) / 2
+            vertices = np.round((vertices - center) / scale).astype(np.int16)
+            normals = np.round(normals * 127).astype(np.int8)
+            offset = center.tolist()
+        index_type = np.uint16 if len(vertices) < 2**16 else np.uint32
+        payload_meshes.append(
+            {
+                "vertices": _encode(vertices),
+                "vertex_type": TYPED_ARRAYS[vertices.dtype],
+                "scale": scale,
+                "offset": offset,
+                "normals": _encode(normals),
+                "normal_type": TYPED_ARRAYS[normals.dtype],
+                "triangles": _encode(triangles.ravel().astype(index_type)),
+                "index_type": TYPED_ARRAYS[np.dtype(index_type)],
+            }
         )
+
+    for instance in instances:
+        # vtk.js matrices are column major
+        instance["matrix"] = instance["matrix"].T.ravel().tolist()
+
+    return {
+        "meshes": payload_meshes,
+        "instances": instances,
+        "tolerance": tolerance,
+        "angular_tolerance": angular_tolerance,
+    }
+
+
+def display(
+    shape: Union[Shape, Iterable[Shape]],
+    binary: bool = True,
+    quantize: bool = True,
+    max_triangles: Optional[int] = DEFAULT_MAX_TRIANGLES,
+) -> Javascript:
+    """display
+
+    Render shapes or assemblies with vtk.js in a notebook.
+
+    Args:
+        shape (Union[Shape, Iterable[Shape]]): shapes to display
+        binary (bool, optional): send the meshes as binary arrays, see
+            to_mesh_payload, instead of VTK XML strings. Defaults to True.
+        quantize (bool, optional): quantize the binary meshes. Defaults to True.
+        max_triangles (int, optional): triangle budget of the binary meshes.
+            Defaults to DEFAULT_MAX_TRIANGLES.
+
+    Raises:
+        ValueError: unsupported type
+
+    Returns:
+        Javascript: the rendering code
+    """
+    if binary:
+        payload = to_mesh_payload(shape, quantize=quantize, max_triangles=max_triangles)
     else:
-        raise ValueError(f"Type {type(shape)} is not supported")
+        if not isinstance(shape, (Shape, Iterable)):
+            raise ValueError(f"Type {type(shape)} is not supported")
+        payload = []
+        for element in [shape] if isinstance(shape, Shape) else shape:
+            if not isinstance(element, Shape):
+                raise ValueError(f"Type {type(element)} is not supported")
+            payload.append(
+                dict(
+                    shape=to_vtkpoly_string(element),
+                    color=DEFAULT_COLOR,
+                    position=[0, 0, 0],
+                    orientation=[0, 0, 0],
+                )
+            )
 
-    code = TEMPLATE.format(data=dumps(payload), element="element", ratio=0.5)
+    code = TEMPLATE.format(
+        data=dumps(payload, separators=(",", ":")), element="element", ratio=0.5
+    )
 
     return Javascript(code)
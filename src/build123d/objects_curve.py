@@ -31,11 +31,13 @@ import copy
 from math import copysign, cos, radians, sin, sqrt
 from typing import Iterable, Union
 
+import numpy as np
+
 from build123d.build_common import WorkplaneList, validate_inputs
 from build123d.build_enums import AngularDirection, LengthMode, Mode
 from build123d.build_line import BuildLine
 from build123d.geometry import Axis, Plane, Vector, VectorLike
-from build123d.topology import Edge, Wire
+from build123d.topology import Edge, Wire, _point_array
 
 
 class BaseLineObject(Wire):
@@ -491,10 +493,12 @@ class PolarLine(BaseLineObject):
 class Polyline(BaseLineObject):
     """Line Object: Polyline
 
-    Add a sequence of straight lines defined by successive point pairs.
+    Add a sequence of straight lines defined by successive point pairs. The points
+    may also be provided as a single (N, 3) or (N, 2) numpy array which is converted
+    to OCCT in bulk - the preferred form for very large polylines.
 
     Args:
-        pts (VectorLike): sequence of three or more points
+        pts (Union[VectorLike, np.ndarray]): sequence of three or more points
         close (bool, optional): close by generating an extra Edge. Defaults to False.
         mode (Mode, optional): combination mode. Defaults to Mode.ADD.
 
@@ -504,10 +508,23 @@ class Polyline(BaseLineObject):
 
     _applies_to = [BuildLine._tag]
 
-    def __init__(self, *pts: VectorLike, close: bool = False, mode: Mode = Mode.ADD):
+    def __init__(
+        self,
+        *pts: Union[VectorLike, np.ndarray],
+        close: bool = False,
+        mode: Mode = Mode.ADD,
+    ):
         context: BuildLine = BuildLine._get_context(self)
         validate_inputs(context, self)
 
+        if len(pts) == 1 and isinstance(pts[0], np.ndarray):
+            points = _point_array(pts[0], 1)
+            if len(points) < 3:
+                raise ValueError("polyline requires three or more pts")
+            points = WorkplaneList.localize_array(points)
+            super().__init__(Wire.make_polygon(points, close=close), mode=mode)
+            return
+
         if len(pts) < 3:
             raise ValueError("polyline requires three or more pts")
 
@@ -617,7 +634,8 @@ class Spline(BaseLineObject):
     Add a spline through the provided points optionally constrained by tangents.
 
     Args:
-        pts (VectorLike): sequence of two or more points
+        pts (Union[VectorLike, np.ndarray]): sequence of two or more points, or a single
+            (N, 3) or (N, 2) numpy array of points
         tangents (Iterable[VectorLike], optional): tangents at end points. Defaults to None.
         tangent_scalars (Iterable[float], optional): change shape by amplifying tangent.
             Defaults to None.
@@ -629,7 +647,7 @@ class Spline(BaseLineObject):
 
     def __init__(
         self,
-        *pts: VectorLike,
+        *pts: Union[VectorLike, np.ndarray],
         tangents: Iterable[VectorLike] = None,
         tangent_scalars: Iterable[float] = None,
         periodic: bool = False,
@@ -638,7 +656,11 @@ class Spline(BaseLineObject):
         context: BuildLine = BuildLine._get_context(self)
         validate_inputs(context, self)
 
-        spline_pts = WorkplaneList.localize(*pts)
+        if len(pts) == 1 and isinstance(pts[0], np.ndarray):
+            spline_pts = WorkplaneList.localize_array(_point_array(pts[0], 1))
+        else:
+            spline_pts = WorkplaneList.localize(*pts)
+            spline_pts = [p if isinstance(p, Vector) else Vector(*p) for p in spline_pts]
 
         if tangents:
             spline_tangents = [
@@ -653,7 +675,7 @@ class Spline(BaseLineObject):
             scalars = tangent_scalars
 
         spline = Edge.make_spline(
-            [p if isinstance(p, Vector) else Vector(*p) for p in spline_pts],
+            spline_pts,
             tangents=[
                 t * s if isinstance(t, Vector) else Vector(*t) * s
                 for t, s in zip(spline_tangents, scalars)
@@ -27,10 +27,11 @@ license:
 """
 from __future__ import annotations
 
+import copy
 from math import radians, tan
 
 from typing import Union
-from build123d.build_common import LocationList, validate_inputs
+from build123d.build_common import LocationList, primitive_cache, validate_inputs
 from build123d.build_enums import Align, Mode
 from build123d.build_part import BuildPart
 from build123d.geometry import Location, Plane, Rotation, RotationLike, Vector
@@ -85,9 +86,10 @@ class BasePartObject(Part):
 
             if not LocationList._get_context():
                 raise RuntimeError("No valid context found")
+            # The instances share the TShape of solid
             new_solids = [
-                solid.moved(location * rotate)
-                for location in LocationList._get_context().locations
+                copy.copy(solid).move(location)
+                for location in LocationList._get_context().location_array * rotate
             ]
             if isinstance(context, BuildPart):
                 context._add_to_context(*new_solids, mode=mode)
@@ -132,7 +134,9 @@ class Box(BasePartObject):
         self.width = width
         self.box_height = height
 
-        solid = Solid.make_box(length, width, height)
+        solid = primitive_cache.get(
+            (Box, length, width, height), lambda: Solid.make_box(length, width, height)
+        )
 
         super().__init__(
             solid=solid, rotation=rotation, align=tuplify(align, 3), mode=mode
@@ -180,11 +184,14 @@ class Cone(BasePartObject):
         self.arc_size = arc_size
         self.align = align
 
-        solid = Solid.make_cone(
-            bottom_radius,
-            top_radius,
-            height,
-            angle=arc_size,
+        solid = primitive_cache.get(
+            (Cone, bottom_radius, top_radius, height, arc_size),
+            lambda: Solid.make_cone(
+                bottom_radius,
+                top_radius,
+                height,
+                angle=arc_size,
+            ),
         )
 
         super().__init__(
@@ -229,14 +236,23 @@ class CounterBoreHole(BasePartObject):
             raise ValueError("No depth provided")
         self.mode = mode
 
-        solid = Solid.make_cylinder(
-            radius, self.hole_depth, Plane(origin=(0, 0, 0), z_dir=(0, 0, -1))
-        ).fuse(
-            Solid.make_cylinder(
+        solid = primitive_cache.get(
+            (
+                CounterBoreHole,
+                radius,
                 counter_bore_radius,
-                counter_bore_depth + self.hole_depth,
-                Plane((0, 0, -counter_bore_depth)),
-            )
+                counter_bore_depth,
+                self.hole_depth,
+            ),
+            lambda: Solid.make_cylinder(
+                radius, self.hole_depth, Plane(origin=(0, 0, 0), z_dir=(0, 0, -1))
+            ).fuse(
+                Solid.make_cylinder(
+                    counter_bore_radius,
+                    counter_bore_depth + self.hole_depth,
+                    Plane((0, 0, -counter_bore_depth)),
+                )
+            ),
         )
         super().__init__(solid=solid, rotation=(0, 0, 0), mode=mode)
 
@@ -279,16 +295,25 @@ class CounterSinkHole(BasePartObject):
         self.mode = mode
         cone_height = counter_sink_radius / tan(radians(counter_sink_angle / 2.0))
 
-        solid = Solid.make_cylinder(
-            radius, self.hole_depth, Plane(origin=(0, 0, 0), z_dir=(0, 0, -1))
-        ).fuse(
-            Solid.make_cone(
+        solid = primitive_cache.get(
+            (
+                CounterSinkHole,
+                radius,
                 counter_sink_radius,
-                0.0,
-                cone_height,
-                Plane(origin=(0, 0, 0), z_dir=(0, 0, -1)),
+                self.hole_depth,
+                counter_sink_angle,
+            ),
+            lambda: Solid.make_cylinder(
+                radius, self.hole_depth, Plane(origin=(0, 0, 0), z_dir=(0, 0, -1))
+            ).fuse(
+                Solid.make_cone(
+                    counter_sink_radius,
+                    0.0,
+                    cone_height,
+                    Plane(origin=(0, 0, 0), z_dir=(0, 0, -1)),
+                ),
+                Solid.make_cylinder(counter_sink_radius, self.hole_depth),
             ),
-            Solid.make_cylinder(counter_sink_radius, self.hole_depth),
         )
         super().__init__(solid=solid, rotation=(0, 0, 0), mode=mode)
 
@@ -331,10 +356,13 @@ class Cylinder(BasePartObject):
         self.arc_size = arc_size
         self.align = align
 
-        solid = Solid.make_cylinder(
-            radius,
-            height,
-            angle=arc_size,
+        solid = primitive_cache.get(
+            (Cylinder, radius, height, arc_size),
+            lambda: Solid.make_cylinder(
+                radius,
+                height,
+                angle=arc_size,
+            ),
         )
         super().__init__(
             solid=solid, rotation=rotation, align=tuplify(align, 3), mode=mode
@@ -377,8 +405,11 @@ class Hole(BasePartObject):
         # hole location. In this case start the hole above the part
         # and go all the way through.
         hole_start = (0, 0, self.hole_depth / 2) if depth is None else (0, 0, 0)
-        solid = Solid.make_cylinder(
-            radius, self.hole_depth, Plane(origin=hole_start, z_dir=(0, 0, -1))
+        solid = primitive_cache.get(
+            (Hole, radius, self.hole_depth, hole_start),
+            lambda: Solid.make_cylinder(
+                radius, self.hole_depth, Plane(origin=hole_start, z_dir=(0, 0, -1))
+            ),
         )
         super().__init__(
             solid=solid,
@@ -429,11 +460,14 @@ class Sphere(BasePartObject):
         self.arc_size3 = arc_size3
         self.align = align
 
-        solid = Solid.make_sphere(
-            radius,
-            angle1=arc_size1,
-            angle2=arc_size2,
-            angle3=arc_size3,
+        solid = primitive_cache.get(
+            (Sphere, radius, arc_size1, arc_size2, arc_size3),
+            lambda: Solid.make_sphere(
+                radius,
+                angle1=arc_size1,
+                angle2=arc_size2,
+                angle3=arc_size3,
+            ),
         )
         super().__init__(
             solid=solid, rotation=rotation, align=tuplify(align, 3), mode=mode
@@ -484,12 +518,22 @@ class Torus(BasePartObject):
         self.major_angle = major_angle
         self.align = align
 
-        solid = Solid.make_torus(
-            major_radius,
-            minor_radius,
-            start_angle=minor_start_angle,
-            end_angle=minor_end_angle,
-            major_angle=major_angle,
+        solid = primitive_cache.get(
+            (
+                Torus,
+                major_radius,
+                minor_radius,
+                minor_start_angle,
+                minor_end_angle,
+                major_angle,
+            ),
+            lambda: Solid.make_torus(
+                major_radius,
+                minor_radius,
+                start_angle=minor_start_angle,
+                end_angle=minor_end_angle,
+                major_angle=major_angle,
+            ),
         )
         super().__init__(
             solid=solid, rotation=rotation, align=tuplify(align, 3), mode=mode
@@ -546,7 +590,10 @@ class Wedge(BasePartObject):
         self.zmax = zmax
         self.align = align
 
-        solid = Solid.make_wedge(xsize, ysize, zsize, xmin, zmin, xmax, zmax)
+        solid = primitive_cache.get(
+            (Wedge, xsize, ysize, zsize, xmin, zmin, xmax, zmax),
+            lambda: Solid.make_wedge(xsize, ysize, zsize, xmin, zmin, xmax, zmax),
+        )
         super().__init__(
             solid=solid, rotation=rotation, align=tuplify(align, 3), mode=mode
         )
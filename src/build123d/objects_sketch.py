@@ -27,10 +27,11 @@ license:
 """
 from __future__ import annotations
 
+import copy
 from math import cos, pi, radians, sin, tan
 from typing import Union
 
-from build123d.build_common import LocationList, validate_inputs
+from build123d.build_common import LocationList, primitive_cache, validate_inputs
 from build123d.build_enums import Align, FontStyle, Mode
 from build123d.build_sketch import BuildSketch
 from build123d.geometry import Axis, Location, Vector, VectorLike
@@ -84,8 +85,9 @@ class BaseSketchObject(Sketch):
 
             obj = obj.move(Location((0, 0, 0), (0, 0, 1), rotation))
 
+            # The instances share the TShape of the faces
             new_faces = [
-                face.moved(location)
+                copy.copy(face).move(location)
                 for face in obj.faces()
                 for location in LocationList._get_context().local_locations
             ]
@@ -121,7 +123,9 @@ class Circle(BaseSketchObject):
         self.radius = radius
         self.align = tuplify(align, 2)
 
-        face = Face.make_from_wires(Wire.make_circle(radius))
+        face = primitive_cache.get(
+            (Circle, radius), lambda: Face.make_from_wires(Wire.make_circle(radius))
+        )
         super().__init__(face, 0, self.align, mode)
 
 
@@ -156,7 +160,10 @@ class Ellipse(BaseSketchObject):
         self.y_radius = y_radius
         self.align = tuplify(align, 2)
 
-        face = Face.make_from_wires(Wire.make_ellipse(x_radius, y_radius))
+        face = primitive_cache.get(
+            (Ellipse, x_radius, y_radius),
+            lambda: Face.make_from_wires(Wire.make_ellipse(x_radius, y_radius)),
+        )
         super().__init__(face, rotation, self.align, mode)
 
 
@@ -224,7 +231,9 @@ class Rectangle(BaseSketchObject):
         self.rectangle_height = height
         self.align = tuplify(align, 2)
 
-        face = Face.make_rect(height, width)
+        face = primitive_cache.get(
+            (Rectangle, width, height), lambda: Face.make_rect(height, width)
+        )
         super().__init__(face, rotation, self.align, mode)
 
 
@@ -264,8 +273,11 @@ class RectangleRounded(BaseSketchObject):
         self.radius = radius
         self.align = tuplify(align, 2)
 
-        face = Face.make_rect(height, width)
-        face = face.fillet_2d(radius, face.vertices())
+        def make_face() -> Face:
+            face = Face.make_rect(height, width)
+            return face.fillet_2d(radius, face.vertices())
+
+        face = primitive_cache.get((RectangleRounded, width, height, radius), make_face)
         super().__init__(face, rotation, align, mode)
 
 
@@ -304,6 +316,17 @@ class RegularPolygon(BaseSketchObject):
         self.side_count = side_count
         self.align = align
 
+        face = primitive_cache.get(
+            (RegularPolygon, radius, side_count, rotation, tuplify(align, 2)),
+            lambda: RegularPolygon._make_face(radius, side_count, rotation, align),
+        )
+        super().__init__(face, rotation=0, align=None, mode=mode)
+
+    @staticmethod
+    def _make_face(
+        radius: float, side_count: int, rotation: float, align: tuple[Align, Align]
+    ) -> Face:
+        """Create the aligned polygon face"""
         pts = ShapeList(
             [
                 Vector(
@@ -333,8 +356,7 @@ class RegularPolygon(BaseSketchObject):
             align_offset = [0, 0]
         pts = [point + Vector(*align_offset) for point in pts]
 
-        face = Face.make_from_wires(Wire.make_polygon(pts))
-        super().__init__(face, rotation=0, align=None, mode=mode)
+        return Face.make_from_wires(Wire.make_polygon(pts))
 
 
 class SlotArc(BaseSketchObject):
@@ -445,13 +467,16 @@ class SlotCenterToCenter(BaseSketchObject):
         self.center_separation = center_separation
         self.slot_height = height
 
-        face = Face.make_from_wires(
-            Wire.make_wire(
-                [
-                    Edge.make_line(Vector(-center_separation / 2, 0, 0), Vector()),
-                    Edge.make_line(Vector(), Vector(+center_separation / 2, 0, 0)),
-                ]
-            ).offset_2d(height / 2)[0]
+        face = primitive_cache.get(
+            (SlotCenterToCenter, center_separation, height),
+            lambda: Face.make_from_wires(
+                Wire.make_wire(
+                    [
+                        Edge.make_line(Vector(-center_separation / 2, 0, 0), Vector()),
+                        Edge.make_line(Vector(), Vector(+center_separation / 2, 0, 0)),
+                    ]
+                ).offset_2d(height / 2)[0]
+            ),
         )
         super().__init__(face, rotation, None, mode)
 
@@ -483,13 +508,16 @@ class SlotOverall(BaseSketchObject):
         self.width = width
         self.slot_height = height
 
-        face = Face.make_from_wires(
-            Wire.make_wire(
-                [
-                    Edge.make_line(Vector(-width / 2 + height / 2, 0, 0), Vector()),
-                    Edge.make_line(Vector(), Vector(+width / 2 - height / 2, 0, 0)),
-                ]
-            ).offset_2d(height / 2)[0]
+        face = primitive_cache.get(
+            (SlotOverall, width, height),
+            lambda: Face.make_from_wires(
+                Wire.make_wire(
+                    [
+                        Edge.make_line(Vector(-width / 2 + height / 2, 0, 0), Vector()),
+                        Edge.make_line(Vector(), Vector(+width / 2 - height / 2, 0, 0)),
+                    ]
+                ).offset_2d(height / 2)[0]
+            ),
         )
         super().__init__(face, rotation, None, mode)
 
@@ -543,16 +571,26 @@ class Text(BaseSketchObject):
         self.rotation = rotation
         self.mode = mode
 
-        text_string = Compound.make_text(
-            txt=txt,
-            font_size=font_size,
-            font=font,
-            font_path=font_path,
-            font_style=font_style,
-            align=tuplify(align, 2),
-            position_on_path=position_on_path,
-            text_path=path,
-        )
+        def make_text() -> Compound:
+            return Compound.make_text(
+                txt=txt,
+                font_size=font_size,
+                font=font,
+                font_path=font_path,
+                font_style=font_style,
+                align=tuplify(align, 2),
+                position_on_path=position_on_path,
+                text_path=path,
+            )
+
+        # Text following a path isn't cached as the path isn't hashable
+        if path is None:
+            text_string = primitive_cache.get(
+                (Text, txt, font_size, font, font_path, font_style, tuplify(align, 2)),
+                make_text,
+            )
+        else:
+            text_string = make_text()
         super().__init__(text_string, rotation, None, mode)
 
 
@@ -614,5 +652,8 @@ class Trapezoid(BaseSketchObject):
         pts.append(Vector(width / 2 - reduction_right, height / 2))
         pts.append(Vector(-width / 2 + reduction_left, height / 2))
         pts.append(pts[0])
-        face = Face.make_from_wires(Wire.make_polygon(pts))
+        face = primitive_cache.get(
+            (Trapezoid, width, height, left_side_angle, right_side_angle),
+            lambda: Face.make_from_wires(Wire.make_polygon(pts)),
+        )
         super().__init__(face, rotation, self.align, mode)
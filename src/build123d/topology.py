@@ -36,24 +36,32 @@ from __future__ import annotations
 import copy
 import io as StringIO
 import itertools
+import json
 import logging
 import os
 import platform
+import shutil
 import sys
+import tempfile
+import threading
 import warnings
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from io import BytesIO
+from io import BytesIO, TextIOBase, TextIOWrapper
 from itertools import combinations
 from math import degrees, radians, inf, pi, sqrt, sin, cos
 from typing import (
     Any,
+    BinaryIO,
     Callable,
     Dict,
     Iterable,
     Iterator,
     Optional,
     Protocol,
+    TextIO,
     Tuple,
     Type,
     TypeVar,
@@ -66,14 +74,15 @@ import xml.etree.cElementTree as ET
 from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 import ezdxf
+import numpy as np
 from anytree import NodeMixin, PreOrderIter, RenderTree
 from scipy.spatial import ConvexHull
-from vtkmodules.vtkCommonDataModel import vtkPolyData
-from vtkmodules.vtkFiltersCore import vtkPolyDataNormals, vtkTriangleFilter
+from vtkmodules.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
 
 import OCP.GeomAbs as ga  # Geometry type enum
 import OCP.TopAbs as ta  # Topology type enum
-from OCP.Aspect import Aspect_TOL_SOLID
 from OCP.BOPAlgo import BOPAlgo_GlueEnum
 
 # used for getting underlying geometry -- is this equivalent to brep adaptor?
@@ -91,6 +100,7 @@ from OCP.BRepAlgoAPI import (
     BRepAlgoAPI_Fuse,
     BRepAlgoAPI_Splitter,
 )
+from OCP.BRepBndLib import BRepBndLib
 from OCP.BRepBuilderAPI import (
     BRepBuilderAPI_Copy,
     BRepBuilderAPI_DisconnectedWire,
@@ -121,7 +131,7 @@ from OCP.BRepFilletAPI import (
 )
 from OCP.BRepGProp import BRepGProp, BRepGProp_Face  # used for mass calculation
 from OCP.BRepIntCurveSurface import BRepIntCurveSurface_Inter
-from OCP.BRepLib import BRepLib, BRepLib_FindSurface
+from OCP.BRepLib import BRepLib, BRepLib_FindSurface, BRepLib_ToolTriangulatedShape
 from OCP.BRepMesh import BRepMesh_IncrementalMesh
 from OCP.BRepOffset import BRepOffset_MakeOffset, BRepOffset_Skin
 from OCP.BRepOffsetAPI import (
@@ -143,6 +153,8 @@ from OCP.BRepPrimAPI import (
 )
 from OCP.BRepProj import BRepProj_Projection
 from OCP.BRepTools import BRepTools
+from OCP.BinTools import BinTools, BinTools_FormatVersion
+from OCP.Bnd import Bnd_Box
 from OCP.Font import (
     Font_FA_Bold,
     Font_FA_Italic,
@@ -185,6 +197,7 @@ from OCP.gp import (
     gp_Dir,
     gp_Dir2d,
     gp_Elips,
+    gp_Pln,
     gp_Pnt,
     gp_Pnt2d,
     gp_Trsf,
@@ -194,16 +207,18 @@ from OCP.gp import (
 # properties used to store mass calculation result
 from OCP.GProp import GProp_GProps
 from OCP.HLRAlgo import HLRAlgo_Projector
-from OCP.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape
+from OCP.HLRBRep import (
+    HLRBRep_Algo,
+    HLRBRep_HLRToShape,
+    HLRBRep_PolyAlgo,
+    HLRBRep_PolyHLRToShape,
+)
 from OCP.IFSelect import IFSelect_ReturnStatus
 from OCP.Interface import Interface_Static
-from OCP.IVtkOCC import IVtkOCC_Shape, IVtkOCC_ShapeMesher
-from OCP.IVtkVTK import IVtkVTK_ShapeData
 from OCP.LocOpe import LocOpe_DPrism
 from OCP.NCollection import NCollection_Utf8String
 from OCP.Precision import Precision
-from OCP.Prs3d import Prs3d_IsoAspect
-from OCP.Quantity import Quantity_Color
+from OCP.Quantity import Quantity_ColorRGBA
 from OCP.ShapeAnalysis import ShapeAnalysis_FreeBounds
 from OCP.ShapeCustom import ShapeCustom, ShapeCustom_RestrictionParameters
 from OCP.ShapeFix import ShapeFix_Face, ShapeFix_Shape, ShapeFix_Solid
@@ -214,8 +229,8 @@ from OCP.Standard import Standard_Failure, Standard_NoSuchObject
 from OCP.StdFail import StdFail_NotDone
 from OCP.StdPrs import StdPrs_BRepFont
 from OCP.StdPrs import StdPrs_BRepTextBuilder as Font_BRepTextBuilder
+from OCP.STEPCAFControl import STEPCAFControl_Writer
 from OCP.STEPControl import STEPControl_AsIs, STEPControl_Writer
-from OCP.StlAPI import StlAPI_Writer
 
 # Array of vectors (used for B-spline interpolation):
 # Array of points (used for B-spline construction):
@@ -225,7 +240,10 @@ from OCP.TColgp import (
     TColgp_HArray1OfPnt,
     TColgp_HArray2OfPnt,
 )
-from OCP.TCollection import TCollection_AsciiString
+from OCP.TCollection import TCollection_AsciiString, TCollection_ExtendedString
+from OCP.TDataStd import TDataStd_Name
+from OCP.TDF import TDF_Label
+from OCP.TDocStd import TDocStd_Document
 
 # Array of floats (used for B-spline interpolation):
 # Array of booleans (used for B-spline interpolation):
@@ -254,6 +272,8 @@ from OCP.TopTools import (
     TopTools_IndexedDataMapOfShapeListOfShape,
     TopTools_ListOfShape,
 )
+from OCP.XCAFApp import XCAFApp_Application
+from OCP.XCAFDoc import XCAFDoc_ColorType, XCAFDoc_DocumentTool
 from build123d.build_enums import (
     Align,
     AngularDirection,
@@ -274,6 +294,7 @@ from build123d.geometry import (
     BoundBox,
     Color,
     Location,
+    LocationArray,
     Matrix,
     Plane,
     Rotation,
@@ -292,6 +313,14 @@ TOL = 1e-2
 DEG2RAD = pi / 180.0
 RAD2DEG = 180 / pi
 HASH_CODE_MAX = 2147483647  # max 32bit signed int, required by OCC.Core.HashCode
+# Binary BRep format written by build123d: VERSION_4 (OCCT's CURRENT) can't be
+# read back for some shapes, e.g. extruded text
+BINTOOLS_FORMAT_VERSION = BinTools_FormatVersion.BinTools_FormatVersion_VERSION_3
+
+# Record of a binary STL file: facet normal, three vertices and an attribute byte count
+_STL_FACET_DTYPE = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
 
 
 shape_LUT = {
@@ -1427,6 +1456,8 @@ class Shape(NodeMixin):
         return new_shape
 
     def __rmul__(self, other):
+        if isinstance(other, LocationArray):
+            return [loc * self for loc in other]
         if not (
             isinstance(other, (list, tuple))
             and all([isinstance(o, (Location, Plane)) for o in other])
@@ -1490,17 +1521,22 @@ class Shape(NodeMixin):
 
     def export_stl(
         self,
-        file_name: str,
+        file_name: Union[str, os.PathLike, BinaryIO, TextIO],
         tolerance: float = 1e-3,
         angular_tolerance: float = 0.1,
         ascii_format: bool = False,
     ) -> bool:
         """Export STL
 
-        Exports a shape to a specified STL file.
+        Exports a shape to a specified STL file. The solids (and any faces not part of
+        a solid) are meshed and written one at a time, and meshes created just for
+        the export are removed afterwards, so the memory used is bounded by the
+        largest solid rather than the whole shape.
 
         Args:
-            file_name (str): The path and file name to write the STL output to.
+            file_name (Union[str, os.PathLike, BinaryIO, TextIO]): The path and file
+                name to write the STL output to or an open binary (text if
+                ascii_format) file object.
             tolerance (float, optional): A linear deflection setting which limits the distance
                 between a curve and its tessellation. Setting this value too low will result in
                 large meshes that can consume computing resources. Setting the value too high can
@@ -1514,45 +1550,182 @@ class Shape(NodeMixin):
         Returns:
             bool: Success
         """
-        mesh = BRepMesh_IncrementalMesh(
-            self.wrapped, tolerance, True, angular_tolerance
-        )
-        mesh.Perform()
+        if not TopExp_Explorer(self.wrapped, TopAbs_ShapeEnum.TopAbs_FACE).More():
+            return False
 
-        writer = StlAPI_Writer()
+        try:
+            if not isinstance(file_name, (str, os.PathLike)):
+                return self._write_stl(
+                    file_name, tolerance, angular_tolerance, ascii_format
+                )
+            if ascii_format:
+                with open(file_name, "w", encoding="utf-8") as stl_file:
+                    return self._write_stl(
+                        stl_file, tolerance, angular_tolerance, ascii_format
+                    )
+            with open(file_name, "wb") as stl_file:
+                return self._write_stl(
+                    stl_file, tolerance, angular_tolerance, ascii_format
+                )
+        except OSError:
+            return False
 
+    def _write_stl(
+        self,
+        stl_file: Union[BinaryIO, TextIO],
+        tolerance: float,
+        angular_tolerance: float,
+        ascii_format: bool,
+    ) -> bool:
+        """Stream the facets of each solid into stl_file"""
         if ascii_format:
-            writer.ASCIIMode = True
-        else:
-            writer.ASCIIMode = False
+            facet_template = (
+                "  facet normal %e %e %e\n    outer loop\n"
+                + "      vertex %e %e %e\n" * 3
+                + "    endloop\n  endfacet\n"
+            )
+            stl_file.write("solid shape\n")
+            for facets, facet_normals in self._stl_facets(tolerance, angular_tolerance):
+                values = np.hstack([facet_normals, facets.reshape(-1, 9)]).ravel()
+                stl_file.write(facet_template * len(facets) % tuple(values.tolist()))
+            stl_file.write("endsolid shape\n")
+            return True
+
+        if not stl_file.seekable():
+            # The triangle count can't be patched into the header so spool to disk
+            with tempfile.TemporaryFile() as spool_file:
+                success = self._write_stl(
+                    spool_file, tolerance, angular_tolerance, ascii_format
+                )
+                spool_file.seek(0)
+                shutil.copyfileobj(spool_file, stl_file)
+            return success
+
+        header_position = stl_file.tell()
+        stl_file.write(b"build123d binary STL".ljust(80, b"\0"))
+        stl_file.write(np.uint32(0).tobytes())
+        facet_count = 0
+        for facets, facet_normals in self._stl_facets(tolerance, angular_tolerance):
+            records = np.zeros(len(facets), dtype=_STL_FACET_DTYPE)
+            records["normal"] = facet_normals
+            records["vertices"] = facets
+            stl_file.write(records.tobytes())
+            facet_count += len(records)
+
+        end_position = stl_file.tell()
+        stl_file.seek(header_position + 80)
+        stl_file.write(np.uint32(facet_count).tobytes())
+        stl_file.seek(end_position)
+        return facet_count > 0
+
+    def _stl_facets(
+        self, tolerance: float, angular_tolerance: float
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Generate the float32 facets and facet normals of each solid in turn"""
+        parts = self.solids()
+        free_faces = TopExp_Explorer(
+            self.wrapped, TopAbs_ShapeEnum.TopAbs_FACE, TopAbs_ShapeEnum.TopAbs_SOLID
+        )
+        if free_faces.More():
+            builder = TopoDS_Builder()
+            faces = TopoDS_Compound()
+            builder.MakeCompound(faces)
+            while free_faces.More():
+                builder.Add(faces, free_faces.Current())
+                free_faces.Next()
+            parts.append(Compound(faces))
+
+        for part in parts:
+            # The mesh is only needed until it is written, so it isn't cached
+            vertices, triangles, _ = part.tessellate_arrays(
+                tolerance, angular_tolerance, dtype=np.float32, cache=False
+            )
+            if len(triangles) == 0:
+                continue
 
-        return writer.Write(self.wrapped, file_name)
+            facets = vertices[triangles]
+            facet_normals = np.cross(
+                facets[:, 1] - facets[:, 0], facets[:, 2] - facets[:, 0]
+            )
+            lengths = np.linalg.norm(facet_normals, axis=1, keepdims=True)
+            facet_normals = np.divide(
+                facet_normals,
+                lengths,
+                out=np.zeros_like(facet_normals),
+                where=lengths > 0,
+            )
+            yield facets, facet_normals
 
     def export_3mf(
-        self, file_name: str, tolerance: float, angular_tolerance: float, unit: Unit
+        self,
+        file_name: Union[str, os.PathLike, BinaryIO],
+        tolerance: float,
+        angular_tolerance: float,
+        unit: Unit,
+        compression_level: int = None,
     ):
         """export_3mf
 
         Exports a shape to a specified 3MF file.
 
         Args:
-            file_name (str): name of 3mf file
+            file_name (Union[str, os.PathLike, BinaryIO]): name of 3mf file or a
+                binary file object
             tolerance (float): linear tolerance for tesselation
             angular_tolerance (float): angular tolerance for tesselation
             unit (Unit): model unit
+            compression_level (int, optional): zlib compression level from 0 to 9.
+                Defaults to None (zlib default).
+        """
+        tmfw = ThreeMF(self, tolerance, angular_tolerance, unit, compression_level)
+        tmfw.write_3mf(file_name)
+
+    def export_glb(
+        self,
+        file_name: Union[str, os.PathLike, BinaryIO],
+        tolerance: float = 1e-3,
+        angular_tolerance: float = 0.1,
+        unit: Unit = Unit.MILLIMETER,
+        quantize: bool = False,
+    ):
+        """export_glb
+
+        Exports a shape or assembly to a binary glTF 2.0 (GLB) file. Each unique
+        TShape is tessellated once and referenced by every node that places it.
+
+        Args:
+            file_name (Union[str, os.PathLike, BinaryIO]): name of glb file or a
+                binary file object
+            tolerance (float, optional): linear tolerance for tesselation.
+                Defaults to 1e-3.
+            angular_tolerance (float, optional): angular tolerance for tesselation.
+                Defaults to 0.1.
+            unit (Unit, optional): model unit, the file is scaled to meters.
+                Defaults to Unit.MILLIMETER.
+            quantize (bool, optional): store positions and normals as 16 and 8 bit
+                integers (KHR_mesh_quantization). Defaults to False.
         """
-        tmfw = ThreeMF(self, tolerance, angular_tolerance, unit)
-        with open(file_name, "wb") as three_mf_file:
-            tmfw.write_3mf(three_mf_file)
+        glb = GLTF(self, tolerance, angular_tolerance, unit, quantize)
+        glb.write_glb(file_name)
 
-    def export_step(self, file_name: str, **kwargs) -> IFSelect_ReturnStatus:
+    def export_step(
+        self, file_name: Union[str, os.PathLike, BinaryIO], **kwargs
+    ) -> IFSelect_ReturnStatus:
         """Export this shape to a STEP file.
 
+        By default the shape is written through an XCAF document so the assembly
+        structure of a Compound with children is kept along with the label and color
+        of each shape. Children that share a TShape and color are written once and
+        placed as instances of that part. With assembly=False the shape is written
+        as a single unnamed, uncolored shape by the plain STEPControl_Writer.
+
         kwargs is used to provide optional keyword arguments to configure the exporter.
 
         Args:
-            file_name (str): Path and filename for writing.
-            kwargs: used to provide optional keyword arguments to configure the exporter.
+            file_name (Union[str, os.PathLike, BinaryIO]): Path and filename for
+                writing or a binary file object.
+            kwargs: used to provide optional keyword arguments to configure the exporter:
+                write_pcurves (bool), precision_mode (int) and assembly (bool).
 
         Returns:
             IFSelect_ReturnStatus: OCCT return status
@@ -1562,31 +1735,101 @@ class Shape(NodeMixin):
         if "write_pcurves" in kwargs and not kwargs["write_pcurves"]:
             pcurves = 0
         precision_mode = kwargs["precision_mode"] if "precision_mode" in kwargs else 0
-
-        writer = STEPControl_Writer()
         Interface_Static.SetIVal_s("write.surfacecurve.mode", pcurves)
         Interface_Static.SetIVal_s("write.precision.mode", precision_mode)
-        writer.Transfer(self.wrapped, STEPControl_AsIs)
 
-        return writer.Write(file_name)
+        if "assembly" in kwargs and not kwargs["assembly"]:
+            writer = STEPControl_Writer()
+            writer.Transfer(self.wrapped, STEPControl_AsIs)
+            if isinstance(file_name, (str, os.PathLike)):
+                return writer.Write(os.fspath(file_name))
+            return writer.WriteStream(file_name)
+
+        doc = TDocStd_Document(TCollection_ExtendedString("XmlOcaf"))
+        XCAFApp_Application.GetApplication_s().InitDocument(doc)
+        shape_tool = XCAFDoc_DocumentTool.ShapeTool_s(doc.Main())
+        color_tool = XCAFDoc_DocumentTool.ColorTool_s(doc.Main())
+        # (shape hash, orientation) -> [(shape at the origin, rgba, label)]
+        prototypes: dict[tuple[int, int], list[tuple]] = {}
+
+        def add_shape(shape: Shape, color: Optional[Color]) -> TDF_Label:
+            """Add shape at the origin to the document, reusing existing parts"""
+            color = shape.color if shape.color is not None else color
+            if isinstance(shape, Compound) and shape.children:
+                label = shape_tool.NewShape()
+                for child in shape.children:
+                    component = shape_tool.AddComponent(
+                        label, add_shape(child, color), child.location.wrapped
+                    )
+                    if child.label:
+                        TDataStd_Name.Set_s(
+                            component, TCollection_ExtendedString(child.label)
+                        )
+            else:
+                local_shape = shape.wrapped.Located(TopLoc_Location())
+                rgba = None if color is None else color.to_tuple()
+                candidates = prototypes.setdefault(
+                    TessellationCache._shape_key(local_shape), []
+                )
+                for prototype, prototype_rgba, label in candidates:
+                    if prototype_rgba == rgba and prototype.IsEqual(local_shape):
+                        return label
+                label = shape_tool.AddShape(local_shape, False)
+                candidates.append((local_shape, rgba, label))
+                if rgba is not None:
+                    # build123d colors default to an alpha of 0.0, treat that as opaque
+                    color_tool.SetColor(
+                        label,
+                        Quantity_ColorRGBA(*rgba[:3], rgba[3] or 1.0),
+                        XCAFDoc_ColorType.XCAFDoc_ColorSurf,
+                    )
+            if shape.label:
+                TDataStd_Name.Set_s(label, TCollection_ExtendedString(shape.label))
+            return label
+
+        label = add_shape(self, None)
+        if not self.wrapped.Location().IsIdentity():
+            shape_tool.AddComponent(
+                shape_tool.NewShape(), label, self.wrapped.Location()
+            )
+        shape_tool.UpdateAssemblies()
+
+        writer = STEPCAFControl_Writer()
+        writer.SetColorMode(True)
+        writer.SetNameMode(True)
+        writer.Transfer(doc, STEPControl_AsIs)
 
-    def export_brep(self, file: Union[str, BytesIO]) -> bool:
+        if isinstance(file_name, (str, os.PathLike)):
+            return writer.Write(os.fspath(file_name))
+        return writer.WriteStream(file_name)
+
+    def export_brep(
+        self, file: Union[str, os.PathLike, BinaryIO], binary: bool = False
+    ) -> bool:
         """Export this shape to a BREP file
 
         Args:
-            file: Union[str, BytesIO]:
+            file: Union[str, os.PathLike, BinaryIO]: path or binary file object
+            binary: bool: use the compact, faster binary format (BinTools) instead
+                of text (Default value = False)
 
         Returns:
 
         """
-
-        return_value = BRepTools.Write_s(self.wrapped, file)
+        if isinstance(file, os.PathLike):
+            file = os.fspath(file)
+        if binary:
+            return_value = BinTools.Write_s(
+                self.wrapped, file, True, False, BINTOOLS_FORMAT_VERSION
+            )
+        else:
+            return_value = BRepTools.Write_s(self.wrapped, file)
 
         return True if return_value is None else return_value
 
     def export_svg(
         self,
-        file_name: str,
+        file_name: Union[str, os.PathLike, BinaryIO, TextIO],
         viewport_origin: VectorLike,
         viewport_up: VectorLike = (0, 0, 1),
         look_at: VectorLike = None,
@@ -1597,7 +1840,8 @@ class Shape(NodeMixin):
         Export self to an SVG file with the provided options
 
         Args:
-            file_name (str): file name
+            file_name (Union[str, os.PathLike, BinaryIO, TextIO]): file name or a
+                binary (utf-8) or text file object
             svg_opts (dict, optional): options dictionary. Defaults to None.
 
         SVG Options - e.g. svg_opts = {"pixel_scale":50}:
@@ -1617,15 +1861,20 @@ class Shape(NodeMixin):
             stroke_color (tuple[int]): Visible stroke color. Defaults to RGB(0, 0, 0).
             hidden_color (tuple[int]): Hidden stroke color. Defaults to RBG(160, 160, 160).
             show_hidden (bool): Display hidden lines. Defaults to True.
+            fast_hlr (bool): Use the polygonal hidden line removal algorithm on the
+                tessellated shape, much faster on detailed shapes but less precise.
+                Defaults to False.
+            hlr_tolerance (float): Tessellation tolerance of fast_hlr.
+                Defaults to None (0.2% of the shape size).
 
         """
         svg = SVG.get_svg(self, viewport_origin, viewport_up, look_at, svg_opts)
-        with open(file_name, "w", encoding="utf-8") as file:
+        with _open_text(file_name) as file:
             file.write(svg)
 
     def export_dxf(
         self,
-        fname: str,
+        fname: Union[str, os.PathLike, BinaryIO, TextIO],
         approx_option: ApproxOption = ApproxOption.NONE,
         tolerance: float = 1e-3,
         unit: Unit = Unit.MILLIMETER,
@@ -1635,7 +1884,8 @@ class Shape(NodeMixin):
         Export shape to DXF. Works with 2D sections.
 
         Args:
-            fname (str): output filename.
+            fname (Union[str, os.PathLike, BinaryIO, TextIO]): output filename or a
+                binary or text file object.
             approx (ApproxOption, optional): Approximation strategy. NONE means no approximation is
                 applied. SPLINE results in all splines being approximated as cubic splines.
                 ARC results in all curves being approximated as arcs and straight segments.
@@ -1684,7 +1934,11 @@ class Shape(NodeMixin):
             conv = dxf_converters.get(edge.geom_type(), DXF._dxf_spline)
             conv(edge, msp, plane)
 
-        dxf.saveas(fname)
+        if isinstance(fname, (str, os.PathLike)):
+            dxf.saveas(fname)
+        else:
+            with _open_text(fname, dxf.output_encoding, "dxfreplace") as stream:
+                dxf.write(stream)
 
     def geom_type(self) -> Geoms:
         """Gets the underlying geometry type.
@@ -2052,17 +2306,41 @@ class Shape(NodeMixin):
 
     def __deepcopy__(self, memo) -> Shape:
         """Return deepcopy of self"""
-        # The wrapped object is a OCCT TopoDS_Shape which can't be pickled or copied
-        # with the standard python copy/deepcopy, so create a deepcopy 'memo' with this
+        # The wrapped object is a OCCT TopoDS_Shape which can't be copied with the
+        # standard python copy/deepcopy, so create a deepcopy 'memo' with this
         # value already copied which causes deepcopy to skip it.
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        memo[id(self.wrapped)] = downcast(BRepBuilderAPI_Copy(self.wrapped).Shape())
+        if id(self.wrapped) not in memo:
+            memo[id(self.wrapped)] = downcast(BRepBuilderAPI_Copy(self.wrapped).Shape())
         for key, value in self.__dict__.items():
             setattr(result, key, copy.deepcopy(value, memo))
         return result
 
+    def __getstate__(self) -> dict:
+        """Pickle the wrapped TopoDS_Shape in the binary BRep format"""
+        state = self.__dict__.copy()
+        if self.wrapped is not None:
+            stream = BytesIO()
+            BinTools.Write_s(
+                self.wrapped,
+                stream,
+                False,  # without triangulation
+                False,
+                BINTOOLS_FORMAT_VERSION,
+            )
+            state["wrapped"] = stream.getvalue()
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore the wrapped TopoDS_Shape from the binary BRep format"""
+        if state["wrapped"] is not None:
+            shape = TopoDS_Shape()
+            BinTools.Read_s(shape, BytesIO(state["wrapped"]))
+            state = {**state, "wrapped": downcast(shape)}
+        self.__dict__.update(state)
+
     def __copy__(self) -> Shape:
         """Return shallow copy or reference of self
 
@@ -2074,9 +2352,9 @@ class Shape(NodeMixin):
 
         Changes to the CAD structure of the base object will be reflected in all instances.
         """
-        reference = copy.deepcopy(self)
-        reference.wrapped.TShape(self.wrapped.TShape())
-        return reference
+        # A new TopoDS_Shape referencing the same TShape avoids copying the geometry
+        memo = {id(self.wrapped): downcast(self.wrapped.Moved(TopLoc_Location()))}
+        return copy.deepcopy(self, memo)
 
     def copy(self) -> Shape:
         """Here for backwards compatibility with cq-editor"""
@@ -2388,62 +2666,332 @@ class Shape(NodeMixin):
 
             yield dist_calc.Value()
 
-    def mesh(self, tolerance: float, angular_tolerance: float = 0.1):
+    def mesh(
+        self, tolerance: float, angular_tolerance: float = 0.1, parallel: bool = True
+    ):
         """Generate triangulation if none exists.
 
         Args:
           tolerance: float:
           angular_tolerance: float:  (Default value = 0.1)
+          parallel: bool: mesh the faces in parallel (Default value = True)
 
         Returns:
 
         """
 
         if not BRepTools.Triangulation_s(self.wrapped, tolerance):
-            BRepMesh_IncrementalMesh(self.wrapped, tolerance, True, angular_tolerance)
+            BRepMesh_IncrementalMesh(
+                self.wrapped, tolerance, True, angular_tolerance, parallel
+            )
 
     def tessellate(
         self, tolerance: float, angular_tolerance: float = 0.1
     ) -> Tuple[list[Vector], list[Tuple[int, int, int]]]:
         """General triangulated approximation"""
-        self.mesh(tolerance, angular_tolerance)
+        vertices, triangles, _ = self.tessellate_arrays(tolerance, angular_tolerance)
+        return [Vector(*v) for v in vertices.tolist()], [
+            tuple(t) for t in triangles.tolist()
+        ]
 
-        vertices: list[Vector] = []
-        triangles: list[Tuple[int, int, int]] = []
-        offset = 0
+    def tessellate_arrays(
+        self,
+        tolerance: float,
+        angular_tolerance: float = 0.1,
+        normals: bool = False,
+        dtype: np.dtype = np.float64,
+        cache: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """tessellate_arrays
+
+        Triangulated approximation as contiguous numpy arrays. The faces are meshed in
+        parallel and the nodes and triangles of each face are copied into preallocated
+        buffers rather than lists of Vectors and tuples. OCP has no bulk access to a
+        triangulation, so the nodes and triangles are still read from OCCT one at a
+        time. Results are stored in the shared tessellation_cache; the returned
+        arrays may be read only.
+
+        Args:
+            tolerance (float): linear deflection of the mesh
+            angular_tolerance (float, optional): angular deflection of the mesh.
+                Defaults to 0.1.
+            normals (bool, optional): also return vertex normals. Defaults to False.
+            dtype (np.dtype, optional): precision of the vertices and normals, e.g.
+                np.float32. Defaults to np.float64.
+            cache (bool, optional): store a new mesh in the tessellation_cache, False
+                for meshes that are only used once which are made on a copy, leaving
+                the shape untouched. Defaults to True.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]: (N, 3) vertices,
+            (M, 3) int32 vertex indices of the triangles and (N, 3) unit vertex
+            normals or None
+        """
+        vertices, triangles, vertex_normals, _, _ = self._cached_tessellation(
+            tolerance, angular_tolerance, normals, cache
+        )
+        if not normals:
+            vertex_normals = None
 
-        for face in self.faces():
-            loc = TopLoc_Location()
-            poly = BRep_Tool.Triangulation_s(face.wrapped, loc)
-            trsf = loc.Transformation()
-            reverse = face.wrapped.Orientation() == TopAbs_Orientation.TopAbs_REVERSED
-
-            # add vertices
-            vertices += [
-                Vector(v.X(), v.Y(), v.Z())
-                for v in (
-                    poly.Node(i).Transformed(trsf) for i in range(1, poly.NbNodes() + 1)
-                )
-            ]
-            # add triangles
-            triangles += [
-                (
-                    t.Value(1) + offset - 1,
-                    t.Value(3) + offset - 1,
-                    t.Value(2) + offset - 1,
+        if self.wrapped.Location().IsIdentity():
+            vertices = vertices.astype(dtype, copy=False)
+            if vertex_normals is not None:
+                vertex_normals = vertex_normals.astype(dtype, copy=False)
+        else:
+            transform = LocationArray._to_matrix(self.location)
+            vertices = (vertices @ transform[:3, :3].T + transform[:3, 3]).astype(dtype)
+            if vertex_normals is not None:
+                vertex_normals = (vertex_normals @ transform[:3, :3].T).astype(dtype)
+
+        return vertices, triangles, vertex_normals
+
+    def tessellate_welded(
+        self,
+        tolerance: float,
+        angular_tolerance: float = 0.1,
+        weld_tolerance: float = None,
+        dtype: np.dtype = np.float64,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """tessellate_welded
+
+        Triangulated approximation as a compact indexed mesh. The nodes that the face
+        triangulations duplicate along shared edges, seams and vertices are welded
+        using the topology of the shape, so closed shapes produce watertight meshes
+        with about half the vertices of tessellate_arrays. A weld_tolerance
+        additionally merges nodes that are within that distance of each other, e.g.
+        to join faces that touch but don't share edges.
+
+        Args:
+            tolerance (float): linear deflection of the mesh
+            angular_tolerance (float, optional): angular deflection of the mesh.
+                Defaults to 0.1.
+            weld_tolerance (float, optional): merge distance for nodes not shared
+                through the topology. Defaults to None.
+            dtype (np.dtype, optional): precision of the vertices, e.g. np.float32.
+                Defaults to np.float64.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: (N, 3) vertices, (M, 3) int32
+            vertex indices of the triangles and (M,) int32 index of the face, in
+            faces() order, that each triangle belongs to
+        """
+        vertices, triangles, _, face_ids, weld_map = self._cached_tessellation(
+            tolerance, angular_tolerance, False
+        )
+        keep, remap = np.unique(weld_map, return_inverse=True)
+        vertices = vertices[keep]
+        triangles = remap.reshape(-1).astype(np.int32)[triangles]
+
+        if weld_tolerance:
+            keep, remap = _weld_points(vertices, weld_tolerance)
+            vertices = vertices[keep]
+            triangles = remap.reshape(-1).astype(np.int32)[triangles]
+
+        # Remove the triangles that collapsed, e.g. at the poles of a sphere
+        valid = (
+            (triangles[:, 0] != triangles[:, 1])
+            & (triangles[:, 1] != triangles[:, 2])
+            & (triangles[:, 2] != triangles[:, 0])
+        )
+        triangles, face_ids = triangles[valid], face_ids[valid]
+
+        if not self.wrapped.Location().IsIdentity():
+            transform = LocationArray._to_matrix(self.location)
+            vertices = vertices @ transform[:3, :3].T + transform[:3, 3]
+
+        return vertices.astype(dtype, copy=False), triangles, face_ids
+
+    def _cached_tessellation(
+        self,
+        tolerance: float,
+        angular_tolerance: float,
+        normals: bool,
+        cache: bool = True,
+    ) -> tuple[np.ndarray, ...]:
+        """Local tessellation buffers of this shape from the tessellation_cache, a
+        new mesh is only stored in the cache if cache is True"""
+        # Meshes are cached at the origin so instances of a shape share them
+        local_shape = self.wrapped.Located(TopLoc_Location())
+        arrays = tessellation_cache.get(
+            local_shape, tolerance, angular_tolerance, normals
+        )
+        if arrays is None:
+            # A mesh that is only used once is made on a copy sharing the geometry
+            # but not the TShapes, so the shape isn't changed
+            mesh_shape = (
+                local_shape
+                if cache
+                else BRepBuilderAPI_Copy(local_shape, False, False).Shape()
+            )
+            arrays = Shape._tessellate_arrays(
+                mesh_shape, tolerance, angular_tolerance, normals
+            )
+            if cache:
+                arrays = tessellation_cache.put(
+                    local_shape, tolerance, angular_tolerance, arrays
                 )
-                if reverse
-                else (
-                    t.Value(1) + offset - 1,
-                    t.Value(2) + offset - 1,
-                    t.Value(3) + offset - 1,
+        return arrays
+
+    @staticmethod
+    def _is_triangulated(obj: TopoDS_Shape) -> bool:
+        """Whether any face of obj has a triangulation"""
+        explorer = TopExp_Explorer(obj, TopAbs_ShapeEnum.TopAbs_FACE)
+        while explorer.More():
+            face = TopoDS.Face_s(explorer.Current())
+            if BRep_Tool.Triangulation_s(face, TopLoc_Location()) is not None:
+                return True
+            explorer.Next()
+        return False
+
+    @staticmethod
+    def _tessellate_arrays(
+        obj: TopoDS_Shape,
+        tolerance: float,
+        angular_tolerance: float,
+        normals: bool,
+        relative: bool = True,
+    ) -> tuple[np.ndarray, ...]:
+        """Mesh obj and copy the face triangulations into float64/int32 buffers
+
+        The tolerance is relative to the size of each edge and face unless relative
+        is False. Returns the vertices, triangles, vertex normals (or None), the face
+        index of each triangle and a weld map giving the lowest index of the
+        coincident nodes of each vertex.
+        """
+        # OCCT doesn't record the angular deflection of a triangulation and keeps an
+        # existing one that is fine enough linearly, so only a shape without any
+        # triangulation is meshed in place; otherwise a bare copy is meshed.
+        if Shape._is_triangulated(obj):
+            obj = BRepBuilderAPI_Copy(obj, False, False).Shape()
+        BRepMesh_IncrementalMesh(obj, tolerance, relative, angular_tolerance, True)
+
+        face_meshes = []
+        explorer = TopExp_Explorer(obj, TopAbs_ShapeEnum.TopAbs_FACE)
+        while explorer.More():
+            topods_face = TopoDS.Face_s(explorer.Current())
+            loc = TopLoc_Location()
+            poly = BRep_Tool.Triangulation_s(topods_face, loc)
+            if poly is not None:
+                face_meshes.append((topods_face, poly, loc))
+            explorer.Next()
+
+        node_count = sum(poly.NbNodes() for _, poly, _ in face_meshes)
+        triangle_count = sum(poly.NbTriangles() for _, poly, _ in face_meshes)
+        vertices = np.empty((node_count, 3), dtype=np.float64)
+        triangles = np.empty((triangle_count, 3), dtype=np.int32)
+        vertex_normals = (
+            np.empty((node_count, 3), dtype=np.float64) if normals else None
+        )
+
+        face_ids = np.repeat(
+            np.arange(len(face_meshes), dtype=np.int32),
+            [poly.NbTriangles() for _, poly, _ in face_meshes],
+        )
+        edge_nodes: dict[int, list[tuple[TopoDS_Edge, np.ndarray]]] = {}
+
+        node_offset = triangle_offset = 0
+        for topods_face, poly, loc in face_meshes:
+            nb_nodes, nb_triangles = poly.NbNodes(), poly.NbTriangles()
+            transform = LocationArray._to_matrix(Location(loc))
+            node_slice = slice(node_offset, node_offset + nb_nodes)
+
+            nodes = np.array([poly.Node(i).Coord() for i in range(1, nb_nodes + 1)])
+            vertices[node_slice] = nodes @ transform[:3, :3].T + transform[:3, 3]
+
+            face_triangles = np.array(
+                [poly.Triangle(i).Get() for i in range(1, nb_triangles + 1)],
+                dtype=np.int32,
+            ).reshape(-1, 3)
+            reverse = topods_face.Orientation() == TopAbs_Orientation.TopAbs_REVERSED
+            if reverse:
+                face_triangles = face_triangles[:, [0, 2, 1]]
+            triangles[triangle_offset : triangle_offset + nb_triangles] = (
+                face_triangles + node_offset - 1
+            )
+
+            if normals:
+                BRepLib_ToolTriangulatedShape.ComputeNormals_s(topods_face, poly)
+                face_normals = (
+                    np.array([poly.Normal(i).Coord() for i in range(1, nb_nodes + 1)])
+                    @ transform[:3, :3].T
                 )
-                for t in poly.Triangles()
-            ]
+                face_normals /= np.linalg.norm(face_normals, axis=1, keepdims=True)
+                vertex_normals[node_slice] = -face_normals if reverse else face_normals
+
+            # The nodes of each edge (seams appear twice) as indices into vertices
+            edge_explorer = TopExp_Explorer(topods_face, TopAbs_ShapeEnum.TopAbs_EDGE)
+            while edge_explorer.More():
+                topods_edge = TopoDS.Edge_s(edge_explorer.Current())
+                polygon = BRep_Tool.PolygonOnTriangulation_s(topods_edge, poly, loc)
+                if polygon is not None:
+                    edge_nodes.setdefault(
+                        topods_edge.HashCode(HASH_CODE_MAX), []
+                    ).append(
+                        (
+                            topods_edge,
+                            np.array(
+                                [
+                                    polygon.Node(i)
+                                    for i in range(1, polygon.NbNodes() + 1)
+                                ]
+                            )
+                            + node_offset
+                            - 1,
+                        )
+                    )
+                edge_explorer.Next()
 
-            offset += poly.NbNodes()
+            node_offset += nb_nodes
+            triangle_offset += nb_triangles
 
-        return vertices, triangles
+        return (
+            vertices,
+            triangles,
+            vertex_normals,
+            face_ids,
+            Shape._weld_map(vertices, edge_nodes.values()),
+        )
+
+    @staticmethod
+    def _weld_map(
+        vertices: np.ndarray,
+        edge_nodes: Iterable[list[tuple[TopoDS_Edge, np.ndarray]]],
+    ) -> np.ndarray:
+        """Label each vertex with the lowest index of the nodes coincident with it
+
+        BRepMesh discretizes each edge once, so the polygons of an edge on each of
+        its faces have matching nodes which are joined pairwise.
+        """
+        pairs = []
+        for polygons in edge_nodes:
+            for i, (edge, nodes) in enumerate(polygons):
+                for other_edge, other_nodes in polygons[:i]:
+                    if len(nodes) != len(other_nodes) or not edge.IsSame(other_edge):
+                        continue
+                    # Align the polygons in case they run in opposite directions
+                    if np.linalg.norm(
+                        vertices[nodes[0]] - vertices[other_nodes[0]]
+                    ) > np.linalg.norm(vertices[nodes[0]] - vertices[other_nodes[-1]]):
+                        other_nodes = other_nodes[::-1]
+                    pairs.append(np.column_stack([nodes, other_nodes]))
+                    break
+
+        labels = np.arange(len(vertices), dtype=np.int32)
+        if not pairs:
+            return labels
+
+        # Propagate the lowest label through the pairs until the groups are stable;
+        # the nodes at a vertex are joined through chains of edges
+        first, second = np.concatenate(pairs).T
+        while True:
+            lowest = np.minimum(labels[first], labels[second])
+            if np.array_equal(lowest, labels[first]) and np.array_equal(
+                lowest, labels[second]
+            ):
+                return labels
+            np.minimum.at(labels, first, lowest)
+            np.minimum.at(labels, second, lowest)
+            labels = labels[labels]
 
     def to_splines(
         self, degree: int = 3, tolerance: float = 1e-3, nurbs: bool = False
@@ -2485,52 +3033,76 @@ class Shape(NodeMixin):
     ) -> vtkPolyData:
         """Convert shape to vtkPolyData
 
+        The triangles come from the tessellation arrays of a bare copy of the shape
+        and the edges are added as discretized lines. Like IVtk the tolerance is a
+        deviation coefficient relative to the size of the shape: faces and edges are
+        meshed with an absolute deflection of four times the tolerance of the
+        largest dimension of the bounding box.
+
         Args:
-          tolerance: float:
-          angular_tolerance: float:  (Default value = 0.1)
-          normals: bool:  (Default value = True)
+          tolerance: float:  (Default value = 1e-3)
+          angular_tolerance: float:  (Default value = 20 degrees in radians)
+          normals: bool:  (Default value = False)
 
         Returns:
 
         """
-
-        vtk_shape = IVtkOCC_Shape(self.wrapped)
-        shape_data = IVtkVTK_ShapeData()
-        shape_mesher = IVtkOCC_ShapeMesher()
-
-        drawer = vtk_shape.Attributes()
-        drawer.SetUIsoAspect(Prs3d_IsoAspect(Quantity_Color(), Aspect_TOL_SOLID, 1, 0))
-        drawer.SetVIsoAspect(Prs3d_IsoAspect(Quantity_Color(), Aspect_TOL_SOLID, 1, 0))
-
-        if tolerance:
-            drawer.SetDeviationCoefficient(tolerance)
-
-        if angular_tolerance:
-            drawer.SetDeviationAngle(angular_tolerance)
-
-        shape_mesher.Build(vtk_shape, shape_data)
-
-        return_value = shape_data.getVtkPolyData()
-
-        # convert to triangles and split edges
-        t_filter = vtkTriangleFilter()
-        t_filter.SetInputData(return_value)
-        t_filter.Update()
-
-        return_value = t_filter.GetOutput()
-
-        # compute normals
+        tolerance = tolerance or 1e-3
+        angular_tolerance = angular_tolerance or radians(20)
+        deflection = 4 * tolerance * max(*self.bounding_box().size, TOLERANCE)
+        # The tessellation_cache holds relative meshes, so this one isn't cached
+        vertices, triangles, vertex_normals, _, _ = Shape._tessellate_arrays(
+            BRepBuilderAPI_Copy(self.wrapped, False, False).Shape(),
+            deflection,
+            angular_tolerance,
+            normals,
+            relative=False,
+        )
+        vertices = vertices.astype(np.float32)
         if normals:
-            n_filter = vtkPolyDataNormals()
-            n_filter.SetComputePointNormals(True)
-            n_filter.SetComputeCellNormals(True)
-            n_filter.SetFeatureAngle(360)
-            n_filter.SetInputData(return_value)
-            n_filter.Update()
+            vertex_normals = vertex_normals.astype(np.float32)
 
-            return_value = n_filter.GetOutput()
+        edge_points = []
+        for edge in self.edges():
+            curve = edge._geom_adaptor()
+            points = GCPnts_QuasiUniformDeflection(
+                curve, deflection, curve.FirstParameter(), curve.LastParameter()
+            )
+            if points.IsDone() and points.NbPoints() > 1:
+                edge_points.append(
+                    [points.Value(i).Coord() for i in range(1, points.NbPoints() + 1)]
+                )
+        line_sizes = np.array([len(points) for points in edge_points], dtype=np.int64)
+        line_vertices = np.array(
+            [point for points in edge_points for point in points], dtype=np.float32
+        ).reshape(-1, 3)
+
+        def cell_array(connectivity: np.ndarray, offsets: np.ndarray) -> vtkCellArray:
+            cells = vtkCellArray()
+            cells.SetData(
+                numpy_to_vtkIdTypeArray(offsets.astype(np.int64), deep=True),
+                numpy_to_vtkIdTypeArray(connectivity.astype(np.int64), deep=True),
+            )
+            return cells
+
+        poly_data = vtkPolyData()
+        points = vtkPoints()
+        points.SetData(numpy_to_vtk(np.vstack([vertices, line_vertices]), deep=True))
+        poly_data.SetPoints(points)
+        poly_data.SetPolys(
+            cell_array(triangles.ravel(), np.arange(0, 3 * len(triangles) + 1, 3))
+        )
+        poly_data.SetLines(
+            cell_array(
+                np.arange(len(vertices), len(vertices) + len(line_vertices)),
+                np.concatenate([[0], np.cumsum(line_sizes)]),
+            )
+        )
+        if normals:
+            point_normals = np.vstack([vertex_normals, np.zeros_like(line_vertices)])
+            poly_data.GetPointData().SetNormals(numpy_to_vtk(point_normals, deep=True))
 
-        return return_value
+        return poly_data
 
     def to_arcs(self, tolerance: float = 1e-3) -> Face:
         """to_arcs
@@ -3769,7 +4341,7 @@ class Edge(Shape, Mixin1D):
     @classmethod
     def make_spline(
         cls,
-        points: list[VectorLike],
+        points: Union[list[VectorLike], np.ndarray],
         tangents: list[VectorLike] = None,
         periodic: bool = False,
         parameters: list[float] = None,
@@ -3781,7 +4353,8 @@ class Edge(Shape, Mixin1D):
         Interpolate a spline through the provided points.
 
         Args:
-            points (list[VectorLike]):  the points defining the spline
+            points (Union[list[VectorLike], np.ndarray]):  the points defining the spline,
+                either as VectorLike objects or as an (N, 3) or (N, 2) array
             tangents (list[VectorLike], optional): start and finish tangent.
                 Defaults to None.
             periodic (bool, optional): creation of periodic curves. Defaults to False.
@@ -3808,12 +4381,16 @@ class Edge(Shape, Mixin1D):
         Returns:
             Edge: the spline
         """
-        points = [Vector(point) for point in points]
+        if isinstance(points, np.ndarray):
+            points = _point_array(points, 1)
+            pnts = _occt_point_array(points)
+        else:
+            points = [Vector(point) for point in points]
+            pnts = TColgp_HArray1OfPnt(1, len(points))
+            for i, point in enumerate(points):
+                pnts.SetValue(i + 1, point.to_pnt())
         if tangents:
             tangents = tuple(Vector(v) for v in tangents)
-        pnts = TColgp_HArray1OfPnt(1, len(points))
-        for i, point in enumerate(points):
-            pnts.SetValue(i + 1, point.to_pnt())
 
         if parameters is None:
             spline_builder = GeomAPI_Interpolate(pnts, periodic, tol)
@@ -3970,6 +4547,34 @@ class Edge(Shape, Mixin1D):
             ).Edge()
         )
 
+    @classmethod
+    def make_lines(cls, segments: np.ndarray) -> ShapeList[Edge]:
+        """make_lines
+
+        Create many linear edges in one call from an array of start/end point pairs.
+        The points are converted directly to OCCT points without creating intermediate
+        Vector objects.
+
+        Args:
+            segments (np.ndarray): array of shape (N, 2, 3) or (N, 2, 2) where
+                segments[i] holds the start and end point of the i-th line
+
+        Raises:
+            ValueError: segments has an invalid shape
+
+        Returns:
+            ShapeList[Edge]: the linear edges
+        """
+        segments = _point_array(segments, 2)
+        if segments.shape[1] != 2:
+            raise ValueError(
+                f"Expected an array of shape (N, 2, 3), got {segments.shape}"
+            )
+        return ShapeList(
+            cls(BRepBuilderAPI_MakeEdge(gp_Pnt(*start), gp_Pnt(*end)).Edge())
+            for start, end in segments.tolist()
+        )
+
     def distribute_locations(
         self: Union[Wire, Edge],
         count: int,
@@ -4376,7 +4981,7 @@ class Face(Shape):
     @classmethod
     def make_surface_from_array_of_points(
         cls,
-        points: list[list[VectorLike]],
+        points: Union[list[list[VectorLike]], np.ndarray],
         tol: float = 1e-2,
         smoothing: Tuple[float, float, float] = None,
         min_deg: int = 1,
@@ -4387,7 +4992,8 @@ class Face(Shape):
         Approximate a spline surface through the provided 2d array of points.
 
         Args:
-            points (list[list[VectorLike]]): a 2D list of points
+            points (Union[list[list[VectorLike]], np.ndarray]): a 2D list of points or
+                an (N, M, 3) array
             tol (float, optional): tolerance of the algorithm. Defaults to 1e-2.
             smoothing (Tuple[float, float, float], optional): optional tuple of
                 3 weights use for variational smoothing. Defaults to None.
@@ -4401,11 +5007,14 @@ class Face(Shape):
         Returns:
             Face: a potentially non-planar face defined by points
         """
-        points_ = TColgp_HArray2OfPnt(1, len(points), 1, len(points[0]))
+        if isinstance(points, np.ndarray):
+            points_ = _occt_point_array(_point_array(points, 2))
+        else:
+            points_ = TColgp_HArray2OfPnt(1, len(points), 1, len(points[0]))
 
-        for i, point_row in enumerate(points):
-            for j, point in enumerate(point_row):
-                points_.SetValue(i + 1, j + 1, Vector(point).to_pnt())
+            for i, point_row in enumerate(points):
+                for j, point in enumerate(point_row):
+                    points_.SetValue(i + 1, j + 1, Vector(point).to_pnt())
 
         if smoothing:
             spline_builder = GeomAPI_PointsToBSplineSurface(
@@ -4731,6 +5340,95 @@ class Face(Shape):
         """
         return Compound.make_compound([self]).is_inside(point, tolerance)
 
+    def _is_inside_array(
+        self, points: np.ndarray, tolerance: float = 1.0e-6
+    ) -> np.ndarray:
+        """Points inside a planar Face
+
+        A vectorized is_inside for many points. The boundary is discretized within
+        tolerance and the points within tolerance of the plane are classified by
+        counting the boundary segments crossed by a ray along the local x axis, so
+        the time is about linear in the number of points rather than an OCCT
+        classification each. Points on the boundary are considered inside.
+
+        Args:
+            points (np.ndarray): (N, 3) points to test
+            tolerance (float, optional): tolerance for inside determination.
+                Defaults to 1.0e-6.
+
+        Raises:
+            ValueError: the Face isn't planar
+
+        Returns:
+            np.ndarray: (N,) boolean, whether each point is within the Face
+        """
+        if self.geom_type() != "PLANE":
+            raise ValueError("Only planar faces can classify arrays of points")
+        plane = Plane(self)
+        offsets = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        offsets = offsets - plane.origin.to_tuple()
+        local = offsets @ np.array([plane.x_dir.to_tuple(), plane.y_dir.to_tuple()]).T
+        on_plane = np.abs(offsets @ plane.z_dir.to_tuple()) <= tolerance
+
+        # The boundary as straight segments, in no particular order
+        polylines = []
+        for edge in self.edges():
+            curve = edge._geom_adaptor()
+            first, last = curve.FirstParameter(), curve.LastParameter()
+            if edge.geom_type() == "LINE":
+                coords = [curve.Value(first).Coord(), curve.Value(last).Coord()]
+            else:
+                discrete = GCPnts_QuasiUniformDeflection(curve, tolerance, first, last)
+                coords = [
+                    discrete.Value(i).Coord() for i in range(1, discrete.NbPoints() + 1)
+                ]
+            # The ends are the vertices, so closed edges and adjacent edges meet
+            # exactly
+            coords[0] = BRep_Tool.Pnt_s(TopExp.FirstVertex_s(edge.wrapped)).Coord()
+            coords[-1] = BRep_Tool.Pnt_s(TopExp.LastVertex_s(edge.wrapped)).Coord()
+            polyline = np.array(coords) - plane.origin.to_tuple()
+            polylines.append(
+                polyline @ np.array([plane.x_dir.to_tuple(), plane.y_dir.to_tuple()]).T
+            )
+        starts = np.concatenate([polyline[:-1] for polyline in polylines])
+        ends = np.concatenate([polyline[1:] for polyline in polylines])
+        low = np.minimum(starts[:, 1], ends[:, 1]) - tolerance
+        high = np.maximum(starts[:, 1], ends[:, 1]) + tolerance
+
+        # Pair each segment with the points level with it
+        order = np.argsort(local[:, 1], kind="stable")
+        levels = local[order, 1]
+        firsts = np.searchsorted(levels, low, "left")
+        counts = np.searchsorted(levels, high, "right") - firsts
+        segment = np.repeat(np.arange(len(starts)), counts)
+        rank = np.arange(len(segment)) - np.repeat(np.cumsum(counts) - counts, counts)
+        point = order[np.repeat(firsts, counts) + rank]
+
+        start, end, position = starts[segment], ends[segment], local[point]
+        direction = end - start
+        length_squared = np.einsum("ij,ij->i", direction, direction)
+        along = np.clip(
+            np.einsum("ij,ij->i", position - start, direction)
+            / np.where(length_squared > 0, length_squared, 1),
+            0,
+            1,
+        )
+        distance = np.linalg.norm(start + along[:, None] * direction - position, axis=1)
+        on_boundary = np.zeros(len(local), dtype=bool)
+        on_boundary[point[distance <= tolerance]] = True
+
+        # Half open spans in y count a ray through a shared vertex once
+        spans = (np.minimum(start[:, 1], end[:, 1]) <= position[:, 1]) & (
+            position[:, 1] < np.maximum(start[:, 1], end[:, 1])
+        )
+        crossing_x = start[spans, 0] + (position[spans, 1] - start[spans, 1]) * (
+            direction[spans, 0] / direction[spans, 1]
+        )
+        crossings = np.bincount(
+            point[spans][crossing_x > position[spans, 0]], minlength=len(local)
+        )
+        return on_plane & (on_boundary | (crossings % 2 == 1))
+
 
 class Shell(Shape):
     """the outer boundary of a surface"""
@@ -4772,6 +5470,217 @@ class Solid(Shape, Mixin3D):
         """A box of the same dimensions and location"""
         return Solid.make_box(*bbox.size).locate(Location(bbox.min))
 
+    @classmethod
+    def from_mesh(
+        cls,
+        vertices: np.ndarray,
+        triangles: np.ndarray,
+        tolerance: float = 1e-5,
+        angular_tolerance: float = 1e-5,
+    ) -> Solid:
+        """from_mesh
+
+        Create a Solid from a closed triangle mesh, e.g. the arrays of
+        StlMesh.arrays or tessellate_welded. Vertices within tolerance of each
+        other are welded, adjacent coplanar triangles are merged into planar
+        polygon faces and collinear boundary vertices are dropped. The faces are
+        built directly on shared vertices and edges, so no sewing is needed and a
+        flat area of a mesh becomes a single face which keeps booleans fast. Every
+        corner of a merged triangle is within tolerance of the plane of its face,
+        and the tolerances of noisy meshes are fixed up with ShapeFix.
+
+        Args:
+            vertices (np.ndarray): (N, 3) vertex coordinates
+            triangles (np.ndarray): (M, 3) vertex indices of the triangles, counter
+                clockwise when seen from outside
+            tolerance (float, optional): welding distance of the vertices and maximum
+                distance of merged triangles from a common plane. Defaults to 1e-5.
+            angular_tolerance (float, optional): maximum angle in radians between
+                the normals of merged triangles and between collinear boundary
+                edges. Defaults to 1e-5.
+
+        Raises:
+            ValueError: the mesh isn't closed, manifold and consistently oriented
+            ValueError: the mesh can't be made into a valid Solid
+
+        Returns:
+            Solid: the enclosed volume
+        """
+        vertices = _point_array(vertices, 1)
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+
+        # Weld the vertices within tolerance and remove collapsed triangles
+        keep, remap = _weld_points(vertices, tolerance)
+        vertices = vertices[keep]
+        triangles = remap.reshape(-1)[triangles]
+        triangles = triangles[
+            (triangles[:, 0] != triangles[:, 1])
+            & (triangles[:, 1] != triangles[:, 2])
+            & (triangles[:, 2] != triangles[:, 0])
+        ]
+
+        # Pair up the two triangles of each edge
+        edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+        edge_keys = edges.min(axis=1) * len(vertices) + edges.max(axis=1)
+        order = np.argsort(edge_keys, kind="stable")
+        _, edge_counts = np.unique(edge_keys, return_counts=True)
+        first, second = order[0::2], order[1::2]
+        if (edge_counts != 2).any() or (edges[first] != edges[second][:, ::-1]).any():
+            raise ValueError(
+                "The mesh must be closed, manifold and consistently oriented"
+            )
+        triangle_a, triangle_b = first // 3, second // 3
+
+        # Group the coplanar triangles connected by an edge
+        corners = vertices[triangles]
+        areas = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        normals = areas / np.linalg.norm(areas, axis=1, keepdims=True)
+        offsets = np.einsum("ij,ij->i", normals, corners[:, 0])
+        distances = np.abs(
+            np.einsum("ij,ikj->ik", normals[triangle_a], corners[triangle_b])
+            - offsets[triangle_a, None]
+        ).max(axis=1)
+        coplanar = (
+            np.einsum("ij,ij->i", normals[triangle_a], normals[triangle_b])
+            >= cos(angular_tolerance)
+        ) & (distances <= tolerance)
+        weights = np.linalg.norm(areas, axis=1)
+        while True:
+            groups = _connected_components(
+                len(triangles), triangle_a[coplanar], triangle_b[coplanar]
+            )
+            # Small angles between neighbours add up, so every triangle must also
+            # be close to the plane of its group
+            group_normals = np.zeros((groups.max() + 1, 3))
+            np.add.at(group_normals, groups, areas)
+            group_normals /= np.linalg.norm(group_normals, axis=1, keepdims=True)
+            group_offsets = np.zeros(groups.max() + 1)
+            np.add.at(
+                group_offsets,
+                groups,
+                weights * np.einsum("ij,ikj->i", group_normals[groups], corners) / 3,
+            )
+            group_offsets /= np.bincount(groups, weights)
+            apart = (
+                np.abs(
+                    np.einsum("ij,ikj->ik", group_normals[groups], corners)
+                    - group_offsets[groups, None]
+                ).max(axis=1)
+                > tolerance
+            )
+            if not apart.any():
+                break
+            coplanar &= ~(apart[triangle_a] | apart[triangle_b])
+
+        # The edges between groups bound the faces
+        boundary = groups[triangle_a] != groups[triangle_b]
+        segments = edges[first[boundary]]
+        segment_groups = np.sort(
+            np.stack([groups[triangle_a[boundary]], groups[triangle_b[boundary]]], 1)
+        )
+
+        # A vertex between two collinear segments separating the same two faces
+        # isn't needed by either face
+        ends = np.concatenate([segments, segments[:, ::-1]])
+        ends_groups = np.concatenate([segment_groups, segment_groups])
+        ends_order = np.argsort(ends[:, 0], kind="stable")
+        ends, ends_groups = ends[ends_order], ends_groups[ends_order]
+        degree = np.bincount(ends[:, 0], minlength=len(vertices))
+        starts = np.searchsorted(ends[:, 0], np.flatnonzero(degree == 2))
+        directions = vertices[ends[:, 1]] - vertices[ends[:, 0]]
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        removable = np.zeros(len(vertices), dtype=bool)
+        removable[ends[starts, 0]] = (
+            (ends_groups[starts] == ends_groups[starts + 1]).all(axis=1)
+        ) & (
+            np.einsum("ij,ij->i", directions[starts], directions[starts + 1])
+            <= -cos(angular_tolerance)
+        )
+
+        # Chain the directed boundary edges of each face into loops
+        # Both sides of each boundary edge, oriented like their own triangle
+        boundary_edges = np.concatenate([first[boundary], second[boundary]])
+        loop_groups = groups[boundary_edges // 3]
+        loop_edges = edges[boundary_edges]
+        edge_order = np.lexsort((loop_edges[:, 0], loop_groups))
+        loop_groups, loop_edges = loop_groups[edge_order], loop_edges[edge_order]
+        loop_keys = loop_groups * len(vertices) + loop_edges[:, 0]
+        successors = np.searchsorted(
+            loop_keys, loop_groups * len(vertices) + loop_edges[:, 1]
+        ).tolist()
+
+        occt_vertices: dict[int, TopoDS_Vertex] = {}
+        occt_edges: dict[tuple[int, int], TopoDS_Edge] = {}
+
+        def occt_edge(start: int, end: int) -> TopoDS_Edge:
+            """The edge shared by the faces on either side"""
+            key = (min(start, end), max(start, end))
+            if key not in occt_edges:
+                for index in key:
+                    if index not in occt_vertices:
+                        occt_vertices[index] = BRepBuilderAPI_MakeVertex(
+                            gp_Pnt(*vertices[index].tolist())
+                        ).Vertex()
+                occt_edges[key] = BRepBuilderAPI_MakeEdge(
+                    occt_vertices[key[0]], occt_vertices[key[1]]
+                ).Edge()
+            return occt_edges[key]
+
+        face_loops: dict[int, list[list[int]]] = {}
+        visited = [False] * len(successors)
+        starts_list = loop_edges[:, 0].tolist()
+        for index, group in enumerate(loop_groups.tolist()):
+            if visited[index]:
+                continue
+            loop = []
+            while not visited[index]:
+                visited[index] = True
+                loop.append(starts_list[index])
+                index = successors[index]
+            face_loops.setdefault(group, []).append(loop)
+
+        shell = TopoDS_Shell()
+        builder = TopoDS_Builder()
+        builder.MakeShell(shell)
+        group_planes = np.column_stack([group_normals, -group_offsets]).tolist()
+        group_normals = group_normals.tolist()
+        removable = removable.tolist()
+        for group, loops in face_loops.items():
+            wires = []
+            for loop in loops:
+                loop = [index for index in loop if not removable[index]]
+                wire_builder = BRepBuilderAPI_MakeWire()
+                for start, end in zip(loop, loop[1:] + loop[:1]):
+                    wire_builder.Add(occt_edge(start, end))
+                area = 0.0
+                if len(loops) > 1:
+                    # The outer loop is counter clockwise around the normal
+                    points = vertices[loop]
+                    area = np.cross(points, np.roll(points, -1, axis=0)).sum(axis=0)
+                    area = float(np.dot(area, group_normals[group]))
+                wires.append((area, wire_builder.Wire()))
+            wires.sort(key=lambda wire: -wire[0])
+            face_builder = BRepBuilderAPI_MakeFace(
+                gp_Pln(*group_planes[group]), wires[0][1], True
+            )
+            for _, hole in wires[1:]:
+                face_builder.Add(hole)
+            builder.Add(shell, face_builder.Face())
+
+        solid = TopoDS_Solid()
+        builder.MakeSolid(solid)
+        builder.Add(solid, shell)
+        BRepLib.UpdateTolerances_s(solid)
+        classifier = BRepClass3d_SolidClassifier(solid)
+        classifier.PerformInfinitePoint(tolerance)
+        if classifier.State() == ta.TopAbs_IN:
+            solid.Reverse()
+        # The vertices of noisy meshes are only close to the planes of their faces
+        result = cls(solid).fix()
+        if not result.is_valid():
+            raise ValueError("The mesh can't be made into a valid Solid")
+        return result
+
     @classmethod
     def make_box(
         cls, length: float, width: float, height: float, plane: Plane = Plane.XY
@@ -5760,25 +6669,34 @@ class Wire(Shape, Mixin1D):
         return wire
 
     @classmethod
-    def make_polygon(cls, vertices: Iterable[VectorLike], close: bool = True) -> Wire:
+    def make_polygon(
+        cls, vertices: Union[Iterable[VectorLike], np.ndarray], close: bool = True
+    ) -> Wire:
         """make_polygon
 
         Create an irregular polygon by defining vertices
 
         Args:
-            vertices (Iterable[VectorLike]):
+            vertices (Union[Iterable[VectorLike], np.ndarray]): polygon vertices, either
+                as VectorLike objects or as an (N, 3) or (N, 2) array
             close (bool, optional): close the polygon. Defaults to True.
 
         Returns:
             Wire: an irregular polygon
         """
-        vertices = [Vector(v) for v in vertices]
-        if (vertices[0] - vertices[-1]).length > TOLERANCE and close:
-            vertices.append(vertices[0])
-
         wire_builder = BRepBuilderAPI_MakePolygon()
-        for vertex in vertices:
-            wire_builder.Add(vertex.to_pnt())
+        if isinstance(vertices, np.ndarray):
+            vertices = _point_array(vertices, 1)
+            if close and np.linalg.norm(vertices[0] - vertices[-1]) > TOLERANCE:
+                vertices = np.concatenate([vertices, vertices[:1]])
+            for x_val, y_val, z_val in vertices.tolist():
+                wire_builder.Add(gp_Pnt(x_val, y_val, z_val))
+        else:
+            vertices = [Vector(v) for v in vertices]
+            if (vertices[0] - vertices[-1]).length > TOLERANCE and close:
+                vertices.append(vertices[0])
+            for vertex in vertices:
+                wire_builder.Add(vertex.to_pnt())
 
         return cls(wire_builder.Wire())
 
@@ -6419,6 +7337,11 @@ class SVG:
             stroke_color (tuple[int]): Visible stroke color. Defaults to RGB(0, 0, 0).
             hidden_color (tuple[int]): Hidden stroke color. Defaults to RBG(160, 160, 160).
             show_hidden (bool): Display hidden lines. Defaults to True.
+            fast_hlr (bool): Use the polygonal hidden line removal algorithm on the
+                tessellated shape, much faster on detailed shapes but less precise.
+                Defaults to False.
+            hlr_tolerance (float): Tessellation tolerance of fast_hlr.
+                Defaults to None (0.2% of the shape size).
 
         Returns:
             str: SVG text string
@@ -6437,6 +7360,8 @@ class SVG:
             "stroke_color": (0, 0, 0),  # RGB 0-255
             "hidden_color": (160, 160, 160),  # RGB 0-255
             "show_hidden": True,
+            "fast_hlr": False,
+            "hlr_tolerance": None,  # calculated based on the shape size
         }
 
         if svg_opts:
@@ -6452,11 +7377,6 @@ class SVG:
         show_hidden = bool(defaults["show_hidden"])
 
         # Setup the projector
-        hidden_line_removal = HLRBRep_Algo()
-        hidden_line_removal.Add(shape.wrapped)
-        if show_axes:
-            hidden_line_removal.Add(SVG.axes(defaults["axes_scale"]).wrapped)
-
         viewport_origin = Vector(viewport_origin)
         look_at = Vector(look_at) if look_at else shape.center()
         projection_dir: Vector = (viewport_origin - look_at).normalized()
@@ -6468,49 +7388,13 @@ class SVG:
         camera_coordinate_system.SetYDirection(viewport_up.to_dir())
         projector = HLRAlgo_Projector(camera_coordinate_system)
 
-        hidden_line_removal.Projector(projector)
-        hidden_line_removal.Update()
-        hidden_line_removal.Hide()
-
-        hlr_shapes = HLRBRep_HLRToShape(hidden_line_removal)
-
-        # Create the visible edges
-        visible_edges = []
-        visible_sharp_edges = hlr_shapes.VCompound()
-        if not visible_sharp_edges.IsNull():
-            visible_edges.append(visible_sharp_edges)
-
-        visible_smooth_edges = hlr_shapes.Rg1LineVCompound()
-        if not visible_smooth_edges.IsNull():
-            visible_edges.append(visible_smooth_edges)
-
-        visible_contour_edges = hlr_shapes.OutLineVCompound()
-        if not visible_contour_edges.IsNull():
-            visible_edges.append(visible_contour_edges)
-
-        # print("Visible Edges")
-        # for edge_compound in visible_edges:
-        #     for edge in Compound(edge_compound).edges():
-        #         print(type(edge), edge.geom_type())
-        # topo_abs: Any = geom_LUT[shapetype(edge)]
-        # print(downcast(edge).GetType())
-        # geom_LUT_EDGE[topo_abs(self.wrapped).GetType()]
-
-        # Create the hidden edges
-        hidden_edges = []
-        hidden_sharp_edges = hlr_shapes.HCompound()
-        if not hidden_sharp_edges.IsNull():
-            hidden_edges.append(hidden_sharp_edges)
-
-        hidden_contour_edges = hlr_shapes.OutLineHCompound()
-        if not hidden_contour_edges.IsNull():
-            hidden_edges.append(hidden_contour_edges)
-
-        # Fix the underlying geometry - otherwise we will get segfaults
-        for edge in visible_edges:
-            BRepLib.BuildCurves3d_s(edge, TOLERANCE)
-        for edge in hidden_edges:
-            BRepLib.BuildCurves3d_s(edge, TOLERANCE)
+        shapes = [shape, SVG.axes(defaults["axes_scale"])] if show_axes else [shape]
+        visible_edges, hidden_edges = _hidden_line_removal(
+            shapes,
+            projector,
+            bool(defaults["fast_hlr"]),
+            defaults["hlr_tolerance"],
+        )
 
         # convert to native shape objects
         visible_edges = list(map(Shape, visible_edges))
@@ -6570,6 +7454,150 @@ class SVG:
         return svg
 
 
+class TessellationCache:
+    """Tessellation Cache
+
+    A memory bounded, least recently used cache of the packed mesh buffers created by
+    Shape.tessellate_arrays, shared by all of the exporters and viewers. Meshes are
+    stored in the local coordinates of the shape keyed on its TShape and orientation,
+    so relocated instances of a shape share one entry. A mesh created with finer
+    tolerances satisfies any request for coarser ones.
+
+    Each entry keeps its shape alive so it can be compared with IsSame; only the
+    mesh buffers count towards max_bytes, not the (shared) geometry of the shapes.
+
+    Args:
+        max_bytes (int, optional): maximum size of the cached buffers, 0 disables the
+            cache. Defaults to 256 MiB.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        # (shape hash, orientation, tolerance, angular_tolerance) -> (shape, arrays)
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        # (shape hash, orientation) -> the keys of its entries
+        self._buckets: dict[tuple[int, int], list[tuple]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _shape_key(local_shape: TopoDS_Shape) -> tuple[int, int]:
+        return (local_shape.HashCode(HASH_CODE_MAX), int(local_shape.Orientation()))
+
+    @staticmethod
+    def _nbytes(arrays: tuple) -> int:
+        return sum(array.nbytes for array in arrays if array is not None)
+
+    def get(
+        self,
+        local_shape: TopoDS_Shape,
+        tolerance: float,
+        angular_tolerance: float,
+        normals: bool = False,
+    ) -> Optional[tuple[Optional[np.ndarray], ...]]:
+        """get
+
+        Find the coarsest cached mesh of the shape that is at least as fine as the
+        requested tolerances.
+
+        Args:
+            local_shape (TopoDS_Shape): shape located at the origin
+            tolerance (float): linear deflection
+            angular_tolerance (float): angular deflection
+            normals (bool, optional): the mesh must include normals. Defaults to False.
+
+        Returns:
+            Optional[tuple[Optional[np.ndarray], ...]]: read only buffers from
+            Shape._tessellate_arrays or None if not cached
+        """
+        shape_key = TessellationCache._shape_key(local_shape)
+        with self._lock:
+            candidates = []
+            for key in self._buckets.get(shape_key, []):
+                shape, arrays = self._entries[key]
+                if (
+                    key[2] <= tolerance
+                    and key[3] <= angular_tolerance
+                    and (arrays[2] is not None or not normals)
+                    and shape.IsSame(local_shape)
+                ):
+                    candidates.append(key)
+            if not candidates:
+                self.misses += 1
+                return None
+            key = max(candidates, key=lambda key: (key[2], key[3]))
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][1]
+
+    def put(
+        self,
+        local_shape: TopoDS_Shape,
+        tolerance: float,
+        angular_tolerance: float,
+        arrays: tuple[Optional[np.ndarray], ...],
+    ) -> tuple[Optional[np.ndarray], ...]:
+        """put
+
+        Store the mesh of the shape, evicting the least recently used meshes if the
+        cache is full.
+
+        Args:
+            local_shape (TopoDS_Shape): shape located at the origin
+            tolerance (float): linear deflection
+            angular_tolerance (float): angular deflection
+            arrays (tuple[Optional[np.ndarray], ...]): vertices, triangles, normals,
+                face ids and weld map
+
+        Returns:
+            tuple[Optional[np.ndarray], ...]: the arrays, now read only
+        """
+        for array in arrays:
+            if array is not None:
+                array.flags.writeable = False
+        size = TessellationCache._nbytes(arrays)
+        if size > self.max_bytes:
+            return arrays
+
+        shape_key = TessellationCache._shape_key(local_shape)
+        key = shape_key + (tolerance, angular_tolerance)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (local_shape, arrays)
+            self._buckets.setdefault(shape_key, []).append(key)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+        return arrays
+
+    def _remove(self, key: tuple):
+        """Remove an entry, the lock must be held"""
+        self.nbytes -= TessellationCache._nbytes(self._entries.pop(key)[1])
+        bucket = self._buckets[key[:2]]
+        bucket.remove(key)
+        if not bucket:
+            del self._buckets[key[:2]]
+
+    def clear(self):
+        """Remove all of the cached meshes"""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+#: Cache used by Shape.tessellate_arrays
+tessellation_cache = TessellationCache()
+
+
 class ThreeMF:
     """3MF exporter"""
 
@@ -6583,29 +7611,51 @@ class ThreeMF:
         CORE = "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"
         MODEL = "http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"
 
+    # Number of vertices or triangles formatted per write
+    CHUNK_SIZE = 2**16
+
     def __init__(
         self,
         shape: Shape,
         tolerance: float,
         angular_tolerance: float,
         unit: Unit = Unit.MILLIMETER,
+        compression_level: int = None,
     ):
         """
         Initialize the writer.
-        Used to write the given Shape to a 3MF file.
+        Used to write the given Shape to a 3MF file. Children of a Compound that
+        share a TShape are meshed once and placed with component transforms.
         """
         self.unit = unit.name.lower()
+        self.tolerance = tolerance
+        self.angular_tolerance = angular_tolerance
+        self.compression_level = compression_level
 
         if isinstance(shape, Compound):
             shapes = list(shape)
         else:
             shapes = [shape]
 
-        tessellations = [s.tessellate(tolerance, angular_tolerance) for s in shapes]
-        # Remove shapes that did not tesselate
-        self.tessellations = [t for t in tessellations if all(t)]
+        # Unique shapes at the origin and the (mesh index, location) of each child
+        self.meshes: list[Shape] = []
+        self.components: list[tuple[int, Location]] = []
+        mesh_indices: dict[tuple[int, int], list[int]] = {}
+        for child in shapes:
+            local_shape = child.wrapped.Located(TopLoc_Location())
+            candidates = mesh_indices.setdefault(
+                TessellationCache._shape_key(local_shape), []
+            )
+            for index in candidates:
+                if self.meshes[index].wrapped.IsEqual(local_shape):
+                    break
+            else:
+                index = len(self.meshes)
+                candidates.append(index)
+                self.meshes.append(Shape.cast(local_shape))
+            self.components.append((index, child.location))
 
-    def write_3mf(self, file_name: str):
+    def write_3mf(self, file_name: Union[str, BinaryIO]):
         """
         Write to the given file.
         """
@@ -6617,85 +7667,77 @@ class ThreeMF:
         except ImportError:
             compression = ZIP_STORED
 
-        with ZipFile(file_name, "w", compression) as zip_file:
+        with ZipFile(
+            file_name, "w", compression, compresslevel=self.compression_level
+        ) as zip_file:
             zip_file.writestr("_rels/.rels", self._write_relationships())
             zip_file.writestr("[Content_Types].xml", self._write_content_types())
-            zip_file.writestr("3D/3dmodel.model", self._write_3d())
-
-    def _write_3d(self) -> str:
-        no_meshes = len(self.tessellations)
-
-        model = ET.Element(
-            "model",
-            {
-                "xml:lang": "en-US",
-                "xmlns": ThreeMF.Schemas.CORE,
-            },
-            unit=self.unit,
+            with zip_file.open("3D/3dmodel.model", "w") as model_file:
+                for chunk in self._write_3d():
+                    model_file.write(chunk.encode("utf-8"))
+
+    def _write_3d(self) -> Iterator[str]:
+        """Generate the model xml one piece at a time"""
+        yield (
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            f'<model xmlns="{ThreeMF.Schemas.CORE}" unit="{self.unit}" xml:lang="en-US">'
+            '<metadata name="Application">Build123d 3MF Exporter</metadata>'
+            f'<metadata name="CreationDate">{datetime.now().isoformat()}</metadata>'
+            "<resources>"
         )
 
-        # Add meta data
-        ET.SubElement(
-            model, "metadata", name="Application"
-        ).text = "Build123d 3MF Exporter"
-        ET.SubElement(
-            model, "metadata", name="CreationDate"
-        ).text = datetime.now().isoformat()
-
-        resources = ET.SubElement(model, "resources")
-
-        # Add all meshes to resources
-        for i, tessellation in enumerate(self.tessellations):
-            self._add_mesh(resources, str(i), tessellation)
-
-        # Create a component of all meshes
-        comp_object = ET.SubElement(
-            resources,
-            "object",
-            id=str(no_meshes),
-            name="Build123d Component",
-            type="model",
-        )
-        components = ET.SubElement(comp_object, "components")
-
-        # Add all meshes to the component
-        for i in range(no_meshes):
-            ET.SubElement(
-                components,
-                "component",
-                objectid=str(i),
+        # Add each unique mesh to resources, skipping shapes that did not tessellate
+        object_ids: dict[int, int] = {}
+        for index, mesh_shape in enumerate(self.meshes):
+            vertices, triangles, _ = mesh_shape.tessellate_welded(
+                self.tolerance, self.angular_tolerance
             )
+            if len(triangles) == 0:
+                continue
+            object_ids[index] = len(object_ids)
+            yield from self._add_mesh(str(object_ids[index]), vertices, triangles)
+
+        # Create a component of all of the placed meshes
+        yield (
+            f'<object id="{len(object_ids)}" name="Build123d Component" type="model">'
+            "<components>"
+        )
+        for index, location in self.components:
+            if index not in object_ids:
+                continue
+            yield f'<component objectid="{object_ids[index]}"'
+            transform = LocationArray._to_matrix(location)
+            if not np.allclose(transform, np.eye(4), rtol=0, atol=1e-12):
+                # 3MF transforms points as row vectors
+                values = np.vstack([transform[:3, :3].T, transform[:3, 3]]).ravel()
+                yield ' transform="' + " ".join(map(str, values.tolist())) + '"'
+            yield " />"
+        yield "</components></object></resources>"
 
         # Add the component to the build
-        build = ET.SubElement(model, "build")
-        ET.SubElement(build, "item", objectid=str(no_meshes))
-
-        return ET.tostring(model, xml_declaration=True, encoding="utf-8")
+        yield f'<build><item objectid="{len(object_ids)}" /></build></model>'
 
     def _add_mesh(
-        self,
-        to: ET.Element,
-        id: str,
-        tessellation: tuple[list[Vector], list[tuple[int, int, int]]],
-    ):
-        obj = ET.SubElement(
-            to, "object", id=id, name=f"CadQuery Shape {id}", type="model"
-        )
-        mesh = ET.SubElement(obj, "mesh")
-
-        # add vertices
-        vertices = ET.SubElement(mesh, "vertices")
-        for vert in tessellation[0]:
-            ET.SubElement(
-                vertices, "vertex", x=str(vert.X), y=str(vert.Y), z=str(vert.Z)
+        self, id: str, vertices: np.ndarray, triangles: np.ndarray
+    ) -> Iterator[str]:
+        """Generate the xml of a mesh object from its buffers"""
+        yield f'<object id="{id}" name="CadQuery Shape {id}" type="model"><mesh>'
+
+        yield "<vertices>"
+        for start in range(0, len(vertices), ThreeMF.CHUNK_SIZE):
+            chunk = vertices[start : start + ThreeMF.CHUNK_SIZE]
+            yield '<vertex x="%r" y="%r" z="%r" />' * len(chunk) % tuple(
+                chunk.ravel().tolist()
             )
+        yield "</vertices>"
 
-        # add triangles
-        volume = ET.SubElement(mesh, "triangles")
-        for tess in tessellation[1]:
-            ET.SubElement(
-                volume, "triangle", v1=str(tess[0]), v2=str(tess[1]), v3=str(tess[2])
+        yield "<triangles>"
+        for start in range(0, len(triangles), ThreeMF.CHUNK_SIZE):
+            chunk = triangles[start : start + ThreeMF.CHUNK_SIZE]
+            yield '<triangle v1="%d" v2="%d" v3="%d" />' * len(chunk) % tuple(
+                chunk.ravel().tolist()
             )
+        yield "</triangles></mesh></object>"
 
     def _write_content_types(self) -> str:
         root = ET.Element("Types")
@@ -6730,6 +7772,232 @@ class ThreeMF:
         return ET.tostring(root, xml_declaration=True, encoding="utf-8")
 
 
+class GLTF:
+    """glTF 2.0 binary (GLB) exporter"""
+
+    METERS_PER_UNIT = {
+        Unit.MICRO: 1e-6,
+        Unit.MILLIMETER: 1e-3,
+        Unit.CENTIMETER: 1e-2,
+        Unit.METER: 1.0,
+        Unit.INCH: 0.0254,
+        Unit.FOOT: 0.3048,
+    }
+    COMPONENT_TYPES = {
+        np.dtype(np.int8): 5120,
+        np.dtype(np.int16): 5122,
+        np.dtype(np.uint16): 5123,
+        np.dtype(np.uint32): 5125,
+        np.dtype(np.float32): 5126,
+    }
+    ARRAY_BUFFER = 34962
+    ELEMENT_ARRAY_BUFFER = 34963
+
+    def __init__(
+        self,
+        shape: Shape,
+        tolerance: float = 1e-3,
+        angular_tolerance: float = 0.1,
+        unit: Unit = Unit.MILLIMETER,
+        quantize: bool = False,
+    ):
+        """
+        Initialize the writer.
+        Used to write the given Shape to a GLB file. The assembly tree of a Compound
+        becomes the node hierarchy with the label, color and location of each
+        shape; leaves sharing a TShape and color share one glTF mesh.
+        """
+        self.tolerance = tolerance
+        self.angular_tolerance = angular_tolerance
+        self.quantize = quantize
+        self.buffer = bytearray()
+        self.gltf: dict[str, Any] = {
+            "asset": {"version": "2.0", "generator": "build123d"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [],
+            "meshes": [],
+            "materials": [],
+            "accessors": [],
+            "bufferViews": [],
+        }
+        if quantize:
+            self.gltf["extensionsUsed"] = ["KHR_mesh_quantization"]
+            self.gltf["extensionsRequired"] = ["KHR_mesh_quantization"]
+        # shape key -> [(local shape, color, mesh index, dequantization matrix)]
+        self._meshes: dict[tuple, list[tuple]] = {}
+        self._materials: dict[tuple, int] = {}
+
+        # glTF is Y up in meters
+        scale = GLTF.METERS_PER_UNIT[unit]
+        root = np.array(
+            [[scale, 0, 0, 0], [0, 0, scale, 0], [0, -scale, 0, 0], [0, 0, 0, 1]]
+        )
+        self._add_node(
+            shape, None, root @ LocationArray._to_matrix(shape.location), None
+        )
+        for key in ["meshes", "materials", "accessors", "bufferViews"]:
+            if not self.gltf[key]:
+                del self.gltf[key]
+        if self.buffer:
+            self.gltf["buffers"] = [{"byteLength": len(self.buffer)}]
+
+    def write_glb(self, file_name: Union[str, BinaryIO]):
+        """
+        Write to the given file.
+        """
+        if isinstance(file_name, (str, os.PathLike)):
+            with open(file_name, "wb") as glb_file:
+                self.write_glb(glb_file)
+            return
+
+        json_chunk = json.dumps(self.gltf, separators=(",", ":")).encode("utf-8")
+        json_chunk += b" " * (-len(json_chunk) % 4)
+        chunks = [(json_chunk, 0x4E4F534A)]
+        if self.buffer:
+            self.buffer.extend(b"\0" * (-len(self.buffer) % 4))
+            chunks.append((self.buffer, 0x004E4942))
+
+        length = 12 + sum(8 + len(data) for data, _ in chunks)
+        file_name.write(np.array([0x46546C67, 2, length], dtype="<u4").tobytes())
+        for data, chunk_type in chunks:
+            file_name.write(np.array([len(data), chunk_type], dtype="<u4").tobytes())
+            file_name.write(data)
+
+    def _add_node(
+        self,
+        shape: Shape,
+        parent: Optional[dict],
+        matrix: np.ndarray,
+        color: Optional[Color],
+    ):
+        """Add the node of shape and its assembly children"""
+        color = shape.color if shape.color is not None else color
+        node: dict[str, Any] = {}
+        self.gltf["nodes"].append(node)
+        if parent is not None:
+            parent.setdefault("children", []).append(len(self.gltf["nodes"]) - 1)
+        if shape.label:
+            node["name"] = shape.label
+
+        if isinstance(shape, Compound) and shape.children:
+            for child in shape.children:
+                self._add_node(
+                    child, node, LocationArray._to_matrix(child.location), color
+                )
+        elif shape.wrapped is not None:
+            mesh = self._add_mesh(shape.wrapped.Located(TopLoc_Location()), color)
+            if mesh is not None:
+                node["mesh"], dequantize = mesh
+                matrix = matrix @ dequantize
+        if not np.allclose(matrix, np.eye(4), rtol=0, atol=1e-12):
+            node["matrix"] = matrix.T.ravel().tolist()
+
+    def _add_mesh(
+        self, local_shape: TopoDS_Shape, color: Optional[Color]
+    ) -> Optional[tuple[int, np.ndarray]]:
+        """Find or create the mesh of the shape with the given color"""
+        rgba = None if color is None else color.to_tuple()
+        candidates = self._meshes.setdefault(
+            TessellationCache._shape_key(local_shape), []
+        )
+        for mesh_shape, mesh_rgba, mesh in candidates:
+            if mesh_rgba == rgba and mesh_shape.IsEqual(local_shape):
+                return mesh
+
+        vertices, triangles, normals = Shape.cast(local_shape).tessellate_arrays(
+            self.tolerance, self.angular_tolerance, normals=True, dtype=np.float32
+        )
+        if len(triangles) == 0:
+            mesh = None
+        else:
+            dequantize = np.eye(4)
+            if self.quantize:
+                low, high = vertices.min(axis=0), vertices.max(axis=0)
+                step = max(float((high - low).max()) / 65534, 1e-12)
+                center = (low + high) / 2
+                vertices = np.round((vertices - center) / step).astype(np.int16)
+                normals = np.round(normals * 127).astype(np.int8)
+                dequantize[:3, :3] *= step
+                dequantize[:3, 3] = center
+            position = self._add_accessor(vertices, GLTF.ARRAY_BUFFER, bounds=True)
+            normal = self._add_accessor(
+                normals, GLTF.ARRAY_BUFFER, normalized=self.quantize
+            )
+            indices = self._add_accessor(
+                triangles.ravel().astype(
+                    np.uint16 if len(vertices) < 2**16 else np.uint32
+                ),
+                GLTF.ELEMENT_ARRAY_BUFFER,
+            )
+            primitive = {
+                "attributes": {"POSITION": position, "NORMAL": normal},
+                "indices": indices,
+            }
+            if rgba is not None:
+                primitive["material"] = self._add_material(rgba)
+            self.gltf["meshes"].append({"primitives": [primitive]})
+            mesh = (len(self.gltf["meshes"]) - 1, dequantize)
+        candidates.append((local_shape, rgba, mesh))
+        return mesh
+
+    def _add_material(self, rgba: tuple[float, float, float, float]) -> int:
+        """Find or create the material of a color"""
+        if rgba not in self._materials:
+            # build123d colors default to an alpha of 0.0, treat that as opaque
+            material = {
+                "pbrMetallicRoughness": {
+                    "baseColorFactor": list(rgba[:3]) + [rgba[3] or 1.0],
+                    "metallicFactor": 0.0,
+                    "roughnessFactor": 0.5,
+                }
+            }
+            if 0.0 < rgba[3] < 1.0:
+                material["alphaMode"] = "BLEND"
+            self.gltf["materials"].append(material)
+            self._materials[rgba] = len(self.gltf["materials"]) - 1
+        return self._materials[rgba]
+
+    def _add_accessor(
+        self,
+        array: np.ndarray,
+        target: int,
+        normalized: bool = False,
+        bounds: bool = False,
+    ) -> int:
+        """Append array to the binary buffer and return its accessor index"""
+        accessor: dict[str, Any] = {
+            "componentType": GLTF.COMPONENT_TYPES[array.dtype],
+            "count": len(array),
+            "type": "VEC3" if array.ndim == 2 else "SCALAR",
+        }
+        if normalized:
+            accessor["normalized"] = True
+        if bounds:
+            accessor["min"] = array.min(axis=0).tolist()
+            accessor["max"] = array.max(axis=0).tolist()
+
+        buffer_view: dict[str, Any] = {"buffer": 0, "target": target}
+        if array.ndim == 2 and array.strides[0] % 4:
+            # Vertex attributes must be 4 byte aligned so pad to four components
+            padded = np.zeros((len(array), 4), dtype=array.dtype)
+            padded[:, :3] = array
+            array = padded
+            buffer_view["byteStride"] = array.strides[0]
+
+        self.buffer.extend(b"\0" * (-len(self.buffer) % 4))
+        buffer_view["byteOffset"] = len(self.buffer)
+        buffer_view["byteLength"] = array.nbytes
+        self.buffer.extend(
+            np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+        )
+
+        self.gltf["bufferViews"].append(buffer_view)
+        accessor["bufferView"] = len(self.gltf["bufferViews"]) - 1
+        self.gltf["accessors"].append(accessor)
+        return len(self.gltf["accessors"]) - 1
+
+
 class Joint(ABC):
     """Joint
 
@@ -7290,6 +8558,285 @@ def edges_to_wires(edges: Iterable[Edge], tol: float = 1e-6) -> list[Wire]:
     return [Wire(el) for el in wires_out]
 
 
+@contextmanager
+def _open_text(
+    file: Union[str, os.PathLike, BinaryIO, TextIO],
+    encoding: str = "utf-8",
+    errors: str = "strict",
+) -> Iterator[TextIO]:
+    """Open a path for writing text or wrap a binary file object in a text stream
+
+    Text file objects are used as is and nothing passed in is closed, so output can
+    go to a BytesIO or a response body without touching the disk.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding=encoding, errors=errors) as text_file:
+            yield text_file
+    elif isinstance(file, TextIOBase):
+        yield file
+    else:
+        text_file = TextIOWrapper(file, encoding=encoding, errors=errors)
+        try:
+            yield text_file
+        finally:
+            text_file.flush()
+            text_file.detach()
+
+
+@contextmanager
+def _open_binary(file: Union[str, os.PathLike, BinaryIO, TextIO]) -> Iterator[BinaryIO]:
+    """Open a path for writing bytes, the counterpart of _open_text
+
+    Binary file objects are used as is. Output for a text file object is collected
+    in memory and written to it as utf-8 text when done.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as binary_file:
+            yield binary_file
+    elif isinstance(file, TextIOBase):
+        buffer = BytesIO()
+        yield buffer
+        file.write(buffer.getvalue().decode("utf-8"))
+    else:
+        yield file
+
+
+def _connected_components(count: int, first: np.ndarray, second: np.ndarray):
+    """Label the connected components of a graph given as arrays of node pairs
+
+    Args:
+        count (int): number of nodes
+        first (np.ndarray): one node of each link
+        second (np.ndarray): the other node of each link
+
+    Returns:
+        np.ndarray: (count,) index of the component of each node
+    """
+    labels = np.arange(count)
+    while True:
+        root_a, root_b = labels[first], labels[second]
+        linked = root_a != root_b
+        if not linked.any():
+            break
+        # Hook the larger root on the smaller one, then compress the paths
+        np.minimum.at(
+            labels,
+            np.maximum(root_a[linked], root_b[linked]),
+            np.minimum(root_a[linked], root_b[linked]),
+        )
+        while True:
+            compressed = labels[labels]
+            if (compressed == labels).all():
+                break
+            labels = compressed
+    return np.unique(labels, return_inverse=True)[1].reshape(-1)
+
+
+def _weld_points(
+    points: np.ndarray, tolerance: float = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge identical points, or points within tolerance of each other
+
+    Points are compared against the points in the neighbouring cells of a tolerance
+    sized grid, so close points either side of a cell boundary are merged too. A
+    chain of points each within tolerance of the next becomes a single point.
+
+    Args:
+        points (np.ndarray): (N, 3) coordinates
+        tolerance (float, optional): merge distance. Defaults to None (identical).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: index of the first point of each merged
+        point and (N,) index of the merged point that each point became
+    """
+    # Adding zero turns -0.0 into 0.0, otherwise their bytes differ
+    keys = np.ascontiguousarray(points + 0.0)
+    # Rows as single opaque items make unique much faster than axis=0
+    rows = keys.view(np.dtype((np.void, keys.dtype.itemsize * 3))).reshape(-1)
+    _, keep, remap = np.unique(rows, return_index=True, return_inverse=True)
+    remap = remap.reshape(-1)
+    if not tolerance or len(keep) < 2:
+        return keep, remap
+
+    unique = np.asarray(points[keep], dtype=np.float64)
+    cells = np.floor(unique / tolerance).astype(np.int64)
+    # Sorted cells make the searches below much faster
+    spatial = np.lexsort(cells.T[::-1])
+    unique, cells, keep = unique[spatial], cells[spatial], keep[spatial]
+    remap = np.argsort(spatial)[remap]
+
+    def find(sorted_values: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Index of each value in sorted_values, -1 if it isn't there"""
+        index = np.searchsorted(sorted_values, values).clip(max=len(sorted_values) - 1)
+        return np.where(sorted_values[index] == values, index, -1)
+
+    # Number the cells and their neighbours one axis at a time, so the keys can't
+    # overflow, for half of the neighbourhood which finds each pair of cells once
+    cell_ids = {(): np.zeros(len(cells), dtype=np.int64)}
+    for axis in range(3):
+        axis_values = np.unique(cells[:, axis])
+        steps = {step: find(axis_values, cells[:, axis] + step) for step in (-1, 0, 1)}
+        key_values = np.unique(cell_ids[(0,) * axis] * len(axis_values) + steps[0])
+        previous, cell_ids = cell_ids, {}
+        for offset, ids in previous.items():
+            for step, index in steps.items():
+                if offset + (step,) >= (0,) * (axis + 1):
+                    key_ids = find(key_values, ids * len(axis_values) + index)
+                    cell_ids[offset + (step,)] = np.where(
+                        (ids < 0) | (index < 0), -1, key_ids
+                    )
+
+    # The points of each cell
+    order = np.argsort(cell_ids[(0, 0, 0)], kind="stable")
+    cell_counts = np.bincount(cell_ids[(0, 0, 0)])
+    cell_starts = np.cumsum(cell_counts) - cell_counts
+    first, second = [], []
+    for offset, neighbours in cell_ids.items():
+        starts = cell_starts[neighbours]
+        counts = np.where(neighbours < 0, 0, cell_counts[neighbours])
+        point_a = np.repeat(np.arange(len(cells)), counts)
+        rank = np.arange(len(point_a)) - np.repeat(np.cumsum(counts) - counts, counts)
+        point_b = order[np.repeat(starts, counts) + rank]
+        close = np.linalg.norm(unique[point_a] - unique[point_b], axis=1) <= tolerance
+        if offset == (0, 0, 0):
+            close &= point_a < point_b
+        first.append(point_a[close])
+        second.append(point_b[close])
+
+    groups = _connected_components(
+        len(unique), np.concatenate(first), np.concatenate(second)
+    )
+    merged = np.full(groups.max() + 1, len(points))
+    np.minimum.at(merged, groups, keep)
+    return merged, groups[remap]
+
+
+def _point_array(points: np.ndarray, dims: int) -> np.ndarray:
+    """Validate an array of points and return it as float64 with a z coordinate
+
+    Args:
+        points (np.ndarray): array of shape (..., 3) or (..., 2)
+        dims (int): number of leading dimensions, e.g. 1 for (N, 3)
+
+    Raises:
+        ValueError: invalid array shape
+
+    Returns:
+        np.ndarray: array of shape (..., 3)
+    """
+    array = np.asarray(points, dtype=np.float64)
+    if array.ndim != dims + 1 or array.shape[-1] not in (2, 3) or 0 in array.shape:
+        raise ValueError(
+            f"Expected a {dims + 1}D array of 2D or 3D points, got shape {array.shape}"
+        )
+    if array.shape[-1] == 2:
+        array = np.concatenate([array, np.zeros(array.shape[:-1] + (1,))], axis=-1)
+    return array
+
+
+def _occt_point_array(
+    points: np.ndarray,
+) -> Union[TColgp_HArray1OfPnt, TColgp_HArray2OfPnt]:
+    """Fill an OCCT point array from an (N, 3) or (N, M, 3) array"""
+    if points.ndim == 2:
+        occt_points = TColgp_HArray1OfPnt(1, len(points))
+        for i, (x_val, y_val, z_val) in enumerate(points.tolist(), start=1):
+            occt_points.SetValue(i, gp_Pnt(x_val, y_val, z_val))
+    else:
+        occt_points = TColgp_HArray2OfPnt(1, points.shape[0], 1, points.shape[1])
+        for i, row in enumerate(points.tolist(), start=1):
+            for j, (x_val, y_val, z_val) in enumerate(row, start=1):
+                occt_points.SetValue(i, j, gp_Pnt(x_val, y_val, z_val))
+    return occt_points
+
+
+def _hidden_line_removal(
+    shapes: Iterable[Shape],
+    projector: HLRAlgo_Projector,
+    fast: bool = False,
+    tolerance: float = None,
+    angular_tolerance: float = 1.0,
+) -> tuple[list[TopoDS_Shape], list[TopoDS_Shape]]:
+    """Project shapes with hidden line removal
+
+    By default the exact HLRBRep_Algo is used. The fast mode runs HLRBRep_PolyAlgo on
+    the tessellation of the faces instead, which is quicker on detailed shapes but
+    creates polygonal edges. A fine enough existing mesh of a shape is used, otherwise
+    a copy of the shape is meshed first, which adds to the time. Shapes without faces, which can't be tessellated, are
+    always projected exactly.
+
+    Args:
+        shapes (Iterable[Shape]): shapes to project
+        projector (HLRAlgo_Projector): the view
+        fast (bool, optional): use polygonal hidden line removal. Defaults to False.
+        tolerance (float, optional): tessellation tolerance of the fast mode.
+            Defaults to None (0.2% of the size of the shapes).
+        angular_tolerance (float, optional): tessellation angular tolerance of the
+            fast mode in radians. Defaults to 1.0.
+
+    Returns:
+        tuple[list[TopoDS_Shape], list[TopoDS_Shape]]: compounds of the visible
+        (sharp, smooth and outline) and hidden (sharp and outline) edges
+    """
+    exact, polygonal = [], []
+    for shape in shapes:
+        (polygonal if fast and shape.faces() else exact).append(shape)
+    hlr_results = []
+
+    if exact:
+        hidden_line_removal = HLRBRep_Algo()
+        for shape in exact:
+            hidden_line_removal.Add(shape.wrapped)
+        hidden_line_removal.Projector(projector)
+        hidden_line_removal.Update()
+        hidden_line_removal.Hide()
+        hlr_results.append(HLRBRep_HLRToShape(hidden_line_removal))
+
+    if polygonal:
+        if tolerance is None:
+            # the optimal bounding box can take longer than the projection and the
+            # fast one meshes the shape, so the box of the geometry is used
+            bbox = Bnd_Box()
+            BRepBndLib.Add_s(Compound.make_compound(polygonal).wrapped, bbox, False)
+            tolerance = 2e-3 * BoundBox(bbox).diagonal
+        poly_hidden_line_removal = HLRBRep_PolyAlgo()
+        for shape in polygonal:
+            # A fine enough existing mesh is used, otherwise a bare copy is meshed
+            # so the (possibly shared) TShapes of the shape aren't changed
+            mesh_shape = shape.wrapped
+            if not BRepTools.Triangulation_s(mesh_shape, tolerance):
+                mesh_shape = BRepBuilderAPI_Copy(mesh_shape, False, False).Shape()
+                BRepMesh_IncrementalMesh(
+                    mesh_shape, tolerance, True, angular_tolerance, True
+                )
+            poly_hidden_line_removal.Load(mesh_shape)
+        poly_hidden_line_removal.Projector(projector)
+        poly_hidden_line_removal.Update()
+        poly_hlr_shapes = HLRBRep_PolyHLRToShape()
+        poly_hlr_shapes.Update(poly_hidden_line_removal)
+        hlr_results.append(poly_hlr_shapes)
+
+    visible_edges = []
+    hidden_edges = []
+    for hlr_shapes in hlr_results:
+        for edges in (
+            hlr_shapes.VCompound(),
+            hlr_shapes.Rg1LineVCompound(),
+            hlr_shapes.OutLineVCompound(),
+        ):
+            if not edges.IsNull():
+                visible_edges.append(edges)
+        for edges in (hlr_shapes.HCompound(), hlr_shapes.OutLineHCompound()):
+            if not edges.IsNull():
+                hidden_edges.append(edges)
+
+    # Fix the underlying geometry - otherwise we will get segfaults
+    for edges in visible_edges + hidden_edges:
+        BRepLib.BuildCurves3d_s(edges, TOLERANCE)
+
+    return visible_edges, hidden_edges
+
+
 def fix(obj: TopoDS_Shape) -> TopoDS_Shape:
     """Fix a TopoDS object to suitable specialized type
 
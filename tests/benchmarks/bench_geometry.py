@@ -0,0 +1,84 @@
+"""
+
+build123d geometry micro-benchmarks
+
+name: bench_geometry.py
+by:   Gumyr
+date: October 19th 2026
+
+desc:
+    Micro-benchmarks of the Vector operations used in hot loops (location
+    generation, alignment, exporters). Each operation is timed on build123d's
+    Vector and on the equivalent OCCT gp_Vec calls, which is how Vector used
+    to be implemented, so the speedup of the pure Python fast path is visible.
+
+    Run with:  python tests/benchmarks/bench_geometry.py [--number N]
+
+license:
+
+    Copyright 2023 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+import argparse
+import timeit
+from typing import Callable
+
+from OCP.gp import gp_Vec
+from build123d import Vector
+
+V1, V2 = Vector(1, 2, 3), Vector(4, 5, 6)
+G1, G2 = gp_Vec(1, 2, 3), gp_Vec(4, 5, 6)
+
+# name: (build123d Vector operation, OCCT gp_Vec equivalent)
+CASES: dict[str, tuple[Callable, Callable]] = {
+    "create": (lambda: Vector(1, 2, 3), lambda: gp_Vec(1, 2, 3)),
+    "add": (lambda: V1 + V2, lambda: G1.Added(G2)),
+    "sub": (lambda: V1 - V2, lambda: G1.Subtracted(G2)),
+    "mul": (lambda: V1 * 2.5, lambda: G1.Multiplied(2.5)),
+    "dot": (lambda: V1.dot(V2), lambda: G1.Dot(G2)),
+    "cross": (lambda: V1.cross(V2), lambda: G1.Crossed(G2)),
+    "length": (lambda: V1.length, lambda: G1.Magnitude()),
+    "normalized": (lambda: V1.normalized(), lambda: G1.Normalized()),
+    "X/Y/Z": (lambda: (V1.X, V1.Y, V1.Z), lambda: (G1.X(), G1.Y(), G1.Z())),
+    "to_tuple": (lambda: V1.to_tuple(), lambda: (G1.X(), G1.Y(), G1.Z())),
+}
+
+
+def run(number: int) -> dict[str, tuple[float, float]]:
+    """Time each case, returning the best time per call in µs for both variants"""
+    results = {}
+    for name, (vector_op, occt_op) in CASES.items():
+        results[name] = tuple(
+            min(timeit.repeat(op, number=number, repeat=5)) / number * 1e6
+            for op in (vector_op, occt_op)
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("desc:")[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'operation':<12}{'Vector µs':>12}{'gp_Vec µs':>12}{'ratio':>8}")
+    for name, (vector_time, occt_time) in run(args.number).items():
+        print(
+            f"{name:<12}{vector_time:>12.3f}{occt_time:>12.3f}"
+            f"{occt_time / vector_time:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
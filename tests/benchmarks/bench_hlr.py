@@ -0,0 +1,100 @@
+"""
+
+build123d hidden line removal benchmarks
+
+name: bench_hlr.py
+by:   Gumyr
+date: October 19th 2026
+
+desc:
+    Compare the exact (HLRBRep_Algo) and fast polygonal (HLRBRep_PolyAlgo) hidden
+    line removal modes of Drawing on a few detailed parts. The fast mode is timed
+    both cold, when a copy of the shape has to be tessellated first, and warm,
+    when the shape has already been meshed with Shape.mesh.
+
+    Run with:  python tests/benchmarks/bench_hlr.py [--repeat N] [--tolerance T]
+
+license:
+
+    Copyright 2023 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+import argparse
+import timeit
+from typing import Callable, Union
+
+from build123d import *
+from build123d.exporters import Drawing, drawing_cache
+
+
+def perforated_plate() -> Part:
+    """A plate with a grid of filleted holes"""
+    with BuildPart() as plate:
+        Box(150, 150, 10)
+        with GridLocations(10, 10, 14, 14):
+            Cylinder(3, 10, mode=Mode.SUBTRACT)
+        fillet(plate.edges().filter_by(GeomType.CIRCLE), 1)
+    return plate.part
+
+
+def extruded_text() -> Compound:
+    """Text extruded into solids, lots of free form edges"""
+    text = Compound.make_text("build123d hidden line removal", 10)
+    return Compound.make_compound(
+        [Solid.extrude_linear(face, (0, 0, 3)) for face in text.faces()]
+    )
+
+
+SHAPES: dict[str, Callable[[], Union[Part, Compound]]] = {
+    "plate": perforated_plate,
+    "text": extruded_text,
+}
+
+
+def best_time(shape: Union[Part, Compound], repeat: int, **kwargs) -> float:
+    """The best time of a Drawing of shape in s"""
+    return min(timeit.repeat(lambda: Drawing(shape, **kwargs), number=1, repeat=repeat))
+
+
+def run(repeat: int, tolerance: float = None) -> dict[str, tuple[float, float, float]]:
+    """Time each shape, returning the best exact, fast cold and fast warm times in s"""
+    # Every run has to project the shape rather than reuse the cached lines
+    drawing_cache.max_entries = 0
+    results = {}
+    for name, make_shape in SHAPES.items():
+        shape = make_shape()
+        # The default tolerance of the fast mode, so the warm run uses the mesh
+        fast_tolerance = tolerance or 2e-3 * shape.bounding_box().diagonal
+        exact = best_time(shape, repeat)
+        cold = best_time(shape, repeat, fast=True, tolerance=fast_tolerance)
+        shape.mesh(fast_tolerance, 1.0)
+        warm = best_time(shape, repeat, fast=True, tolerance=fast_tolerance)
+        results[name] = (exact, cold, warm)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("desc:")[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=None)
+    args = parser.parse_args()
+
+    print(f"{'shape':<8}{'exact s':>10}{'fast s':>10}{'warm s':>10}{'ratio':>8}")
+    for name, (exact, cold, warm) in run(args.repeat, args.tolerance).items():
+        print(f"{name:<8}{exact:>10.3f}{cold:>10.3f}{warm:>10.3f}{exact / cold:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,8 @@ license:
 """
 import unittest
 from math import pi
+
+import numpy as np
 from build123d import *
 from build123d import Builder, WorkplaneList, LocationList
 
@@ -528,6 +530,140 @@ class TestLocations(unittest.TestCase):
             GridLocations(2, 2, 2, 2) * "error"
 
 
+    def test_location_array(self):
+        self.assertIsInstance(GridLocations(4, 4, 20, 20).locations, list)
+        grid = GridLocations(4, 4, 20, 20).location_array
+        self.assertIsInstance(grid, LocationArray)
+        pos = grid.positions
+        mask = pos.X**2 + pos.Y**2 < 25
+        self.assertEqual(len(grid[mask]), 4)
+
+        with BuildSketch():
+            with Locations(grid[mask]) as l:
+                self.assertEqual(len(l.local_locations), 4)
+
+        with BuildSketch():
+            with Locations(pos):
+                self.assertEqual(len(LocationList._get_context().locations), 400)
+
+    def test_mask(self):
+        grid = GridLocations(1, 1, 10, 10, mask=lambda pts: pts.X**2 + pts.Y**2 < 4)
+        self.assertEqual(len(grid.local_locations), 12)
+        self.assertTrue(all(loc.position.length < 2 for loc in grid))
+
+        mask = np.zeros(20, dtype=bool)
+        mask[:3] = True
+        self.assertEqual(len(HexLocations(1, 4, 5, mask=mask).local_locations), 3)
+
+        polar = PolarLocations(5, 8, mask=lambda pts: pts.Y > 0.1)
+        self.assertEqual(len(polar.local_locations), 3)
+        self.assertTupleAlmostEquals(
+            polar.local_locations[1].orientation.to_tuple(), (0, 0, 90), 5
+        )
+
+        with self.assertRaises(ValueError):
+            GridLocations(1, 1, 2, 2, mask=np.ones(3, dtype=bool))
+
+    def test_mask_shape(self):
+        circle = Face.make_from_wires(Wire.make_circle(3))
+        grid = GridLocations(1, 1, 100, 100, mask=circle)
+        self.assertEqual(len(grid.local_locations), 32)
+        # Shapes are tested at the global positions of the locations
+        with BuildSketch():
+            with Locations((10, 0)):
+                nested = GridLocations(1, 1, 100, 100, mask=circle)
+                self.assertEqual(len(nested.local_locations), 32)
+                self.assertTrue(all(loc.position.length <= 3 for loc in nested))
+        with BuildSketch(Plane.XZ):
+            on_xz = GridLocations(1, 1, 100, 100, mask=Plane.XZ * circle)
+            self.assertEqual(len(on_xz.local_locations), 32)
+            self.assertTrue(all(abs(loc.position.Y) < 1e-9 for loc in on_xz))
+            self.assertEqual(
+                len(GridLocations(1, 1, 100, 100, mask=circle).local_locations), 0
+            )
+
+        # Planar faces are classified with numpy and other shapes with OCCT alike
+        def ring(pts):
+            radii = pts.X**2 + pts.Y**2
+            return (radii >= 9) & (radii <= 36)
+
+        expected = GridLocations(1, 1, 21, 21, mask=ring).local_locations
+        ring_face = Face.make_from_wires(Wire.make_circle(6), [Wire.make_circle(3)])
+        ring_solid = Solid.extrude_linear(ring_face, (0, 0, 2)).moved(
+            Location((0, 0, -1))
+        )
+        split_ring = ring_face.split(Face.make_rect(20, 20, Plane.YZ))
+        self.assertEqual(len(split_ring.faces()), 2)
+        for mask in [ring_face, split_ring, ring_solid]:
+            with self.subTest(mask=mask):
+                grid = GridLocations(1, 1, 21, 21, mask=mask)
+                self.assertEqual(
+                    [loc.position.to_tuple() for loc in grid.local_locations],
+                    [loc.position.to_tuple() for loc in expected],
+                )
+
+    def test_hex_order(self):
+        pts = [
+            loc.position.to_tuple()
+            for loc in HexLocations(1, 2, 2, align=(Align.MIN, Align.MIN))
+        ]
+        self.assertEqual(len(pts), 4)
+        self.assertTupleAlmostEquals(pts[0], (0, 0, 0), 5)
+        self.assertTupleAlmostEquals(pts[1], (0, 2, 0), 5)
+        self.assertTupleAlmostEquals(pts[2], (3**0.5, 1, 0), 5)
+        self.assertTupleAlmostEquals(pts[3], (3**0.5, 3, 0), 5)
+
+
+class TestPrimitiveCache(unittest.TestCase):
+    def setUp(self):
+        primitive_cache.clear()
+
+    def test_shared_tshape(self):
+        box0 = Box(1, 2, 3)
+        box1 = Box(1, 2, 3, align=Align.MIN)
+        self.assertEqual(primitive_cache.misses, 1)
+        self.assertEqual(primitive_cache.hits, 1)
+        self.assertTrue(
+            box0.solids()[0].wrapped.TShape() == box1.solids()[0].wrapped.TShape()
+        )
+        self.assertTupleAlmostEquals(box1.bounding_box().min.to_tuple(), (0, 0, 0), 5)
+        self.assertTupleAlmostEquals(
+            box0.bounding_box().min.to_tuple(), (-0.5, -1, -1.5), 5
+        )
+
+    def test_builder_instances(self):
+        with BuildSketch() as sketch:
+            with GridLocations(5, 5, 3, 3):
+                Circle(1)
+        self.assertEqual(len(sketch.faces()), 9)
+        self.assertEqual(len(primitive_cache), 1)
+        with BuildPart():
+            with Locations((0, 0, 0), (10, 0, 0)):
+                holes = Cylinder(1, 2, mode=Mode.PRIVATE)
+        self.assertEqual(len(holes.solids()), 2)
+        self.assertTrue(
+            holes.solids()[0].wrapped.TShape() == holes.solids()[1].wrapped.TShape()
+        )
+
+    def test_bounded(self):
+        cache = PrimitiveCache(maxsize=2)
+        for size in range(1, 4):
+            cache.get(("box", size), lambda: Solid.make_box(size, size, size))
+        self.assertEqual(len(cache), 2)
+        cache.get(("box", 1), lambda: Solid.make_box(1, 1, 1))
+        self.assertEqual(cache.misses, 4)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled(self):
+        cache = PrimitiveCache(maxsize=0)
+        cache.get(("box",), lambda: Solid.make_box(1, 1, 1))
+        self.assertEqual(len(cache), 0)
+        cache = PrimitiveCache()
+        cache.get(("box", [1]), lambda: Solid.make_box(1, 1, 1))
+        self.assertEqual(len(cache), 0)
+
+
 class TestVectorExtensions(unittest.TestCase):
     def test_vector_localization(self):
         self.assertTupleAlmostEquals(
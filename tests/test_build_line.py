@@ -27,6 +27,7 @@ license:
 """
 import unittest
 from math import sqrt, pi
+import numpy as np
 from build123d import *
 
 
@@ -198,6 +199,29 @@ class BuildLineTests(unittest.TestCase):
         self.assertEqual(len(test.edges()), 4)
         self.assertAlmostEqual(test.wires()[0].length, 4)
 
+    def test_polyline_array(self):
+        """Test polyline creation from a numpy array"""
+        points = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+        with BuildLine() as test:
+            Polyline(points, close=True)
+        self.assertEqual(len(test.edges()), 4)
+        self.assertAlmostEqual(test.wires()[0].length, 4)
+
+        with BuildLine(Plane.XZ) as test:
+            Polyline(points)
+        self.assertTupleAlmostEquals(
+            test.wires()[0].bounding_box().max.to_tuple(), (1, 0, 1), 5
+        )
+
+        with self.assertRaises(ValueError):
+            Polyline(np.array([(0, 0), (1, 1)]))
+
+    def test_spline_array(self):
+        """Test spline creation from a numpy array"""
+        with BuildLine() as test:
+            Spline(np.array([(0, 0), (1, 1), (2, 0)]))
+        self.assertTupleAlmostEquals((test.edges()[0] @ 1).to_tuple(), (2, 0, 0), 5)
+
     def test_wires_select_last(self):
         with BuildLine() as test:
             Line((0, 0), (0, 1))
@@ -1,14 +1,30 @@
 # system modules
 import copy
+import io
+import json
 import math
 import os
+import pickle
 import random
 import re
+import tempfile
 from typing import Optional
 import unittest
+import xml.etree.ElementTree as ET
 from random import uniform
+from zipfile import ZipFile
 
+import numpy as np
 from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
+from OCP.BRepTools import BRepTools
+from OCP.Quantity import Quantity_Color
+from OCP.STEPCAFControl import STEPCAFControl_Reader
+from OCP.TCollection import TCollection_ExtendedString
+from OCP.TDataStd import TDataStd_Name
+from OCP.TDF import TDF_Label, TDF_LabelSequence
+from OCP.TDocStd import TDocStd_Document
+from OCP.XCAFApp import XCAFApp_Application
+from OCP.XCAFDoc import XCAFDoc_ColorType, XCAFDoc_DocumentTool, XCAFDoc_ShapeTool
 from OCP.gp import (
     gp,
     gp_Ax1,
@@ -32,6 +48,7 @@ from build123d.build_enums import (
     Kind,
     PositionMode,
     SortBy,
+    Unit,
     Until,
 )
 from build123d.build_part import BuildPart
@@ -44,12 +61,23 @@ from build123d.geometry import (
     BoundBox,
     Color,
     Location,
+    LocationArray,
     Matrix,
     Rotation,
     Vector,
+    VectorArray,
     VectorLike,
 )
-from build123d.importers import import_brep, import_step, import_stl, import_svg
+from build123d.importers import (
+    StepAssembly,
+    StlMesh,
+    import_brep,
+    import_cache,
+    import_step,
+    import_stl,
+    import_stl_mesh,
+    import_svg,
+)
 from build123d.topology import (
     BallJoint,
     Compound,
@@ -64,10 +92,12 @@ from build123d.topology import (
     ShapeList,
     Shell,
     Solid,
+    TessellationCache,
     Vertex,
     Wire,
     edges_to_wires,
     polar,
+    tessellation_cache,
 )
 
 DEG2RAD = math.pi / 180
@@ -694,6 +724,26 @@ class TestEdge(DirectApiTestCase):
                 points=[(0, 0, 0), (1, 1, 0), (2, 0, 0)], tangents=[(1, 1, 0)]
             )
 
+    def test_spline_from_array(self):
+        points = np.array([(0, 0, 0), (1, 1, 0), (2, 0, 0)])
+        spline = Edge.make_spline(points)
+        self.assertVectorAlmostEquals(spline.end_point(), (2, 0, 0), 5)
+        self.assertAlmostEqual(
+            spline.length, Edge.make_spline([tuple(p) for p in points]).length, 5
+        )
+        with self.assertRaises(ValueError):
+            Edge.make_spline(np.zeros((3, 4)))
+
+    def test_make_lines(self):
+        segments = np.array([[(0, 0, 0), (1, 0, 0)], [(0, 0, 0), (0, 2, 0)]])
+        lines = Edge.make_lines(segments)
+        self.assertEqual(len(lines), 2)
+        self.assertAlmostEqual(lines[1].length, 2, 5)
+        self.assertVectorAlmostEquals(lines[0].end_point(), (1, 0, 0), 5)
+        self.assertEqual(len(Edge.make_lines(np.array([[(0, 0), (1, 1)]]))), 1)
+        with self.assertRaises(ValueError):
+            Edge.make_lines(np.zeros((2, 3, 3)))
+
     def test_spline_approx(self):
         spline = Edge.make_spline_approx([(0, 0), (1, 1), (2, 1), (3, 0)])
         self.assertVectorAlmostEquals(spline.end_point(), (3, 0, 0), 5)
@@ -918,6 +968,15 @@ class TestFace(DirectApiTestCase):
         self.assertVectorAlmostEquals(bbox.min, (0, 0, -1), 3)
         self.assertVectorAlmostEquals(bbox.max, (10, 10, 2), 2)
 
+    def test_surface_from_numpy_array_of_points(self):
+        x_vals, y_vals = np.meshgrid(np.arange(11.0), np.arange(11.0))
+        z_vals = np.cos(np.pi * x_vals / 10) + np.sin(np.pi * y_vals / 10)
+        pnts = np.stack([x_vals, y_vals, z_vals], axis=-1)
+        surface = Face.make_surface_from_array_of_points(pnts)
+        bbox = surface.bounding_box()
+        self.assertVectorAlmostEquals(bbox.min, (0, 0, -1), 3)
+        self.assertVectorAlmostEquals(bbox.max, (10, 10, 2), 2)
+
     def test_thicken(self):
         pnts = [
             [
@@ -1000,7 +1059,7 @@ class TestFunctions(unittest.TestCase):
         self.assertAlmostEqual(pnt[1], 0.5, 5)
 
 
-class TestImportExport(unittest.TestCase):
+class TestImportExport(DirectApiTestCase):
     def test_import_export(self):
         original_box = Solid.make_box(1, 1, 1)
         original_box.export_step("test_box.step")
@@ -1016,6 +1075,271 @@ class TestImportExport(unittest.TestCase):
         with self.assertRaises(ValueError):
             step_box = import_step("test_box.step")
 
+    def test_export_step_assembly(self):
+        bolt = Solid.make_cylinder(1, 10)
+        bolt.label, bolt.color = "bolt", Color(0.5, 0.5, 0.5)
+        bolts = [copy.copy(bolt).move(Location((5 * i, 0, 0))) for i in range(3)]
+        for instance in bolts:
+            instance.label, instance.color = bolt.label, bolt.color
+        plate = Solid.make_box(20, 10, 2)
+        plate.label = "plate"
+        assembly = Compound(label="assembly", children=[plate] + bolts)
+        assembly.export_step("assembly.step")
+
+        doc = TDocStd_Document(TCollection_ExtendedString("XmlOcaf"))
+        XCAFApp_Application.GetApplication_s().InitDocument(doc)
+        reader = STEPCAFControl_Reader()
+        reader.ReadFile("assembly.step")
+        reader.Transfer(doc)
+        os.remove("assembly.step")
+        shape_tool = XCAFDoc_DocumentTool.ShapeTool_s(doc.Main())
+        color_tool = XCAFDoc_DocumentTool.ColorTool_s(doc.Main())
+
+        free_labels = TDF_LabelSequence()
+        shape_tool.GetFreeShapes(free_labels)
+        self.assertEqual(free_labels.Length(), 1)
+        components = TDF_LabelSequence()
+        XCAFDoc_ShapeTool.GetComponents_s(free_labels.Value(1), components)
+        self.assertEqual(components.Length(), 4)
+
+        # The bolts are instances of one colored and named part
+        parts = []
+        for i in range(1, 5):
+            part = TDF_Label()
+            XCAFDoc_ShapeTool.GetReferredShape_s(components.Value(i), part)
+            parts.append(part)
+        self.assertEqual(len({part.Tag() for part in parts}), 2)
+        name = TDataStd_Name()
+        parts[1].FindAttribute(TDataStd_Name.GetID_s(), name)
+        self.assertEqual(name.Get().ToExtString(), "bolt")
+        color = Quantity_Color()
+        self.assertTrue(
+            color_tool.GetColor(parts[1], XCAFDoc_ColorType.XCAFDoc_ColorSurf, color)
+        )
+        self.assertAlmostEqual(color.Red(), 0.5, 2)
+        self.assertFalse(
+            color_tool.GetColor(parts[0], XCAFDoc_ColorType.XCAFDoc_ColorSurf, color)
+        )
+
+        # The plain STEPControl_Writer writes the shape without names and colors
+        assembly.export_step("flat.step", assembly=False)
+        with open("flat.step", encoding="utf-8") as step_file:
+            step_text = step_file.read()
+        self.assertNotIn("bolt", step_text)
+        self.assertNotIn("COLOUR_RGB", step_text)
+        self.assertAlmostEqual(import_step("flat.step").volume, assembly.volume, 5)
+        os.remove("flat.step")
+
+    def test_import_step_assembly(self):
+        bolt = Solid.make_cylinder(1, 10)
+        bolts = [copy.copy(bolt).move(Location((5 * i, 0, 0))) for i in range(3)]
+        for instance in bolts:
+            instance.label, instance.color = "bolt", Color(0, 0, 1)
+        assembly = Compound(
+            label="assembly",
+            children=[Compound(label="bolts", children=bolts)],
+        )
+        assembly.children[0].location = Location((0, 0, 5))
+        assembly.export_step("assembly.step")
+        with open("assembly.step", "rb") as step_file:
+            step_assembly = StepAssembly(step_file.read())
+        os.remove("assembly.step")
+
+        self.assertEqual(step_assembly.roots, ["assembly"])
+        imported = step_assembly.transfer("assembly")
+        self.assertIs(step_assembly.transfer(0), imported)
+        self.assertEqual(imported.label, "assembly")
+        bolt_group = imported.children[0]
+        self.assertEqual(bolt_group.label, "bolts")
+        self.assertVectorAlmostEquals(bolt_group.location.position, (0, 0, 5), 5)
+        self.assertEqual([child.label for child in bolt_group.children], ["bolt"] * 3)
+        self.assertVectorAlmostEquals(
+            bolt_group.children[2].location.position, (10, 0, 0), 5
+        )
+        self.assertTupleAlmostEquals(
+            bolt_group.children[2].color.to_tuple(), (0, 0, 1, 1), 5
+        )
+        self.assertTrue(
+            bolt_group.children[0].wrapped.TShape()
+            == bolt_group.children[2].wrapped.TShape()
+        )
+        self.assertAlmostEqual(imported.volume, 3 * bolt.volume, 5)
+
+        with self.assertRaises(ValueError):
+            step_assembly.transfer(1)
+
+    def test_binary_brep(self):
+        torus = Solid.make_torus(5, 1).moved(Location((1, 2, 3)))
+        torus.export_brep("torus.bbrep", binary=True)
+        stream = io.BytesIO()
+        self.assertTrue(torus.export_brep(stream, binary=True))
+        with open("torus.bbrep", "rb") as brep_file:
+            self.assertEqual(brep_file.read(), stream.getvalue())
+
+        for source in ["torus.bbrep", stream.getvalue(), io.BytesIO(stream.getvalue())]:
+            imported = import_brep(source)
+            self.assertAlmostEqual(imported.volume, torus.volume, 5)
+            self.assertVectorAlmostEquals(imported.position, (1, 2, 3), 5)
+        os.remove("torus.bbrep")
+
+        # Extruded text can't be read back from OCCT's default (VERSION_4) format
+        text = Compound.make_text("hi", 10)
+        solids = Compound.make_compound(
+            [Solid.extrude_linear(f, (0, 0, 3)) for f in text.faces()]
+        )
+        stream = io.BytesIO()
+        self.assertTrue(solids.export_brep(stream, binary=True))
+        imported = import_brep(stream.getvalue())
+        self.assertEqual(len(imported.solids()), len(solids.solids()))
+        self.assertAlmostEqual(imported.volume, solids.volume, 5)
+
+        text_stream = io.BytesIO()
+        torus.export_brep(text_stream)
+        text_stream.seek(0)
+        self.assertAlmostEqual(import_brep(text_stream).volume, torus.volume, 5)
+        with self.assertRaises(ValueError):
+            import_brep(b"not a brep")
+
+    def test_import_stl_mesh(self):
+        torus = Solid.make_torus(10, 1)
+        torus.export_stl("torus.stl")
+        torus.export_stl("torus_ascii.stl", ascii_format=True)
+        reference = import_stl("torus.stl")
+        try:
+            binary = import_stl_mesh("torus.stl")
+            ascii_mesh = import_stl_mesh("torus_ascii.stl", chunk_size=1000)
+            self.assertIsInstance(binary.triangle_vertices, np.memmap)
+            self.assertEqual(len(binary), len(ascii_mesh))
+            self.assertTrue(
+                np.allclose(binary.triangle_vertices, ascii_mesh.triangle_vertices)
+            )
+            self.assertTrue(np.allclose(binary.normals, ascii_mesh.normals, atol=1e-6))
+
+            vertices, triangles = binary.arrays()
+            self.assertEqual(triangles.dtype, np.int32)
+            self.assertEqual(len(triangles), len(binary))
+            self.assertLess(len(vertices), len(binary))
+            self.assertEqual(len(binary.arrays(weld=False)[0]), 3 * len(binary))
+            self.assertVectorAlmostEquals(binary.bounding_box().size, (22, 22, 2), 1)
+            self.assertAlmostEqual(binary.to_face().area, reference.area, 5)
+            Solid.make_box(1, 2, 3).export_stl("box.stl")
+            box = import_stl_mesh("box.stl").to_solid()
+            self.assertEqual(len(box.faces()), 6)
+            self.assertAlmostEqual(box.volume, 6, 5)
+        finally:
+            del binary
+            os.remove("torus.stl")
+            os.remove("torus_ascii.stl")
+            os.remove("box.stl")
+        with self.assertRaises(ValueError):
+            import_stl_mesh(__file__)
+
+    def test_stl_mesh_weld(self):
+        # Two triangles sharing an edge along the x axis, one with -0.0 corners
+        triangle_vertices = np.array(
+            [
+                [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+                [[1.0, -0.0, -0.0], [-0.0, -0.0, 0.0], [0.0, -1.0, 0.0]],
+            ],
+            dtype=np.float32,
+        )
+        mesh = StlMesh(triangle_vertices, np.zeros((2, 3), dtype=np.float32))
+        vertices, triangles = mesh.arrays()
+        self.assertEqual(len(vertices), 4)
+        self.assertEqual(set(triangles[0]) & set(triangles[1]), set(triangles[0][:2]))
+
+        # Close vertices either side of a grid cell boundary are merged
+        near = StlMesh(
+            np.array(
+                [
+                    [[0.4999, 0, 0], [5, 0, 0], [5, 5, 0]],
+                    [[0.5001, 0, 0], [5, 0, 0], [5, 10, 0]],
+                ]
+            ),
+            np.zeros((2, 3)),
+        )
+        self.assertEqual(len(near.arrays()[0]), 5)
+        vertices, triangles = near.arrays(weld_tolerance=1.0)
+        self.assertEqual(len(vertices), 4)
+        self.assertEqual(triangles[0][0], triangles[1][0])
+        self.assertAlmostEqual(vertices[triangles[0][0]][0], 0.4999)
+        # Points further apart than the tolerance stay separate
+        self.assertEqual(len(near.arrays(weld_tolerance=1e-4)[0]), 5)
+
+    def test_in_memory_io(self):
+        box = Solid.make_box(1, 2, 3)
+        step = io.BytesIO()
+        box.export_step(step)
+        for source in [step.getvalue(), io.BytesIO(step.getvalue())]:
+            self.assertAlmostEqual(import_step(source).volume, 6, 5)
+
+        stl = io.BytesIO()
+        box.export_stl(stl)
+        self.assertAlmostEqual(import_stl(stl.getvalue()).area, 22, 5)
+        self.assertEqual(len(import_stl_mesh(io.BytesIO(stl.getvalue()))), 12)
+
+        svg_bytes, svg_text = io.BytesIO(), io.StringIO()
+        box.export_svg(svg_bytes, (-10, -10, 10))
+        box.export_svg(svg_text, (-10, -10, 10))
+        self.assertEqual(svg_bytes.getvalue().decode(), svg_text.getvalue())
+        self.assertEqual(
+            len(import_svg(svg_bytes.getvalue())),
+            len(import_svg(io.StringIO(svg_text.getvalue()))),
+        )
+
+        dxf = io.BytesIO()
+        Face.make_rect(2, 3).export_dxf(dxf)
+        self.assertIn(b"AcDbLine", dxf.getvalue())
+
+        for export in [box.export_glb, box.export_3mf]:
+            output = io.BytesIO()
+            export(output, 1e-3, 0.1, Unit.MILLIMETER)
+            self.assertGreater(len(output.getvalue()), 0)
+
+    def test_import_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            import_cache.directory = cache_dir
+            import_cache.clear()
+            try:
+                Solid.make_box(1, 2, 3).export_step("cached_box.step")
+                Solid.make_sphere(1).export_stl("cached_ball.stl")
+                triangle_counts = set()
+                for _ in range(2):
+                    self.assertAlmostEqual(import_step("cached_box.step").volume, 6, 5)
+                    ball = import_stl("cached_ball.stl")
+                    triangle_counts.add(len(ball.tessellate_arrays(1)[1]))
+                self.assertEqual(len(triangle_counts), 1)
+                self.assertEqual((import_cache.hits, import_cache.misses), (2, 2))
+                self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+                # Unreadable entries are discarded and translated again
+                for entry in os.listdir(cache_dir):
+                    with open(os.path.join(cache_dir, entry), "r+b") as entry_file:
+                        entry_file.seek(40)
+                        entry_file.write(b"x" * 200)
+                self.assertAlmostEqual(import_step("cached_box.step").volume, 6, 5)
+                self.assertEqual(import_cache.misses, 3)
+                self.assertAlmostEqual(import_step("cached_box.step").volume, 6, 5)
+                self.assertEqual(import_cache.hits, 3)
+
+                # Changed contents are translated again
+                Solid.make_box(1, 1, 1).export_step("cached_box.step")
+                self.assertAlmostEqual(import_step("cached_box.step").volume, 1, 5)
+                self.assertEqual(import_cache.misses, 4)
+
+                import_cache.invalidate("cached_box.step")
+                self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+                # The least recently used entries are evicted
+                import_cache.max_bytes = 1
+                import_step("cached_box.step")
+                self.assertEqual(len(os.listdir(cache_dir)), 0)
+            finally:
+                import_cache.directory = None
+                import_cache.max_bytes = 2**30
+                os.remove("cached_box.step")
+                os.remove("cached_ball.stl")
+
 
 class TestJoints(DirectApiTestCase):
     def test_rigid_joint(self):
@@ -1408,6 +1732,64 @@ class TestLocation(DirectApiTestCase):
         self.assertVectorAlmostEquals(axis.direction, (0, 1, 0), 6)
 
 
+class TestLocationArray(DirectApiTestCase):
+    def test_init(self):
+        locs = LocationArray([Location((1, 2, 3)), Location((0, 0, 0), (0, 0, 1), 90)])
+        self.assertEqual(len(locs), 2)
+        self.assertVectorAlmostEquals(locs[0].position, (1, 2, 3), 6)
+        self.assertVectorAlmostEquals(locs[1].orientation, (0, 0, 90), 6)
+        self.assertEqual(len(LocationArray()), 0)
+        self.assertEqual(len(LocationArray(np.zeros((5, 3)))), 5)
+        self.assertEqual(len(LocationArray(locs)), 2)
+        with self.assertRaises(ValueError):
+            LocationArray(np.zeros((2, 3, 3)))
+
+    def test_positions(self):
+        locs = LocationArray(np.array([[1, 2, 3], [4, 5, 6]]))
+        np.testing.assert_allclose(locs.positions.array, [[1, 2, 3], [4, 5, 6]])
+
+    def test_mask(self):
+        locs = LocationArray(np.arange(30).reshape(10, 3))
+        pos = locs.positions
+        subset = locs[pos.X > 14]
+        self.assertEqual(len(subset), 5)
+        self.assertVectorAlmostEquals(subset[0].position, (15, 16, 17), 6)
+
+    def test_mul(self):
+        rotated = Location((0, 0, 0), (0, 0, 1), 90)
+        locs = LocationArray(np.array([[1, 0, 0], [2, 0, 0]]))
+
+        result = rotated * locs
+        self.assertIsInstance(result, LocationArray)
+        self.assertVectorAlmostEquals(result[1].position, (0, 2, 0), 6)
+        self.assertVectorAlmostEquals(result[1].orientation, (0, 0, 90), 6)
+
+        result = locs * rotated
+        self.assertVectorAlmostEquals(result[1].position, (2, 0, 0), 6)
+        self.assertVectorAlmostEquals(result[1].orientation, (0, 0, 90), 6)
+
+        # Pairwise composition grouped by the left operand
+        result = LocationArray([Location(), rotated]) * locs
+        self.assertEqual(len(result), 4)
+        for loc, expected in zip(result, [(1, 0, 0), (2, 0, 0), (0, 1, 0), (0, 2, 0)]):
+            self.assertVectorAlmostEquals(loc.position, expected, 6)
+
+        boxes = locs * Solid.make_box(1, 1, 1)
+        self.assertEqual(len(boxes), 2)
+        self.assertVectorAlmostEquals(boxes[1].center(), (2.5, 0.5, 0.5), 6)
+
+        with self.assertRaises(TypeError):
+            locs * "error"
+
+    def test_matches_location(self):
+        loc = Location((1, 2, 3), (30, 45, 60))
+        locs = LocationArray([loc])
+        self.assertVectorAlmostEquals(locs[0].position, loc.position, 6)
+        self.assertVectorAlmostEquals(locs[0].orientation, loc.orientation, 6)
+        inverse = locs.inverse()[0]
+        self.assertVectorAlmostEquals(inverse.position, loc.inverse().position, 6)
+
+
 class TestMatrix(DirectApiTestCase):
     def test_matrix_creation_and_access(self):
         def matrix_vals(m):
@@ -2197,6 +2579,174 @@ class TestShape(DirectApiTestCase):
         self.assertEqual(len(verts), 24)
         self.assertEqual(len(triangles), 12)
 
+    def test_tessellate_arrays(self):
+        box123 = Solid.make_box(1, 2, 3)
+        verts, triangles, normals = box123.tessellate_arrays(1e-6)
+        self.assertEqual(verts.shape, (24, 3))
+        self.assertEqual(triangles.shape, (12, 3))
+        self.assertEqual(triangles.dtype, np.int32)
+        self.assertIsNone(normals)
+
+        located = box123.moved(Location((10, 0, 0)))
+        verts, triangles, normals = located.tessellate_arrays(
+            1e-6, normals=True, dtype=np.float32
+        )
+        self.assertEqual(verts.dtype, np.float32)
+        np.testing.assert_allclose(verts.min(axis=0), (10, 0, 0))
+        # Triangle winding and vertex normals both point out of the box
+        facets = verts[triangles]
+        winding = np.cross(facets[:, 1] - facets[:, 0], facets[:, 2] - facets[:, 0])
+        centers = facets.mean(axis=1) - (10.5, 1, 1.5)
+        self.assertTrue(np.all(np.einsum("ij,ij->i", winding, centers) > 0))
+        np.testing.assert_allclose(
+            np.cross(winding, normals[triangles[:, 0]]), 0, atol=1e-5
+        )
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1, rtol=1e-6)
+
+    def test_tessellate_welded(self):
+        box123 = Solid.make_box(1, 2, 3).moved(Location((10, 0, 0)))
+        verts, triangles, face_ids = box123.tessellate_welded(1e-6, dtype=np.float32)
+        self.assertEqual(verts.shape, (8, 3))
+        self.assertEqual(verts.dtype, np.float32)
+        np.testing.assert_allclose(verts.min(axis=0), (10, 0, 0))
+        self.assertEqual(triangles.shape, (12, 3))
+        self.assertListEqual(np.bincount(face_ids).tolist(), [2] * 6)
+
+        # Every edge of a closed mesh is shared by exactly two triangles
+        for shape in [Solid.make_cylinder(1, 2), Solid.make_sphere(1)]:
+            verts, triangles, _ = shape.tessellate_welded(1e-3)
+            self.assertLess(len(verts), len(shape.tessellate_arrays(1e-3)[0]))
+            edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+            _, counts = np.unique(edges, axis=0, return_counts=True)
+            self.assertTrue(np.all(counts == 2))
+
+        # Touching faces that don't share edges are joined by weld_tolerance
+        pair = Compound.make_compound(
+            [Face.make_rect(1, 1), Face.make_rect(1, 1).moved(Location((1, 0, 0)))]
+        )
+        self.assertEqual(len(pair.tessellate_welded(1e-3)[0]), 8)
+        self.assertEqual(len(pair.tessellate_welded(1e-3, weld_tolerance=1e-6)[0]), 6)
+
+        # Nodes are welded even if they straddle a multiple of weld_tolerance
+        boxes = Compound.make_compound(
+            [
+                Solid.make_box(0.5, 0.5, 0.5),
+                Solid.make_box(0.5, 0.5, 0.5).moved(Location((0.5 + 1e-7, 0, 0))),
+            ]
+        )
+        for weld_tolerance in [1 / 1000, 1 / 1001]:
+            with self.subTest(weld_tolerance=weld_tolerance):
+                verts = boxes.tessellate_welded(1e-3, weld_tolerance=weld_tolerance)[0]
+                self.assertEqual(len(verts), 12)
+
+    def test_export_stl(self):
+        box = Solid.make_box(1, 2, 3)
+        for ascii_format in [False, True]:
+            self.assertTrue(box.export_stl("box.stl", ascii_format=ascii_format))
+            self.assertAlmostEqual(import_stl("box.stl").area, box.area, 5)
+        with open("box.stl", encoding="utf-8") as stl_file:
+            self.assertTrue(stl_file.read().startswith("solid"))
+        os.remove("box.stl")
+        self.assertFalse(Edge.make_line((0, 0), (1, 1)).export_stl("line.stl"))
+
+    def test_export_stl_stream(self):
+        # Solids and free faces are streamed one at a time
+        parts = Compound.make_compound(
+            [
+                Solid.make_box(1, 1, 1),
+                Solid.make_box(1, 1, 1, Plane((3, 0, 0))),
+                Face.make_rect(1, 1, Plane((0, 5, 0))),
+            ]
+        )
+        stl_file = io.BytesIO()
+        self.assertTrue(parts.export_stl(stl_file, tolerance=1e-4))
+        stl_data = stl_file.getvalue()
+        self.assertEqual(int.from_bytes(stl_data[80:84], "little"), 26)
+        self.assertEqual(len(stl_data), 84 + 26 * 50)
+        # The shape isn't meshed, an existing mesh is kept and nothing is cached
+        self.assertFalse(Shape._is_triangulated(parts.wrapped))
+        meshed_box = Solid.make_box(1, 1, 1)
+        meshed_box.mesh(1e-3)
+        self.assertTrue(meshed_box.export_stl(io.BytesIO(), tolerance=1e-4))
+        self.assertTrue(BRepTools.Triangulation_s(meshed_box.wrapped, 1e-3))
+        tessellation_cache.clear()
+        spheres = Compound.make_compound(
+            [Solid.make_sphere(1, Plane((3 * i, 0, 0))) for i in range(5)]
+        )
+        self.assertTrue(spheres.export_stl(io.BytesIO()))
+        self.assertEqual((len(tessellation_cache), tessellation_cache.nbytes), (0, 0))
+
+        class ForwardOnly(io.RawIOBase):
+            def __init__(self):
+                self.data = bytearray()
+
+            def writable(self):
+                return True
+
+            def write(self, data):
+                self.data += data
+                return len(data)
+
+        forward_only = ForwardOnly()
+        self.assertTrue(parts.export_stl(forward_only, tolerance=1e-4))
+        self.assertEqual(bytes(forward_only.data), stl_data)
+
+        ascii_file = io.StringIO()
+        self.assertTrue(parts.export_stl(ascii_file, ascii_format=True))
+        self.assertEqual(ascii_file.getvalue().count("endfacet"), 26)
+
+    def test_export_3mf(self):
+        box = Solid.make_box(1, 1, 1)
+        instances = Compound.make_compound(
+            [box, copy.copy(box).move(Location((3, 0, 0), (0, 0, 1), 90))]
+        )
+        instances.export_3mf("boxes.3mf", 1e-3, 0.1, Unit.MILLIMETER, 9)
+        with ZipFile("boxes.3mf") as zip_file:
+            model = ET.fromstring(zip_file.read("3D/3dmodel.model"))
+        os.remove("boxes.3mf")
+
+        # The shared box is meshed once and placed twice
+        namespace = {"m": "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"}
+        self.assertEqual(len(model.findall(".//m:mesh", namespace)), 1)
+        self.assertEqual(len(model.findall(".//m:vertex", namespace)), 8)
+        components = model.findall(".//m:component", namespace)
+        self.assertEqual(len(components), 2)
+        self.assertNotIn("transform", components[0].attrib)
+        transform = np.array(components[1].attrib["transform"].split(), dtype=float)
+        # A point transformed as a row vector by the 4x3 matrix
+        point = np.array([1, 0, 0, 1]) @ transform.reshape(4, 3)
+        np.testing.assert_allclose(point, (3, 1, 0), atol=1e-9)
+
+    def test_export_glb(self):
+        box = Solid.make_box(1, 2, 3)
+        box.color = Color("red")
+        ball = Solid.make_sphere(1).moved(Location((0, 5, 0)))
+        assembly = Compound(
+            label="assembly",
+            children=[box, copy.copy(box).move(Location((5, 0, 0))), ball],
+        )
+        for quantize in [False, True]:
+            assembly.export_glb("assembly.glb", quantize=quantize)
+            with open("assembly.glb", "rb") as glb_file:
+                glb_data = glb_file.read()
+            magic, version, length, json_length = np.frombuffer(glb_data[:16], "<u4")
+            self.assertEqual((magic, version, length), (0x46546C67, 2, len(glb_data)))
+            gltf = json.loads(glb_data[20 : 20 + json_length])
+
+            # The box instances share one mesh, the uncolored ball has no material
+            self.assertEqual(len(gltf["meshes"]), 2)
+            self.assertEqual(len(gltf["materials"]), 1)
+            root = gltf["nodes"][0]
+            self.assertEqual(root["name"], "assembly")
+            self.assertEqual(len(root["children"]), 3)
+            box_nodes = [gltf["nodes"][i] for i in root["children"][:2]]
+            self.assertEqual(box_nodes[0]["mesh"], box_nodes[1]["mesh"])
+            self.assertEqual(
+                "KHR_mesh_quantization" in gltf.get("extensionsRequired", []),
+                quantize,
+            )
+        os.remove("assembly.glb")
+
     # def test_to_vtk_poly_data(self):
 
     #     from vtkmodules.vtkCommonDataModel import vtkPolyData
@@ -2209,6 +2759,21 @@ class TestShape(DirectApiTestCase):
     # def test_repr_javascript_(self):
     #     print(Shape._repr_javascript_(Face))
 
+    def test_vtk_poly_data_tolerance(self):
+        # The tolerance is relative to the size of the shape, like IVtk
+        sphere = Solid.make_sphere(1)
+        small = sphere.to_vtk_poly_data()
+        self.assertFalse(Shape._is_triangulated(sphere.wrapped))
+        large = Solid.make_sphere(100).to_vtk_poly_data()
+        self.assertEqual(small.GetNumberOfPolys(), 1244)
+        self.assertEqual(large.GetNumberOfPolys(), small.GetNumberOfPolys())
+        self.assertEqual(large.GetNumberOfLines(), small.GetNumberOfLines())
+        finer = Solid.make_sphere(100).to_vtk_poly_data(1e-4)
+        self.assertGreater(finer.GetNumberOfPolys(), small.GetNumberOfPolys())
+        moved = Solid.make_sphere(1).moved(Location((10, 0, 0))).to_vtk_poly_data()
+        bounds = moved.GetBounds()
+        self.assertAlmostEqual((bounds[0] + bounds[1]) / 2, 10, 1)
+
     def test_transformed(self):
         """Validate that transformed works the same as changing location"""
         rotation = (uniform(0, 360), uniform(0, 360), uniform(0, 360))
@@ -2228,6 +2793,54 @@ class TestShape(DirectApiTestCase):
         with self.assertWarns(DeprecationWarning):
             Solid.make_box(1, 1, 1).copy()
 
+    def test_shallow_copy(self):
+        box = Solid.make_box(1, 1, 1)
+        box.label = "box"
+        reference = copy.copy(box)
+        self.assertTrue(reference.wrapped.TShape() == box.wrapped.TShape())
+        self.assertIsNot(reference.wrapped, box.wrapped)
+        self.assertEqual(reference.label, "box")
+        reference.move(Location((1, 0, 0)))
+        self.assertVectorAlmostEquals(box.center(), (0.5, 0.5, 0.5), 5)
+
+        duplicate = copy.deepcopy(box)
+        self.assertFalse(duplicate.wrapped.TShape() == box.wrapped.TShape())
+
+    def test_pickle(self):
+        box = Solid.make_box(1, 2, 3)
+        box.label, box.color = "box", Color(1, 0, 0)
+        RigidJoint("top", box, Location((0, 0, 3)))
+        assembly = Compound(
+            label="assembly",
+            children=[box, copy.copy(box).move(Location((5, 0, 0), (0, 0, 1), 90))],
+        )
+        face = Face.make_rect(1, 1, Plane.XZ)
+        face.created_on = Plane.XZ
+
+        restored = pickle.loads(pickle.dumps([assembly, face]))
+        restored_assembly, restored_face = restored
+        self.assertEqual(restored_assembly.label, "assembly")
+        self.assertAlmostEqual(restored_assembly.volume, 12, 5)
+        restored_box, restored_instance = restored_assembly.children
+        self.assertIs(restored_box.parent, restored_assembly)
+        self.assertEqual(restored_box.label, "box")
+        self.assertTupleAlmostEquals(restored_box.color.to_tuple(), (1, 0, 0, 0), 5)
+        self.assertIs(restored_box.joints["top"].parent, restored_box)
+        self.assertVectorAlmostEquals(
+            restored_box.joints["top"].relative_location.position, (0, 0, 3), 5
+        )
+        self.assertVectorAlmostEquals(restored_instance.position, (5, 0, 0), 5)
+        self.assertVectorAlmostEquals(restored_instance.orientation, (0, 0, 90), 5)
+        self.assertEqual(restored_face.created_on, Plane.XZ)
+        self.assertVectorAlmostEquals(restored_face.normal_at(), (0, -1, 0), 5)
+
+    def test_pickle_extruded_text(self):
+        # BinTools VERSION_4 fails to read these back
+        text = Compound.make_text("hi", 10)
+        solids = [Solid.extrude_linear(f, (0, 0, 3)) for f in text.faces()]
+        restored_text = pickle.loads(pickle.dumps(Compound.make_compound(solids)))
+        self.assertEqual(len(restored_text.solids()), len(solids))
+
     def test_distance_to_with_closest_points(self):
         s0 = Solid.make_sphere(1).locate(Location((0, 2.1, 0)))
         s1 = Solid.make_sphere(1)
@@ -2428,6 +3041,56 @@ class TestSolid(DirectApiTestCase):
         self.assertAlmostEqual(box.volume, 1, 5)
         self.assertTrue(box.is_valid())
 
+    def test_from_mesh(self):
+        plate = Solid.make_box(10, 10, 2) - Solid.make_cylinder(1, 2).moved(
+            Location((5, 5, 0))
+        )
+        vertices, triangles, _ = plate.tessellate_welded(1e-3, 0.2)
+        mesh_plate = Solid.from_mesh(vertices, triangles)
+        self.assertTrue(mesh_plate.is_valid())
+        # The top and bottom are single faces with a hole
+        self.assertLess(len(mesh_plate.faces()), len(triangles) / 2)
+        self.assertEqual(len(mesh_plate.faces().sort_by(Axis.Z)[-1].inner_wires()), 1)
+        self.assertAlmostEqual(mesh_plate.volume, plate.volume, 1)
+
+        # Inside out meshes are corrected
+        flipped = Solid.from_mesh(vertices, triangles[:, ::-1])
+        self.assertAlmostEqual(flipped.volume, mesh_plate.volume, 5)
+
+        cut = mesh_plate - Solid.make_box(1, 1, 1)
+        self.assertAlmostEqual(cut.volume, mesh_plate.volume - 1, 5)
+
+        with self.assertRaises(ValueError):
+            Solid.from_mesh(vertices, triangles[1:])
+
+    def test_from_noisy_mesh(self):
+        vertices, triangles, _ = Solid.make_box(10, 10, 10).tessellate_welded(1e-3)
+        rng = np.random.default_rng(1)
+        for sigma, tolerance in [(1e-7, 1e-5), (1e-4, 1e-3)]:
+            with self.subTest(sigma=sigma):
+                noisy = vertices + rng.normal(0, sigma, vertices.shape)
+                box = Solid.from_mesh(noisy, triangles, tolerance)
+                self.assertTrue(box.is_valid())
+                cut = box - Solid.make_box(5, 5, 20)
+                self.assertTrue(cut.is_valid())
+                self.assertAlmostEqual(cut.volume, 750, 1)
+
+        # A triangle soup whose duplicated vertices straddle a multiple of tolerance
+        vertices, triangles, _ = Solid.make_box(1, 1, 1).tessellate_welded(1e-3)
+        soup = vertices[triangles].reshape(-1, 3) + 5e-6
+        soup += rng.uniform(-1e-9, 1e-9, soup.shape)
+        box = Solid.from_mesh(soup, np.arange(len(soup)).reshape(-1, 3))
+        self.assertTrue(box.is_valid())
+        self.assertAlmostEqual(box.volume, 1, 5)
+
+        # Neighbours within the tolerances can add up to a group that isn't planar
+        cylinder = Solid.make_cylinder(10, 5)
+        vertices, triangles, _ = cylinder.tessellate_welded(1e-4, 0.2)
+        mesh_cylinder = Solid.from_mesh(vertices, triangles, 1e-2, 0.05)
+        self.assertTrue(mesh_cylinder.is_valid())
+        self.assertGreater(len(mesh_cylinder.faces()), 100)
+        self.assertAlmostEqual(mesh_cylinder.volume, cylinder.volume, 0)
+
     def test_extrude_with_taper(self):
         base = Face.make_rect(1, 1)
         pyramid = Solid.extrude_linear(base, normal=(0, 0, 1), taper=10)
@@ -2480,7 +3143,7 @@ class TestSolid(DirectApiTestCase):
         self.assertAlmostEqual(extrusion.volume, 4, 5)
 
 
-class TestSVG(unittest.TestCase):
+class TestSVG(DirectApiTestCase):
     def test_svg_export_import(self):
         with BuildSketch() as square:
             Rectangle(1, 1)
@@ -2506,7 +3169,7 @@ class TestSVG(unittest.TestCase):
             svg_opts={"show_axes": False, "pixel_scale": 100, "stroke_width": 1},
         )
         svg_imported = import_svg("test_svg.svg")
-        self.assertEqual(len(svg_imported), 16)
+        self.assertEqual(len(svg_imported), 12)
 
         box = Solid.make_box(1, 1, 1)
         box.export_svg(
@@ -2528,10 +3191,154 @@ class TestSVG(unittest.TestCase):
         with self.assertRaises(ValueError):
             import_svg("test_svg.svg")
 
+    def test_svg_export_fast_hlr(self):
+        cylinder = Solid.make_cylinder(1, 2)
+        path_counts, sizes = [], []
+        for fast_hlr in [False, True]:
+            cylinder.export_svg(
+                "test_svg.svg",
+                (10, -10, 10),
+                (0, 0, 1),
+                svg_opts={
+                    "show_axes": False,
+                    "pixel_scale": 100,
+                    "fast_hlr": fast_hlr,
+                    "hlr_tolerance": 1e-3,
+                },
+            )
+            with open("test_svg.svg", encoding="utf-8") as svg_file:
+                path_counts.append(svg_file.read().count("<path"))
+            edges = import_svg("test_svg.svg")
+            sizes.append(Compound.make_compound(edges).bounding_box().size)
+        # The polygonal projection is made of many short edges
+        self.assertGreater(path_counts[1], path_counts[0])
+        self.assertAlmostEqual(sizes[1].X, sizes[0].X, 2)
+        self.assertAlmostEqual(sizes[1].Y, sizes[0].Y, 2)
+        os.remove("test_svg.svg")
+
+    def test_import_svg_wires_faces(self):
+        with open("test_svg.svg", "w", encoding="utf-8") as svg_file:
+            svg_file.write(
+                '<svg xmlns="http://www.w3.org/2000/svg">'
+                '<path d="M 0 0 L 100 0 L 100 100 L 0 100 Z M 20 20 L 80 20 L 80 80 L 20 80 Z"/>'
+                '<path d="M 40 40 L 60 40 Q 70 50 60 60 C 55 65 45 65 40 60 Z"/>'
+                '<path d="M 200 50 A 30 20 0 0 0 260 50 A 30 20 0 0 0 200 50"/>'
+                "</svg>"
+            )
+        edges = import_svg("test_svg.svg")
+        self.assertEqual(len(edges), 14)
+        geom_types = [edge.geom_type() for edge in edges]
+        self.assertEqual(geom_types.count("BEZIER"), 2)
+        self.assertEqual(geom_types.count("ELLIPSE"), 2)
+
+        wires = import_svg("test_svg.svg", as_wires=True)
+        self.assertEqual(len(wires), 4)
+        self.assertTrue(all(wire.is_closed() for wire in wires))
+
+        faces = import_svg("test_svg.svg", as_faces=True).sort_by(SortBy.AREA)
+        self.assertEqual(len(faces), 3)
+        self.assertEqual(len(faces[-1].inner_wires()), 1)
+        self.assertAlmostEqual(faces[-1].area, 100 * 100 - 60 * 60, 5)
+        self.assertAlmostEqual(faces[1].area, math.pi * 30 * 20, 5)
+        os.remove("test_svg.svg")
+
+    def test_import_svg_arcs(self):
+        # (large-arc-flag, sweep-flag): arc length and mid point
+        quarter, three_quarters, offset = 5 * math.pi, 15 * math.pi, 10 / math.sqrt(2)
+        arcs = {
+            (0, 0): (quarter, (10 - offset, 10 - offset)),
+            (0, 1): (quarter, (offset, offset)),
+            (1, 0): (three_quarters, (-offset, -offset)),
+            (1, 1): (three_quarters, (10 + offset, 10 + offset)),
+        }
+        for (large, sweep), (length, mid_point) in arcs.items():
+            with self.subTest(large=large, sweep=sweep):
+                svg = (
+                    '<svg xmlns="http://www.w3.org/2000/svg">'
+                    f'<path d="M 10 0 A 10 10 0 {large} {sweep} 0 10"/></svg>'
+                )
+                arc = import_svg(io.StringIO(svg))[0]
+                self.assertAlmostEqual(arc.length, length, 5)
+                self.assertVectorAlmostEquals(arc.position_at(0.5), (*mid_point, 0), 5)
+                wire = Wire.make_wire([arc])
+                self.assertVectorAlmostEquals(wire.start_point(), (10, 0, 0), 5)
+                self.assertVectorAlmostEquals(wire.end_point(), (0, 10, 0), 5)
+
+
+class TestTessellationCache(DirectApiTestCase):
+    def setUp(self):
+        tessellation_cache.clear()
+
+    def test_shared_by_instances(self):
+        sphere = Solid.make_sphere(1)
+        verts, triangles, _ = sphere.tessellate_arrays(1e-3)
+        self.assertFalse(verts.flags.writeable)
+        instance = copy.copy(sphere).move(Location((5, 0, 0)))
+        moved_verts, moved_triangles, _ = instance.tessellate_arrays(1e-3)
+        self.assertEqual((tessellation_cache.hits, tessellation_cache.misses), (1, 1))
+        np.testing.assert_allclose(moved_verts, verts + (5, 0, 0))
+        np.testing.assert_array_equal(moved_triangles, triangles)
+
+    def test_tolerances(self):
+        sphere = Solid.make_sphere(1)
+        sphere.tessellate_arrays(1e-3, 0.1)
+        sphere.tessellate_arrays(1e-2, 0.5)  # coarser request uses finer mesh
+        self.assertEqual(tessellation_cache.hits, 1)
+        sphere.tessellate_arrays(1e-4, 0.1)  # finer request must be meshed
+        sphere.tessellate_arrays(1e-3, 0.1, normals=True)  # normals missing
+        self.assertEqual(tessellation_cache.misses, 3)
+        # the mesh with normals replaces the one without
+        self.assertEqual(len(tessellation_cache), 2)
+
+        # the coarsest valid mesh is used
+        verts, _, _ = sphere.tessellate_arrays(1e-2, 0.5)
+        self.assertEqual(len(verts), len(sphere.tessellate_arrays(1e-3, 0.1)[0]))
+
+    def test_angular_tolerance(self):
+        # An existing triangulation that is only fine enough linearly isn't reused
+        sphere = Solid.make_sphere(10)
+        _, coarse, _ = sphere.tessellate_arrays(0.5, 1.0)
+        _, fine, _ = sphere.tessellate_arrays(0.5, 0.1)
+        self.assertGreater(len(fine), 2 * len(coarse))
+
+    def test_memory_bound(self):
+        cache = TessellationCache(max_bytes=2000)
+        box = Solid.make_box(1, 1, 1)
+        arrays = Shape._tessellate_arrays(box.wrapped, 1e-3, 0.1, False)
+        size = sum(a.nbytes for a in arrays if a is not None)
+        cache.put(box.wrapped, 1e-3, 0.1, arrays)
+        cache.put(box.wrapped, 1e-4, 0.1, arrays)
+        self.assertEqual(len(cache), 2000 // size)
+        self.assertLessEqual(cache.nbytes, 2000)
+        self.assertIsNotNone(cache.get(box.wrapped, 1e-3, 0.1))
+        self.assertEqual(sum(map(len, cache._buckets.values())), len(cache))
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
 
 class TestVector(DirectApiTestCase):
     """Test the Vector methods"""
 
+    def test_lazy_wrapped(self):
+        vec = Vector(1, 2, 3)
+        self.assertTupleAlmostEquals(
+            (vec.wrapped.X(), vec.wrapped.Y(), vec.wrapped.Z()), (1, 2, 3), 7
+        )
+        vec.X = 4
+        self.assertAlmostEqual(vec.wrapped.X(), 4, 7)
+        self.assertIsInstance(vec.X, float)
+        with self.assertRaises(AttributeError):
+            vec.extra = 1
+
+    def test_pickle(self):
+        vec = Vector(1, 2, 3)
+        self.assertVectorAlmostEquals(pickle.loads(pickle.dumps(vec)), (1, 2, 3), 7)
+        self.assertVectorAlmostEquals(copy.deepcopy(vec), (1, 2, 3), 7)
+
+    def test_iter(self):
+        vec = Vector(1, 2, 3)
+        self.assertEqual([(a, b) for a in vec for b in vec][1], (1, 2))
+
     def test_vector_constructors(self):
         v1 = Vector(1, 2, 3)
         v2 = Vector((1, 2, 3))
@@ -2696,6 +3503,36 @@ class TestVector(DirectApiTestCase):
         self.assertVectorAlmostEquals(v3, (1, 2, 3), 7)
 
 
+class TestVectorArray(DirectApiTestCase):
+    def test_init(self):
+        vecs = VectorArray([(1, 2, 3), Vector(4, 5, 6)])
+        self.assertEqual(len(vecs), 2)
+        self.assertVectorAlmostEquals(vecs[1], (4, 5, 6), 6)
+        vecs = VectorArray(np.array([[1, 2], [3, 4]]))
+        np.testing.assert_allclose(vecs.Z, [0, 0])
+        self.assertEqual(len(VectorArray()), 0)
+        with self.assertRaises(ValueError):
+            VectorArray(np.zeros((2, 4)))
+
+    def test_arithmetic(self):
+        vecs = VectorArray(np.array([[1, 0, 0], [0, 2, 0]]))
+        np.testing.assert_allclose((vecs + (1, 1, 1)).array, [[2, 1, 1], [1, 3, 1]])
+        np.testing.assert_allclose((vecs - vecs).array, np.zeros((2, 3)))
+        np.testing.assert_allclose((2 * vecs).array, [[2, 0, 0], [0, 4, 0]])
+        np.testing.assert_allclose((vecs / 2).array, [[0.5, 0, 0], [0, 1, 0]])
+        np.testing.assert_allclose((-vecs).array, [[-1, 0, 0], [0, -2, 0]])
+        np.testing.assert_allclose(vecs.length, [1, 2])
+        np.testing.assert_allclose(vecs.dot((1, 1, 0)), [1, 2])
+        np.testing.assert_allclose(vecs.cross((0, 0, 1)).array, [[0, -1, 0], [2, 0, 0]])
+        np.testing.assert_allclose(vecs.normalized().length, [1, 1])
+
+    def test_iter_and_mask(self):
+        vecs = VectorArray(np.arange(12).reshape(4, 3))
+        self.assertTrue(all(isinstance(v, Vector) for v in vecs))
+        self.assertEqual(len(vecs[vecs.X > 4]), 2)
+        self.assertEqual(len(vecs[1:3]), 2)
+
+
 class VertexTests(DirectApiTestCase):
     """Test the extensions to the cadquery Vertex class"""
 
@@ -2760,6 +3597,13 @@ class TestWire(unittest.TestCase):
         )
         self.assertAlmostEqual(full_ellipse.area / 2, half_ellipse.area, 5)
 
+    def test_make_polygon_from_array(self):
+        square = Wire.make_polygon(np.array([(0, 0), (1, 0), (1, 1), (0, 1)]))
+        self.assertEqual(len(square.edges()), 4)
+        self.assertAlmostEqual(square.length, 4, 5)
+        open_wire = Wire.make_polygon(np.array([(0, 0), (1, 0), (1, 1)]), close=False)
+        self.assertAlmostEqual(open_wire.length, 2, 5)
+
     def test_conical_helix(self):
         helix = Wire.make_helix(1, 4, 1, normal=(-1, 0, 0), angle=10, lefthand=True)
         self.assertAlmostEqual(helix.length, 34.102023034708374, 5)
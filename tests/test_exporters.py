@@ -0,0 +1,429 @@
+"""
+
+build123d exporters tests
+
+name: test_exporters.py
+by:   Gumyr
+date: October 19th 2026
+
+desc: Unit tests for the build123d 2D exporters and drawings
+
+license:
+
+    Copyright 2023 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+
+import io
+import math
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import ezdxf
+from OCP.IFSelect import IFSelect_ReturnStatus
+from build123d import *
+from build123d.importers import import_brep
+from build123d.exporters import (
+    Drawing,
+    DrawingCache,
+    ExportDXF,
+    ExportQueue,
+    ExportSVG,
+    LineType,
+    _project,
+    drawing_cache,
+)
+from build123d.topology import Shape
+
+
+def spline_sketch() -> Compound:
+    """Edges of every kind, with a repeated spline at two locations"""
+    spline = Edge.make_spline([(0, 0), (2, 3), (5, -1), (8, 2)])
+    return Compound.make_compound(
+        [
+            spline,
+            spline.moved(Location((0, 10))),
+            Edge.make_bezier((0, 0), (3, 5), (6, 0)),
+            Edge.make_circle(3, Plane((20, 0, 0))),
+            Edge.make_ellipse(4, 2, Plane((30, 0, 0))),
+            Edge.make_line((0, -5), (10, -5)),
+        ]
+    )
+
+
+def svg_bytes(exporter: ExportSVG) -> bytes:
+    stream = io.BytesIO()
+    exporter.write(stream)
+    return stream.getvalue()
+
+
+def dxf_entities(exporter: ExportDXF) -> list:
+    return [
+        (entity.dxftype(), [tuple(p) for p in getattr(entity, "control_points", [])])
+        for entity in exporter._modelspace
+    ]
+
+
+class TestSplineBatches(unittest.TestCase):
+    def test_svg_workers(self):
+        sketch = spline_sketch()
+        # One edge at a time doesn't batch anything
+        per_edge = ExportSVG()
+        for edge in sketch.edges():
+            per_edge.add_shape(edge)
+        expected = svg_bytes(per_edge)
+
+        for workers in [None, 2]:
+            with self.subTest(workers=workers):
+                with ExportSVG(workers=workers) as exporter:
+                    exporter.add_shape(sketch)
+                    self.assertEqual(svg_bytes(exporter), expected)
+
+    def test_dxf_workers(self):
+        sketch = spline_sketch()
+        per_edge = ExportDXF()
+        for edge in sketch.edges():
+            per_edge.add_shape(edge)
+        expected = dxf_entities(per_edge)
+        self.assertEqual([t for t, _ in expected].count("SPLINE"), 3)
+
+        for workers in [None, 2]:
+            with self.subTest(workers=workers):
+                with ExportDXF(workers=workers) as exporter:
+                    exporter.add_shape(sketch)
+                    self.assertEqual(dxf_entities(exporter), expected)
+
+    def test_pool_reused(self):
+        sketch = spline_sketch()
+        exporter = ExportSVG(workers=2)
+        exporter.add_shape(sketch)
+        pool = exporter._pool
+        self.assertIsNotNone(pool)
+        # New TShapes, so these splines are converted by the pool again
+        exporter.add_shape(spline_sketch().moved(Location((0, 50))))
+        self.assertIs(exporter._pool, pool)
+        exporter.close()
+        self.assertIsNone(exporter._pool)
+
+
+class TestStreaming(unittest.TestCase):
+    @staticmethod
+    def add_shapes(exporter):
+        exporter.add_layer("hidden", line_type=LineType.ISO_DOT)
+        exporter.add_shape(spline_sketch())
+        exporter.add_shape(Rectangle(40, 20).moved(Location((10, 0))), layer="hidden")
+
+    def test_svg_identical(self):
+        expected = ExportSVG()
+        TestStreaming.add_shapes(expected)
+        with ExportSVG(streaming=True) as streamed:
+            TestStreaming.add_shapes(streamed)
+            self.assertEqual(svg_bytes(streamed), svg_bytes(expected))
+            # Writing again gives the same file
+            self.assertEqual(svg_bytes(streamed), svg_bytes(expected))
+
+            # Shapes added after a write are included in the next one
+            for exporter in [expected, streamed]:
+                exporter.add_shape(Edge.make_line((0, 0), (50, 50)))
+            self.assertEqual(svg_bytes(streamed), svg_bytes(expected))
+
+    def test_dxf_reread(self):
+        expected = ExportDXF()
+        TestStreaming.add_shapes(expected)
+        entity_types = sorted(entity.dxftype() for entity in expected._modelspace)
+
+        with ExportDXF(streaming=True) as streamed:
+            TestStreaming.add_shapes(streamed)
+            self.assertEqual(len(streamed._modelspace), 0)
+            for _ in range(2):
+                stream = io.StringIO()
+                streamed.write(stream)
+                document = ezdxf.read(io.StringIO(stream.getvalue()))
+                self.assertEqual(
+                    sorted(entity.dxftype() for entity in document.modelspace()),
+                    entity_types,
+                )
+                self.assertFalse(document.audit().has_errors)
+
+    def test_close(self):
+        svg, dxf = ExportSVG(streaming=True), ExportDXF(streaming=True)
+        for exporter in [svg, dxf]:
+            exporter.add_shape(Edge.make_line((0, 0), (1, 1)))
+            exporter.close()
+        self.assertTrue(svg._layers[""].spool.closed)
+        self.assertTrue(dxf._spool.closed)
+
+
+class TestDrawing(unittest.TestCase):
+    @staticmethod
+    def total_length(lines: Compound) -> float:
+        return sum(edge.length for edge in lines.edges())
+
+    def test_fast_mode(self):
+        box = Solid.make_box(10, 20, 30)
+        cylinder = Solid.make_cylinder(5, 10)
+        # Edges along the axes are shortened by sqrt(2/3) in an isometric view
+        iso = math.sqrt(2 / 3)
+        for shape, look_from, visible, hidden in [
+            (box, (1, -1, 1), 3 * (10 + 20 + 30) * iso, (10 + 20 + 30) * iso),
+            (cylinder, (1, 0, 0), 4 * 10, 2 * 10),
+        ]:
+            for fast in [False, True]:
+                with self.subTest(shape=shape, fast=fast):
+                    drawing = Drawing(shape, look_from=look_from, fast=fast)
+                    self.assertAlmostEqual(
+                        self.total_length(drawing.visible_lines), visible, 3
+                    )
+                    self.assertAlmostEqual(
+                        self.total_length(drawing.hidden_lines), hidden, 3
+                    )
+                    without_hidden = Drawing(
+                        shape, look_from=look_from, fast=fast, with_hidden=False
+                    )
+                    self.assertEqual(len(without_hidden.hidden_lines.edges()), 0)
+                    self.assertAlmostEqual(
+                        self.total_length(without_hidden.visible_lines), visible, 3
+                    )
+        # The fast mode doesn't mesh the shape but uses an existing mesh
+        self.assertFalse(Shape._is_triangulated(cylinder.wrapped))
+        meshed = Solid.make_cylinder(5, 10)
+        meshed.mesh(0.01)
+        drawing = Drawing(meshed, look_from=(1, 0, 0), fast=True, tolerance=0.1)
+        self.assertAlmostEqual(self.total_length(drawing.visible_lines), 40, 3)
+
+
+class TestDrawingViews(unittest.TestCase):
+    def setUp(self):
+        drawing_cache.clear()
+
+    @staticmethod
+    def lengths(drawings: dict) -> dict:
+        return {
+            name: round(sum(edge.length for edge in drawing.visible_lines.edges()), 6)
+            for name, drawing in drawings.items()
+        }
+
+    def test_standard_views(self):
+        box = Solid.make_box(10, 20, 30)
+        views = Drawing.views(box)
+        self.assertEqual(list(views), list(Drawing.STANDARD_VIEWS))
+        lengths = TestDrawingViews.lengths(views)
+        self.assertAlmostEqual(lengths["front"], 2 * (10 + 30), 5)
+        self.assertAlmostEqual(lengths["top"], 2 * (10 + 20), 5)
+        self.assertAlmostEqual(lengths["right"], 2 * (20 + 30), 5)
+        self.assertEqual(len(drawing_cache), 4)
+
+        # Custom views override the keyword arguments
+        views = Drawing.views(
+            box, {"side": {"look_from": (-1, 0, 0)}}, look_from=(0, 0, 1)
+        )
+        self.assertAlmostEqual(TestDrawingViews.lengths(views)["side"], 100, 5)
+
+    def test_workers(self):
+        shape = Solid.make_box(10, 20, 30) - Solid.make_cylinder(4, 30)
+        expected = TestDrawingViews.lengths(Drawing.views(shape))
+        drawing_cache.clear()
+        views = Drawing.views(shape, workers=2)
+        self.assertEqual(TestDrawingViews.lengths(views), expected)
+        self.assertEqual(len(drawing_cache), 4)
+
+    def test_hidden_lines_reused(self):
+        box = Solid.make_box(10, 20, 30)
+        with patch("build123d.exporters._project", wraps=_project) as project:
+            without_hidden = Drawing(box, with_hidden=False)
+            drawing = Drawing(box)
+            views = Drawing.views(box, {"iso": {"with_hidden": False}})
+        self.assertEqual(project.call_count, 1)
+        self.assertEqual(len(without_hidden.hidden_lines.edges()), 0)
+        self.assertEqual(len(drawing.hidden_lines.edges()), 3)
+        self.assertEqual(len(views["iso"].hidden_lines.edges()), 0)
+
+
+class TestDrawingCache(unittest.TestCase):
+    def test_hit(self):
+        cache = DrawingCache()
+        box = Solid.make_box(1, 1, 1)
+        view = Drawing._view()
+        self.assertIsNone(cache.get(box, view))
+        lines = _project(box, *view)
+        cache.put(box, view, lines)
+        cached = cache.get(box, view)
+        self.assertEqual(len(cached[0].edges()), len(lines[0].edges()))
+        # A shape with the same geometry isn't the same shape
+        self.assertIsNone(cache.get(Solid.make_box(1, 1, 1), view))
+        self.assertIsNone(cache.get(box, Drawing._view(look_from=(0, 0, 1))))
+
+    def test_lru_eviction(self):
+        cache = DrawingCache(max_entries=2)
+        boxes = [Solid.make_box(1, 1, i + 1) for i in range(3)]
+        view = Drawing._view()
+        lines = _project(boxes[0], *view)
+        cache.put(boxes[0], view, lines)
+        cache.put(boxes[1], view, lines)
+        cache.get(boxes[0], view)  # now the most recently used
+        cache.put(boxes[2], view, lines)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(boxes[0], view))
+        self.assertIsNone(cache.get(boxes[1], view))
+        self.assertIsNotNone(cache.get(boxes[2], view))
+
+        disabled = DrawingCache(max_entries=0)
+        disabled.put(boxes[0], view, lines)
+        self.assertEqual(len(disabled), 0)
+
+    def test_edge_limit(self):
+        boxes = [Solid.make_box(1, 1, i + 1) for i in range(3)]
+        view = Drawing._view()
+        lines = _project(boxes[0], *view)
+        edge_count = DrawingCache._edge_count(lines)
+        self.assertEqual(edge_count, 12)
+        cache = DrawingCache(max_edges=2 * edge_count)
+        for box in boxes:
+            cache.put(box, view, lines)
+        self.assertEqual((len(cache), cache.edge_count), (2, 2 * edge_count))
+        self.assertIsNone(cache.get(boxes[0], view))
+        # Replacing an entry doesn't count its edges twice
+        cache.put(boxes[2], view, lines)
+        self.assertEqual((len(cache), cache.edge_count), (2, 2 * edge_count))
+        # Views with more edges than the limit aren't cached
+        small = DrawingCache(max_edges=edge_count - 1)
+        small.put(boxes[0], view, lines)
+        self.assertEqual(len(small), 0)
+        cache.clear()
+        self.assertEqual((len(cache), cache.edge_count), (0, 0))
+
+    def test_no_aliasing(self):
+        box = Solid.make_box(1, 1, 1)
+        drawing_cache.clear()
+        first = Drawing(box)
+        first.visible_lines.move(Location((100, 0, 0)))
+        second = Drawing(box)
+        self.assertLess(second.visible_lines.bounding_box().max.X, 50)
+        self.assertGreater(first.visible_lines.bounding_box().min.X, 50)
+
+
+class BlockedWriter:
+    """A writer whose exports wait until they are released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.written = []
+
+    def write(self, file_name):
+        self.release.wait(10)
+        self.written.append(file_name)
+
+
+class TestExportQueue(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_pools(self):
+        box = Solid.make_box(1, 2, 3)
+        svg = ExportSVG()
+        svg.add_shape(Edge.make_line((0, 0), (1, 1)))
+        stream = io.BytesIO()
+        for processes in [True, False]:
+            with self.subTest(processes=processes):
+                with ExportQueue(workers=2, processes=processes) as queue:
+                    step = queue.submit(box, self.path("box.step"))
+                    queue.submit(box, self.path("box.stl"), tolerance=1e-2)
+                    queue.submit(svg, self.path("box.svg"))
+                    queue.submit(box, stream, "export_brep")
+                    # Writers and file objects always run in threads
+                    self.assertEqual(queue._process_pool is not None, processes)
+                    self.assertIsNotNone(queue._thread_pool)
+                self.assertEqual(queue.errors(), [])
+                self.assertTrue(all(job.done for job in queue.jobs))
+                self.assertTrue(all(job.seconds >= 0 for job in queue.jobs))
+                self.assertEqual(step.result(), IFSelect_ReturnStatus.IFSelect_RetDone)
+                for name in ["box.step", "box.stl", "box.svg"]:
+                    self.assertGreater(os.path.getsize(self.path(name)), 0)
+                self.assertAlmostEqual(
+                    import_brep(io.BytesIO(stream.getvalue())).volume, 6, 5
+                )
+
+    def test_methods(self):
+        queue = ExportQueue(processes=False)
+        box = Solid.make_box(1, 1, 1)
+        for name, method in [
+            ("box.STP", "export_step"),
+            ("box.brep", "export_brep"),
+            ("part.Stl", "export_stl"),
+        ]:
+            queue.submit(box, self.path(name))
+            self.assertEqual(queue.jobs[-1].method, method)
+        queue.submit(ExportDXF(), self.path("empty.dxf"))
+        self.assertEqual(queue.jobs[-1].method, "write")
+        for file_name in [self.path("box.xyz"), io.BytesIO()]:
+            with self.assertRaises(ValueError):
+                queue.submit(box, file_name)
+        queue.shutdown()
+        self.assertEqual(queue.errors(), [])
+
+    def test_errors(self):
+        box = Solid.make_box(1, 1, 1)
+        missing = self.path(os.path.join("missing", "box.stl"))
+        for processes in [True, False]:
+            with self.subTest(processes=processes):
+                with ExportQueue(processes=processes) as queue:
+                    failed = queue.submit(box, missing)
+                    raised = queue.submit(box, self.path("box.stl"), "export_nothing")
+                    queue.submit(box, self.path("box.stl"))
+                # export_stl returns False rather than raising
+                self.assertIsInstance(failed.exception(), OSError)
+                self.assertIsInstance(raised.exception(), AttributeError)
+                self.assertEqual(queue.errors(), queue.jobs[:2])
+                self.assertIsNotNone(queue.jobs[0].seconds)
+                self.assertIn("failed", repr(queue.jobs[0]))
+
+    def test_cancel(self):
+        writer = BlockedWriter()
+        with ExportQueue(workers=1) as queue:
+            running = queue.submit(writer, "first")
+            waiting = queue.submit(writer, "second")
+            self.assertTrue(waiting.cancel())
+            writer.release.set()
+        self.assertTrue(waiting.cancelled())
+        self.assertIsNone(queue.jobs[1].error)
+        self.assertIsNone(running.result())
+        self.assertEqual(writer.written, ["first"])
+
+    def test_snapshot(self):
+        box = Solid.make_box(1, 1, 1)
+        with ExportQueue() as queue:
+            queue.submit(box, self.path("box.brep"))
+            box.move(Location((10, 0, 0)))
+        self.assertEqual(box.bounding_box().min.X, 10)
+        exported = import_brep(self.path("box.brep"))
+        self.assertAlmostEqual(exported.bounding_box().min.X, 0, 5)
+
+    def test_shutdown(self):
+        queue = ExportQueue()
+        queue.shutdown()
+        with self.assertRaises(RuntimeError):
+            queue.submit(Solid.make_box(1, 1, 1), self.path("box.step"))
+        self.assertEqual(queue.jobs, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
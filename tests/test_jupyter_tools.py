@@ -0,0 +1,141 @@
+"""
+
+build123d jupyter tools tests
+
+name: test_jupyter_tools.py
+by:   Gumyr
+date: October 19th 2026
+
+desc: Unit tests for the build123d notebook display payloads
+
+license:
+
+    Copyright 2023 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+import copy
+import unittest
+from base64 import b64decode
+
+import numpy as np
+from build123d import *
+from build123d.jupyter_tools import (
+    DEFAULT_COLOR,
+    TYPED_ARRAYS,
+    display,
+    to_mesh_payload,
+)
+from build123d.topology import Shape, tessellation_cache
+
+DTYPES = {name: dtype for dtype, name in TYPED_ARRAYS.items()}
+
+
+def decode(data: str, type_name: str) -> np.ndarray:
+    return np.frombuffer(b64decode(data), dtype=DTYPES[type_name].newbyteorder("<"))
+
+
+def mesh_arrays(mesh: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The dequantized vertices, triangles and normals of a payload mesh"""
+    vertices = decode(mesh["vertices"], mesh["vertex_type"]).reshape(-1, 3)
+    normals = decode(mesh["normals"], mesh["normal_type"]).reshape(-1, 3)
+    if mesh["normal_type"] == "Int8Array":
+        normals = normals / 127
+    return (
+        vertices * mesh["scale"] + mesh["offset"],
+        decode(mesh["triangles"], mesh["index_type"]).reshape(-1, 3),
+        normals,
+    )
+
+
+class TestMeshPayload(unittest.TestCase):
+    def setUp(self):
+        tessellation_cache.clear()
+
+    def test_instances(self):
+        bolt = Solid.make_cylinder(1, 5)
+        bolt.color = Color(1, 0, 0)
+        assembly = Compound(
+            children=[
+                bolt,
+                copy.copy(bolt).move(Location((5, 0, 0))),
+                Solid.make_box(1, 1, 1),
+            ]
+        )
+        payload = to_mesh_payload(assembly)
+        # The two bolts share a TShape so they share a mesh
+        self.assertEqual(len(payload["meshes"]), 2)
+        self.assertEqual([i["mesh"] for i in payload["instances"]], [0, 0, 1])
+
+        red, moved_red, box = payload["instances"]
+        self.assertEqual(red["color"], [1, 0, 0, 1])
+        self.assertEqual(moved_red["color"], [1, 0, 0, 1])
+        self.assertEqual(box["color"], DEFAULT_COLOR)
+        # The matrices are column major
+        matrix = np.array(moved_red["matrix"]).reshape(4, 4).T
+        np.testing.assert_allclose(matrix[:3, 3], (5, 0, 0), atol=1e-9)
+        np.testing.assert_allclose(
+            np.array(red["matrix"]).reshape(4, 4), np.eye(4), atol=1e-9
+        )
+
+    def test_quantization(self):
+        sphere = Solid.make_sphere(10)
+        exact = mesh_arrays(to_mesh_payload(sphere, quantize=False)["meshes"][0])
+        quantized_mesh = to_mesh_payload(sphere)["meshes"][0]
+        self.assertEqual(quantized_mesh["vertex_type"], "Int16Array")
+        self.assertEqual(quantized_mesh["normal_type"], "Int8Array")
+        quantized = mesh_arrays(quantized_mesh)
+
+        np.testing.assert_array_equal(quantized[1], exact[1])
+        # Within half a quantization step, a 65534th of the size
+        vertex_error = np.abs(quantized[0] - exact[0]).max()
+        self.assertLessEqual(vertex_error, quantized_mesh["scale"] / 2 + 1e-6)
+        self.assertLess(vertex_error, 20 / 65534)
+        self.assertLess(np.abs(quantized[2] - exact[2]).max(), 1 / 127)
+
+    def test_level_of_detail(self):
+        sphere = Solid.make_sphere(10)
+        full = to_mesh_payload(sphere, max_triangles=None)
+        full_triangles = len(mesh_arrays(full["meshes"][0])[1])
+        self.assertEqual(full["tolerance"], 1e-3)
+
+        tessellation_cache.clear()
+        reduced = to_mesh_payload(sphere, max_triangles=full_triangles // 10)
+        reduced_triangles = len(mesh_arrays(reduced["meshes"][0])[1])
+        self.assertLess(reduced_triangles, full_triangles // 5)
+        self.assertGreater(reduced["tolerance"], 1e-3)
+        # Neither the shape nor the cache hold the full detail mesh
+        self.assertFalse(Shape._is_triangulated(sphere.wrapped))
+        self.assertEqual(len(tessellation_cache), 0)
+
+        # Meshes within the budget are cached for the next display
+        to_mesh_payload(sphere, max_triangles=None)
+        self.assertEqual(len(tessellation_cache), 1)
+        to_mesh_payload(sphere, max_triangles=None)
+        self.assertEqual(tessellation_cache.hits, 1)
+
+    def test_display(self):
+        box = Solid.make_box(1, 1, 1)
+        self.assertIn('"instances"', display(box).data)
+        self.assertIn("VTKFile", display([box], binary=False).data)
+        for binary in [True, False]:
+            with self.subTest(binary=binary):
+                with self.assertRaises(ValueError):
+                    display(5, binary=binary)
+                with self.assertRaises(ValueError):
+                    display([box, 5], binary=binary)
+
+
+if __name__ == "__main__":
+    unittest.main()